@@ -20,7 +20,13 @@ Usage:
 """
 
 from .base_factory import BaseFactory
+from .json_codec import JsonCodec, get_codec
+from .request_metrics import RequestMetrics, request_metrics
+from .rate_limiter import AdaptiveRateLimiter, rate_limiter
+from .client_registry import ClientRegistry, client_registry
 from .config import Config
+from .unique_ids import UniqueIdGenerator, unique_ids, next_unique_id
+from .seeding import derive_seed
 from .helpers import (
     generate_unique_name,
     generate_unique_email,
@@ -35,17 +41,47 @@ from .helpers import (
 
 # Import factory classes
 from .user_factory import UserFactory
+from .item_payloads import ItemPayloads
+from .specs import ItemSpec, UserSpec
+from .item_batch import ItemBatch
+from .dataset_cache import DatasetCache, dataset_cache
+from .item_validator import ItemValidationError, validate_item, validate_items, check_item
 from .item_factory import ItemFactory
 from .cleanup_factory import CleanupFactory
+from .bulk_factory import BulkFactory
+from .process_seeder import ProcessPoolSeeder
+from .cleanup_queue import CleanupQueue
+from .cleanup_ledger import CleanupLedger, cleanup_ledger, sweep_orphans
+from .item_batcher import ItemBatcher
+from .user_pool import UserPool
+from .token_cache import TokenCache, token_cache
+
+# Async factory classes (require aiohttp at instantiation time)
+from .async_base_factory import AsyncBaseFactory
+from .async_user_factory import AsyncUserFactory
+from .async_item_factory import AsyncItemFactory
+from .async_cleanup_factory import AsyncCleanupFactory
 
 __all__ = [
     # Base classes
     "BaseFactory",
+    "JsonCodec",
+    "get_codec",
+    "RequestMetrics",
+    "request_metrics",
+    "AdaptiveRateLimiter",
+    "rate_limiter",
+    "ClientRegistry",
+    "client_registry",
     "Config",
     
     # Helper functions
     "generate_unique_name",
     "generate_unique_email",
+    "next_unique_id",
+    "UniqueIdGenerator",
+    "unique_ids",
+    "derive_seed",
     "generate_timestamp",
     "validate_object_id",
     "normalize_category",
@@ -56,8 +92,34 @@ __all__ = [
     
     # Factory classes
     "UserFactory",
+    "ItemPayloads",
+    "ItemSpec",
+    "UserSpec",
+    "ItemBatch",
+    "DatasetCache",
+    "dataset_cache",
+    "ItemValidationError",
+    "validate_item",
+    "validate_items",
+    "check_item",
     "ItemFactory",
     "CleanupFactory",
+    "BulkFactory",
+    "ProcessPoolSeeder",
+    "CleanupQueue",
+    "CleanupLedger",
+    "cleanup_ledger",
+    "sweep_orphans",
+    "ItemBatcher",
+    "UserPool",
+    "TokenCache",
+    "token_cache",
+    
+    # Async factory classes
+    "AsyncBaseFactory",
+    "AsyncUserFactory",
+    "AsyncItemFactory",
+    "AsyncCleanupFactory",
 ]
 
 # Note: Pytest fixtures are in pytest_fixtures.py
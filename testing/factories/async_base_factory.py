@@ -0,0 +1,393 @@
+"""
+Async base factory class for test data factories.
+
+Asyncio counterpart of BaseFactory built on aiohttp. Lets seeding jobs keep
+hundreds of requests in flight on a single event loop, bounded by a
+configurable concurrency limit. Like BaseFactory, factories can be
+pickled for worker processes; the session is rebuilt on the other side.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+import uuid
+from typing import Optional, Dict, Any, Type, Union, Callable, Awaitable
+
+import requests
+
+from .base_factory import IDEMPOTENCY_KEY_HEADER
+from .client_registry import IDEMPOTENT_METHODS, RETRY_STATUS_CODES, RETRY_BACKOFF_FACTOR
+from .config import Config
+from .json_codec import get_codec, JsonBody
+from .request_metrics import request_metrics
+from .rate_limiter import rate_limiter
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional, only needed for async factories
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# True, or a check (sync or async) run after an ambiguous failure that
+# returns True when the request was not applied and may be resent
+AsyncRetryCheck = Union[bool, Callable[[], Union[bool, Awaitable[bool]]]]
+
+
+class AsyncResponse:
+    """
+    Fully-read HTTP response.
+
+    Mirrors the parts of requests.Response used by the factories
+    (status_code, text, json(), raise_for_status()) so sync and async
+    code paths handle responses the same way.
+    """
+
+    def __init__(self, method: str, url: str, status_code: int, headers: Dict[str, str], content: bytes):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Decode response body as JSON."""
+        return get_codec().decode(self.content)
+
+    def raise_for_status(self):
+        """
+        Raise requests.HTTPError for 4xx/5xx responses.
+
+        Uses the same exception type as the sync factories so callers can
+        handle both with a single except clause.
+        """
+        if self.status_code >= 400:
+            raise requests.HTTPError(
+                f"{self.status_code} Error for {self.method} {self.url}",
+                response=self
+            )
+
+
+class AsyncBaseFactory:
+    """Async base factory class with common utilities."""
+
+    # Attributes bound to this process and event loop, dropped when pickling
+    _UNPICKLED_ATTRIBUTES = ("session", "_semaphore", "codec")
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ):
+        """
+        Initialize async base factory.
+
+        The aiohttp session is created lazily on first request, because it
+        must be bound to a running event loop.
+
+        Args:
+            base_url: Optional base URL override (default: from Config)
+            timeout: Optional timeout override (default: from Config)
+            concurrency: Max requests in flight (default: Config.ASYNC_CONCURRENCY)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for async factories. "
+                "Install it with 'pip install aiohttp'"
+            )
+
+        self.base_url = base_url or Config.API_BASE_URL
+        self.timeout = timeout or Config.REQUEST_TIMEOUT
+        self.concurrency = concurrency or Config.ASYNC_CONCURRENCY
+        self.codec = get_codec()
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pid = os.getpid()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in self._UNPICKLED_ATTRIBUTES:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.codec = get_codec()
+        self._after_fork()
+
+    def _after_fork(self) -> None:
+        """Forget the parent process's session (without closing its sockets)."""
+        self.session = None
+        self._semaphore = None
+        self._pid = os.getpid()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _create_session(self) -> "aiohttp.ClientSession":
+        """
+        Create aiohttp session with a connection pool sized to the concurrency limit.
+
+        Returns:
+            Configured aiohttp.ClientSession
+        """
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the aiohttp session, creating it on first use (and again in a forked child)."""
+        if self._pid != os.getpid():
+            self._after_fork()
+        if self.session is None or self.session.closed:
+            self.session = self._create_session()
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self.session
+
+    def _get_url(self, endpoint: str) -> str:
+        """Build full URL for an endpoint relative to this factory's base URL."""
+        return f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        json_data: Optional[Union[Dict[str, Any], JsonBody]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        raise_for_status: bool = True,
+        safe_to_retry: AsyncRetryCheck = False
+    ) -> AsyncResponse:
+        """
+        Make HTTP request with retries and error handling.
+
+        Retries connection errors and 5xx responses up to
+        Config.MAX_RETRIES times with exponential backoff, like the sync
+        session's urllib3 retry strategy. Non-idempotent requests (POST)
+        carry an Idempotency-Key header and are resent only if
+        safe_to_retry is True or its check confirms the request was not
+        applied. Requests are paced by the shared adaptive rate limiter; a
+        429 is retried after the server's Retry-After (or rate-limit reset
+        header) if within Config.RATE_LIMIT_MAX_WAIT, or with exponential
+        backoff when the response has no such header.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH)
+            endpoint: API endpoint path
+            headers: Optional request headers
+            json_data: Optional JSON request body; bytes or str bodies are
+                       sent as already-encoded JSON
+            params: Optional query parameters
+            raise_for_status: Whether to raise exception on HTTP error (default: True)
+            safe_to_retry: For non-idempotent methods: True if resending is
+                           harmless, or a check (may be async) returning True
+                           when the failed request was not applied (default: False)
+
+        Returns:
+            AsyncResponse object
+
+        Raises:
+            requests.HTTPError: If raise_for_status=True and HTTP error occurred
+            aiohttp.ClientError: For connection errors after all retries
+        """
+        url = self._get_url(endpoint)
+
+        # Default headers (on a copy: the caller may reuse its dict for other requests)
+        request_headers = dict(headers or {})
+        if "Content-Type" not in request_headers:
+            request_headers["Content-Type"] = "application/json"
+        if method not in IDEMPOTENT_METHODS and IDEMPOTENCY_KEY_HEADER not in request_headers:
+            request_headers[IDEMPOTENCY_KEY_HEADER] = uuid.uuid4().hex
+
+        body = self.codec.encode_body(json_data)
+        session = self._get_session()
+
+        attempt = 0
+        start = time.perf_counter()
+        while True:
+            delay = rate_limiter.reserve(endpoint)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                logger.debug(f"Making {method} request to {url}")
+
+                # Only the request holds a slot; backoff and dedupe checks do not
+                async with self._semaphore:
+                    async with session.request(
+                        method,
+                        url,
+                        headers=request_headers,
+                        data=body,
+                        params=params
+                    ) as resp:
+                        content = await resp.read()
+                        response = AsyncResponse(method, url, resp.status, dict(resp.headers), content)
+                        retry_after = rate_limiter.on_response(endpoint, resp.status, resp.headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Nothing was sent if the connection could not be opened
+                unsent = isinstance(e, aiohttp.ClientConnectorError)
+                if not await self._can_resend(
+                    method, endpoint, True if unsent else safe_to_retry, attempt, str(e) or type(e).__name__
+                ):
+                    logger.error(f"Request error: {str(e)}")
+                    request_metrics.record(
+                        method, endpoint, time.perf_counter() - start,
+                        retries=attempt, bytes_sent=len(body or b"")
+                    )
+                    raise
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
+                attempt += 1
+                continue
+
+            if attempt < Config.MAX_RETRIES:
+                if response.status_code in RETRY_STATUS_CODES and await self._can_resend(
+                    method, endpoint, safe_to_retry, attempt, f"HTTP {response.status_code}"
+                ):
+                    await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
+                    attempt += 1
+                    continue
+                if response.status_code == 429:
+                    # The limiter pauses the endpoint class until Retry-After
+                    if retry_after is None:
+                        await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
+                        attempt += 1
+                        continue
+                    if retry_after <= Config.RATE_LIMIT_MAX_WAIT:
+                        attempt += 1
+                        continue
+
+            break
+
+        request_metrics.record(
+            method,
+            endpoint,
+            time.perf_counter() - start,
+            status=response.status_code,
+            retries=attempt,
+            bytes_sent=len(body or b""),
+            bytes_received=len(response.content)
+        )
+
+        logger.debug(f"Response status: {response.status_code}")
+
+        if raise_for_status and response.status_code >= 400:
+            logger.error(f"HTTP error {response.status_code}: {response.text}")
+            response.raise_for_status()
+
+        return response
+
+    @staticmethod
+    async def _can_resend(
+        method: str,
+        endpoint: str,
+        safe_to_retry: AsyncRetryCheck,
+        attempt: int,
+        reason: str
+    ) -> bool:
+        """Whether a request may be resent after a 5xx or connection error."""
+        if attempt >= Config.MAX_RETRIES:
+            return False
+        if method in IDEMPOTENT_METHODS:
+            return True
+
+        if callable(safe_to_retry):
+            try:
+                safe_to_retry = safe_to_retry()
+                if inspect.isawaitable(safe_to_retry):
+                    safe_to_retry = await safe_to_retry
+            except Exception as e:
+                logger.warning(f"Could not check whether {method} {endpoint} was applied: {e}")
+                return False
+
+        if safe_to_retry:
+            logger.warning(f"{method} {endpoint} failed ({reason}) and was not applied; resending")
+        return bool(safe_to_retry)
+
+    @staticmethod
+    def metrics() -> Dict[str, Dict[str, Any]]:
+        """Snapshot of request metrics recorded by all factories (see BaseFactory.metrics)."""
+        return request_metrics.snapshot()
+
+    def _handle_response(
+        self,
+        response: AsyncResponse,
+        expected_status: int = 200,
+        response_type: Optional[Type] = None
+    ) -> Any:
+        """
+        Handle API response and extract JSON data.
+
+        Args:
+            response: AsyncResponse object
+            expected_status: Expected HTTP status code (default: 200)
+            response_type: Optional type to decode the body into
+                           (see JsonCodec.decode)
+
+        Returns:
+            Response JSON data as dictionary (or response_type instance)
+
+        Raises:
+            ValueError: If response status doesn't match expected or body is not valid JSON
+        """
+        if response.status_code != expected_status:
+            raise ValueError(
+                f"Expected status {expected_status}, got {response.status_code}. "
+                f"Response: {response.text}"
+            )
+
+        try:
+            return self.codec.decode(response.content, response_type)
+        except ValueError as e:
+            logger.error(f"Failed to decode JSON response: {response.text}")
+            raise ValueError(f"Invalid JSON response: {str(e)}")
+
+    async def get(self, endpoint: str, headers: Optional[Dict[str, str]] = None,
+                  params: Optional[Dict[str, Any]] = None) -> AsyncResponse:
+        """Make GET request."""
+        return await self._make_request("GET", endpoint, headers=headers, params=params)
+
+    async def post(self, endpoint: str, json_data: Optional[Union[Dict[str, Any], JsonBody]] = None,
+                   headers: Optional[Dict[str, str]] = None, safe_to_retry: AsyncRetryCheck = False) -> AsyncResponse:
+        """Make POST request (resent after a failure only as safe_to_retry allows)."""
+        return await self._make_request(
+            "POST", endpoint, headers=headers, json_data=json_data, safe_to_retry=safe_to_retry
+        )
+
+    async def put(self, endpoint: str, json_data: Optional[Union[Dict[str, Any], JsonBody]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> AsyncResponse:
+        """Make PUT request."""
+        return await self._make_request("PUT", endpoint, headers=headers, json_data=json_data)
+
+    async def delete(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> AsyncResponse:
+        """Make DELETE request."""
+        return await self._make_request("DELETE", endpoint, headers=headers)
+
+    async def patch(self, endpoint: str, json_data: Optional[Union[Dict[str, Any], JsonBody]] = None,
+                    headers: Optional[Dict[str, str]] = None) -> AsyncResponse:
+        """Make PATCH request."""
+        return await self._make_request("PATCH", endpoint, headers=headers, json_data=json_data)
+
+    async def close(self):
+        """Close HTTP session."""
+        if self._pid != os.getpid():
+            self._after_fork()
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
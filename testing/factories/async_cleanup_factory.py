@@ -0,0 +1,164 @@
+"""
+Async Cleanup Factory for managing test data cleanup.
+
+Asyncio counterpart of CleanupFactory. Returns the same result dicts.
+"""
+
+import logging
+from typing import Dict, Any
+
+from .async_base_factory import AsyncBaseFactory
+from .config import Config
+from .helpers import validate_object_id
+from .cleanup_ledger import cleanup_ledger
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCleanupFactory(AsyncBaseFactory):
+    """Async factory for cleaning up test data."""
+
+    async def cleanup_user_data(
+        self,
+        user_id: str,
+        include_otp: bool = True,
+        include_activity_logs: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Hard delete all data for a specific user while preserving user record.
+
+        See CleanupFactory.cleanup_user_data for what is deleted.
+
+        Args:
+            user_id: User ID (ObjectId format, 24 hex chars)
+            include_otp: Whether to delete OTPs (default: True)
+            include_activity_logs: Whether to delete activity logs (default: True)
+
+        Returns:
+            Dictionary with cleanup results
+
+        Raises:
+            ValueError: If user_id is invalid format
+            requests.HTTPError: If cleanup fails
+        """
+        if not validate_object_id(user_id):
+            raise ValueError(
+                f"Invalid user ID format: {user_id}. "
+                "Expected 24-character hexadecimal string."
+            )
+
+        logger.info(f"Cleaning up all data for user: {user_id}")
+
+        headers = Config.get_internal_headers()
+        endpoint = (
+            f"/internal/users/{user_id}/data"
+            f"?include_otp={str(include_otp).lower()}"
+            f"&include_activity_logs={str(include_activity_logs).lower()}"
+        )
+
+        response = await self.delete(endpoint, headers=headers)
+        result = response.json()
+
+        logger.info(
+            f"Cleanup completed for user {user_id}: "
+            f"{result.get('deleted', {})}"
+        )
+
+        cleanup_ledger.resolve("user", user_id)
+
+        return result
+
+    async def cleanup_user_items(self, user_id: str) -> Dict[str, Any]:
+        """
+        Hard delete only items for a specific user (preserves BulkJobs, ActivityLogs, OTPs).
+
+        Args:
+            user_id: User ID (ObjectId format)
+
+        Returns:
+            Dictionary with cleanup results
+
+        Raises:
+            ValueError: If user_id is invalid format
+            requests.HTTPError: If cleanup fails
+        """
+        if not validate_object_id(user_id):
+            raise ValueError(
+                f"Invalid user ID format: {user_id}. "
+                "Expected 24-character hexadecimal string."
+            )
+
+        logger.info(f"Cleaning up items for user: {user_id}")
+
+        headers = Config.get_internal_headers()
+        response = await self.delete(f"/internal/users/{user_id}/items", headers=headers)
+        result = response.json()
+
+        logger.info(
+            f"Items cleanup completed for user {user_id}: "
+            f"{result.get('deleted', {})}"
+        )
+
+        cleanup_ledger.resolve("user_items", user_id)
+
+        return result
+
+    async def cleanup_single_item(self, item_id: str) -> Dict[str, Any]:
+        """
+        Hard delete a single item by ID (removes from MongoDB).
+
+        Args:
+            item_id: Item ID (ObjectId format)
+
+        Returns:
+            Dictionary with cleanup results
+
+        Raises:
+            ValueError: If item_id is invalid format
+            requests.HTTPError: If cleanup fails
+        """
+        if not validate_object_id(item_id):
+            raise ValueError(
+                f"Invalid item ID format: {item_id}. "
+                "Expected 24-character hexadecimal string."
+            )
+
+        logger.info(f"Hard deleting item: {item_id}")
+
+        headers = Config.get_internal_headers()
+        response = await self.delete(f"/internal/items/{item_id}/permanent", headers=headers)
+        result = response.json()
+
+        logger.info(f"Item {item_id} deleted successfully")
+
+        cleanup_ledger.resolve("item", item_id)
+
+        return result
+
+    async def reset_database(self) -> Dict[str, Any]:
+        """
+        Reset entire database (wipe all data).
+
+        Warning: This deletes ALL data including admin users!
+
+        Returns:
+            Dictionary with reset result
+
+        Raises:
+            requests.HTTPError: If reset fails
+        """
+        logger.warning("Resetting entire database - ALL DATA WILL BE DELETED")
+
+        headers = Config.get_internal_headers()
+        response = await self.post("/internal/reset", headers=headers, safe_to_retry=True)
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to reset database: {response.text}")
+
+        result = response.json()
+
+        logger.info("Database reset completed successfully")
+
+        cleanup_ledger.resolve_all()
+
+        return result
@@ -0,0 +1,258 @@
+"""
+Async Item Factory for creating test items.
+
+Asyncio counterpart of ItemFactory. Payload builders come from
+ItemPayloads, shared with the sync factory; only the API calls are
+coroutines.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional, Dict, Any, List, Union
+
+from .async_base_factory import AsyncBaseFactory
+from .config import Config
+from .cleanup_ledger import cleanup_ledger
+from .helpers import validate_object_id
+from .item_factory import _as_dict, _exists_query, _record_existing, _seed_done
+from .item_payloads import ItemPayloads
+from .item_validator import check_item
+from .specs import ItemSpec
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncItemFactory(ItemPayloads, AsyncBaseFactory):
+    """Async factory for creating test items (payload builders come from ItemPayloads)."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize AsyncItemFactory.
+
+        Args:
+            base_url: Optional base URL override
+            timeout: Optional timeout override
+            concurrency: Max requests in flight (default: Config.ASYNC_CONCURRENCY)
+            seed: Optional payload seed (default: derived from Config.SEED)
+        """
+        AsyncBaseFactory.__init__(self, base_url, timeout, concurrency)
+        ItemPayloads.__init__(self, seed)
+
+    async def create_item_via_api(
+        self,
+        item_data: Union[Dict[str, Any], ItemSpec],
+        token: str,
+        validate: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Create item via API endpoint.
+
+        After a 5xx or dropped connection the item is resent only if
+        POST /items/check-exists shows it was not created; if it was, the
+        created item is fetched and returned instead of a duplicate.
+
+        Args:
+            item_data: Item data dictionary or ItemSpec
+            token: JWT access token
+            validate: Check the payload client-side before sending
+                      (default: Config.ITEM_PREFLIGHT_VALIDATION)
+
+        Returns:
+            API response with created item
+
+        Raises:
+            ItemValidationError: If pre-flight validation rejects the item
+            requests.HTTPError: If creation fails
+            ValueError: If response is invalid
+        """
+        if Config.ITEM_PREFLIGHT_VALIDATION if validate is None else validate:
+            check_item(_as_dict(item_data))
+
+        headers = Config.get_auth_headers(token)
+        found: Dict[int, str] = {}
+
+        # Same check as ItemFactory._not_yet_created, awaited
+        async def not_yet_created() -> bool:
+            response = await self.post(
+                "/items/check-exists",
+                json_data=_exists_query([item_data]),
+                headers=headers,
+                safe_to_retry=True
+            )
+            return _record_existing(self._handle_response(response, expected_status=200).get("results", []), found)
+
+        try:
+            response = await self.post("/items", json_data=item_data, headers=headers, safe_to_retry=not_yet_created)
+        except Exception:
+            if not found:
+                raise
+            # The failed attempt was applied; use the item it created
+            logger.warning(f"Create request failed after creating item {found[0]}; using it")
+            cleanup_ledger.record_item(found[0], token)
+            response = await self.get(f"/items/{found[0]}", headers=headers)
+            return self._handle_response(response, expected_status=200).get("data", {})
+
+        if response.status_code != 201:
+            raise ValueError(f"Failed to create item: {response.text}")
+
+        result = self.codec.decode(response.content)
+        created_item = result.get("data", {})
+
+        if created_item.get("_id"):
+            cleanup_ledger.record_item(created_item["_id"], token)
+
+        return created_item
+
+    async def create_items_via_api(
+        self,
+        items: List[Dict[str, Any]],
+        token: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many items concurrently via API endpoint.
+
+        Requests run in parallel up to the factory's concurrency limit.
+
+        Args:
+            items: List of item data dictionaries
+            token: JWT access token
+
+        Returns:
+            List of created items, in the same order as items
+        """
+        return await asyncio.gather(
+            *(self.create_item_via_api(item_data, token) for item_data in items)
+        )
+
+    async def seed_items(self, user_id: str, count: int = 10) -> Dict[str, Any]:
+        """
+        Insert items for a user directly in the database via POST /internal/seed.
+
+        The items are not tagged "seed"; wait for them with
+        wait_for_item_count(), not wait_until_seeded().
+
+        Args:
+            user_id: Owner user ID (ObjectId format)
+            count: Number of items to insert (default: 10)
+
+        Returns:
+            Dictionary with seed result ({"message", "count"})
+
+        Raises:
+            ValueError: If user_id is invalid or response is invalid
+            requests.HTTPError: If seeding fails
+        """
+        if not validate_object_id(user_id):
+            raise ValueError(
+                f"Invalid user ID format: {user_id}. "
+                "Expected 24-character hexadecimal string."
+            )
+
+        logger.info(f"Seeding {count} items for user: {user_id}")
+
+        headers = Config.get_internal_headers()
+        response = await self.post(
+            "/internal/seed",
+            json_data={"userId": user_id, "count": count},
+            headers=headers
+        )
+
+        result = self._handle_response(response, expected_status=201)
+        cleanup_ledger.record("user_items", user_id)
+
+        return result.get("data", {})
+
+    async def get_seed_status(
+        self,
+        user_id: str,
+        token: str,
+        seed_version: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get seed status for a user via GET /items/seed-status/:userId."""
+        headers = Config.get_auth_headers(token)
+        params = {"seed_version": seed_version} if seed_version else None
+        response = await self.get(f"/items/seed-status/{user_id}", headers=headers, params=params)
+
+        return self._handle_response(response, expected_status=200)
+
+    async def wait_until_seeded(
+        self,
+        user_id: str,
+        token: str,
+        timeout: Optional[float] = None,
+        min_items: Optional[int] = None,
+        seed_version: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Poll seed status with exponential backoff until seeding is complete.
+
+        See ItemFactory.wait_until_seeded.
+
+        Raises:
+            TimeoutError: If seeding is not complete within timeout
+        """
+        timeout = Config.SEED_WAIT_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        interval = Config.SEED_POLL_INTERVAL
+
+        while True:
+            status = await self.get_seed_status(user_id, token, seed_version)
+            if _seed_done(status, min_items):
+                return status
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Seeding not complete for user {user_id} after {timeout}s: "
+                    f"{status.get('total_items')}/{min_items or status.get('required_count')} items"
+                )
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, Config.SEED_POLL_MAX_INTERVAL)
+
+    async def get_item_count(self, token: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count items via GET /items/count. See ItemFactory.get_item_count."""
+        params = {key: value for key, value in (filters or {}).items() if value is not None}
+        headers = Config.get_auth_headers(token)
+        response = await self.get("/items/count", headers=headers, params=params or None)
+
+        return self._handle_response(response, expected_status=200).get("count", 0)
+
+    async def wait_for_item_count(
+        self,
+        token: str,
+        min_items: int,
+        timeout: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Poll the item count with exponential backoff until it reaches min_items.
+
+        See ItemFactory.wait_for_item_count.
+
+        Raises:
+            TimeoutError: If the count stays below min_items within timeout
+        """
+        filters = {"status": "active"} if filters is None else filters
+        timeout = Config.SEED_WAIT_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        interval = Config.SEED_POLL_INTERVAL
+
+        while True:
+            count = await self.get_item_count(token, filters)
+            if count >= min_items:
+                return count
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Item count still {count}/{min_items} after {timeout}s")
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, Config.SEED_POLL_MAX_INTERVAL)
@@ -0,0 +1,264 @@
+"""
+Async User Factory for creating test users and managing authentication.
+
+Asyncio counterpart of UserFactory. Returns the same dict shapes, so many
+signups can run concurrently on one event loop.
+"""
+
+import logging
+from typing import Optional, Dict, Any
+
+from .async_base_factory import AsyncBaseFactory
+from .config import Config
+from .token_cache import token_cache
+from .cleanup_ledger import cleanup_ledger
+from .helpers import (
+    generate_unique_email,
+    generate_valid_password
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncUserFactory(AsyncBaseFactory):
+    """Async factory for creating and managing test users."""
+
+    async def create_user(
+        self,
+        first_name: str = "Test",
+        last_name: str = "User",
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        role: str = "EDITOR"
+    ) -> Dict[str, Any]:
+        """
+        Create a new user via signup endpoint.
+
+        Args:
+            first_name: User's first name (default: "Test")
+            last_name: User's last name (default: "User")
+            email: User's email (default: auto-generated unique email)
+            password: User's password (default: auto-generated valid password)
+            role: User's role - ADMIN, EDITOR, or VIEWER (default: "EDITOR")
+
+        Returns:
+            Dictionary with user data including _id, email, role, etc.
+
+        Raises:
+            requests.HTTPError: If signup fails
+            ValueError: If response is invalid
+        """
+        # Generate unique email if not provided
+        if email is None:
+            email = generate_unique_email()
+
+        # Generate valid password if not provided
+        if password is None:
+            password = generate_valid_password()
+
+        # Validate role
+        if role not in ["ADMIN", "EDITOR", "VIEWER"]:
+            raise ValueError(f"Invalid role: {role}. Must be ADMIN, EDITOR, or VIEWER")
+
+        logger.info(f"Creating user: {email} with role: {role}")
+
+        # Step 1: Request OTP
+        otp_response = await self.post(
+            "/auth/signup/request-otp",
+            json_data={"email": email}
+        )
+
+        if otp_response.status_code != 200:
+            raise ValueError(f"Failed to request OTP: {otp_response.text}")
+
+        otp_data = otp_response.json()
+
+        # Step 2: Get OTP from internal endpoint (for automation)
+        try:
+            otp = await self._get_otp_from_internal(email)
+        except Exception as e:
+            logger.warning(f"Could not get OTP from internal endpoint: {e}")
+            # In development mode, OTP might be in response
+            otp = otp_data.get("otp")
+            if not otp:
+                raise ValueError("Could not retrieve OTP for signup")
+
+        # Step 3: Verify OTP
+        verify_response = await self.post(
+            "/auth/signup/verify-otp",
+            json_data={"email": email, "otp": otp}
+        )
+
+        if verify_response.status_code != 200:
+            raise ValueError(f"Failed to verify OTP: {verify_response.text}")
+
+        # Step 4: Signup
+        signup_data = {
+            "firstName": first_name,
+            "lastName": last_name,
+            "email": email,
+            "password": password,
+            "otp": otp,
+            "role": role
+        }
+
+        existing: Dict[str, Any] = {}
+
+        async def not_yet_signed_up() -> bool:
+            response = await self._make_request(
+                "POST",
+                "/auth/login",
+                json_data={"email": email, "password": password},
+                raise_for_status=False,
+                safe_to_retry=True
+            )
+            if response.status_code == 200:
+                existing.update(response.json())
+                return False
+            return response.status_code == 401
+
+        try:
+            signup_response = await self.post("/auth/signup", json_data=signup_data, safe_to_retry=not_yet_signed_up)
+        except Exception:
+            if not existing:
+                raise
+            # The failed attempt was applied; the account exists
+            logger.warning(f"Signup request failed after creating user {email}; using it")
+            signup_result = existing
+        else:
+            if signup_response.status_code != 201:
+                raise ValueError(f"Failed to create user: {signup_response.text}")
+
+            signup_result = signup_response.json()
+        user_data = signup_result.get("user", {})
+
+        # Add password to user data for later use
+        user_data["password"] = password
+
+        if user_data.get("_id"):
+            cleanup_ledger.record("user", user_data["_id"])
+
+        logger.info(f"User created successfully: {user_data.get('_id')}")
+        return user_data
+
+    async def create_admin(self, first_name: str = "Admin", last_name: str = "User",
+                           email: Optional[str] = None, password: Optional[str] = None) -> Dict[str, Any]:
+        """Create an admin user."""
+        return await self.create_user(first_name, last_name, email, password, role="ADMIN")
+
+    async def create_editor(self, first_name: str = "Editor", last_name: str = "User",
+                            email: Optional[str] = None, password: Optional[str] = None) -> Dict[str, Any]:
+        """Create an editor user."""
+        return await self.create_user(first_name, last_name, email, password, role="EDITOR")
+
+    async def create_viewer(self, first_name: str = "Viewer", last_name: str = "User",
+                            email: Optional[str] = None, password: Optional[str] = None) -> Dict[str, Any]:
+        """Create a viewer user."""
+        return await self.create_user(first_name, last_name, email, password, role="VIEWER")
+
+    async def login(
+        self,
+        email: str,
+        password: str,
+        remember_me: bool = False,
+        use_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Login user and get access token.
+
+        With use_cache=True, results come from the process-wide token cache
+        shared with UserFactory.login, and concurrent logins for the same
+        account share one request. By default every call hits /auth/login.
+
+        Args:
+            email: User's email
+            password: User's password
+            remember_me: Whether to remember user (default: False)
+            use_cache: Whether to use the token cache (default: False)
+
+        Returns:
+            Dictionary with token and user data
+
+        Raises:
+            requests.HTTPError: If login fails
+            ValueError: If response is invalid
+        """
+        if use_cache and Config.TOKEN_CACHE_ENABLED:
+            return await token_cache.get_or_login_async(
+                email,
+                password,
+                lambda: self._login_request(email, password, remember_me),
+                remember_me=remember_me
+            )
+
+        return await self._login_request(email, password, remember_me)
+
+    async def _login_request(self, email: str, password: str, remember_me: bool) -> Dict[str, Any]:
+        """Call /auth/login and return token and user data."""
+        logger.info(f"Logging in user: {email}")
+
+        login_data = {
+            "email": email,
+            "password": password,
+            "rememberMe": remember_me
+        }
+
+        response = await self.post("/auth/login", json_data=login_data, safe_to_retry=True)
+
+        if response.status_code != 200:
+            raise ValueError(f"Login failed: {response.text}")
+
+        result = response.json()
+
+        logger.info(f"Login successful for user: {email}")
+        return result
+
+    async def get_user_info(self, token: str) -> Dict[str, Any]:
+        """
+        Get current user info via /auth/me endpoint.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            Dictionary with user data
+        """
+        headers = Config.get_auth_headers(token)
+        response = await self.get("/auth/me", headers=headers)
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to get user info: {response.text}")
+
+        result = response.json()
+        return result.get("data", {})
+
+    async def _get_otp_from_internal(self, email: str) -> str:
+        """
+        Get OTP from internal endpoint (for automation).
+
+        Args:
+            email: User's email
+
+        Returns:
+            OTP string (6 digits)
+
+        Raises:
+            requests.HTTPError: If request fails
+            ValueError: If OTP not found
+        """
+        headers = Config.get_internal_headers()
+        params = {"email": email}
+
+        response = await self.get("/internal/otp", headers=headers, params=params)
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to get OTP from internal endpoint: {response.text}")
+
+        result = response.json()
+        otp_data = result.get("data", {})
+        otp = otp_data.get("otp")
+
+        if not otp:
+            raise ValueError(f"No OTP found for email: {email}")
+
+        return otp
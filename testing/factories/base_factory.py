@@ -2,29 +2,46 @@
 Base factory class for test data factories.
 
 Provides common functionality for HTTP client setup, error handling,
-and logging used by all factory classes.
+and logging used by all factory classes. Logging is left to the
+application (pytest, a seeding script) to configure.
+
+Factories can be pickled and sent to worker processes: the HTTP session
+and other process-bound state are dropped and rebuilt on the other side.
 """
 
 import logging
+import os
+import time
+import uuid
 import requests
-from typing import Optional, Dict, Any
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Type, Union, Callable, Iterable, List, TypeVar
 
+from .client_registry import client_registry, IDEMPOTENT_METHODS, RETRY_STATUS_CODES, RETRY_BACKOFF_FACTOR
 from .config import Config
+from .json_codec import get_codec, JsonBody
+from .request_metrics import request_metrics
+from .rate_limiter import rate_limiter
 
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# True, or a check run after an ambiguous failure that returns True when the
+# request was not applied and may be resent
+RetryCheck = Union[bool, Callable[[], bool]]
+
 
 class BaseFactory:
     """Base factory class with common utilities."""
     
+    # Attributes bound to this process, dropped when pickling
+    _UNPICKLED_ATTRIBUTES = ("_session", "codec")
+    
     def __init__(self, base_url: Optional[str] = None, timeout: Optional[int] = None):
         """
         Initialize base factory.
@@ -35,50 +52,84 @@ class BaseFactory:
         """
         self.base_url = base_url or Config.API_BASE_URL
         self.timeout = timeout or Config.REQUEST_TIMEOUT
-        self.session = self._create_session()
+        self.codec = get_codec()
+        self._session: Optional[requests.Session] = None
+        self._pid = os.getpid()
     
-    def _create_session(self) -> requests.Session:
+    @property
+    def session(self) -> requests.Session:
         """
-        Create HTTP session with retry strategy.
+        HTTP session for the calling thread.
         
-        Returns:
-            Configured requests.Session
+        Unless a session was assigned explicitly, this is the thread's
+        session from client_registry, sharing one connection pool with all
+        factories, so a factory can be used from several threads. An
+        assigned session is dropped in a forked child, whose copies of the
+        parent's sockets must not be used.
         """
-        session = requests.Session()
-        
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=Config.MAX_RETRIES,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        return session
+        self._check_pid()
+        if self._session is not None:
+            return self._session
+        return client_registry.session()
+    
+    @session.setter
+    def session(self, session: requests.Session):
+        self._session = session
+        self._pid = os.getpid()
+    
+    def _check_pid(self) -> None:
+        """Drop process-bound state if this object was inherited through fork."""
+        if self._pid != os.getpid():
+            self._after_fork()
+    
+    def _after_fork(self) -> None:
+        """Forget the parent process's session (without closing its sockets)."""
+        self._session = None
+        self._pid = os.getpid()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in self._UNPICKLED_ATTRIBUTES:
+            state.pop(name, None)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.codec = get_codec()
+        self._after_fork()
     
     def _make_request(
         self,
         method: str,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
-        json_data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Union[Dict[str, Any], JsonBody]] = None,
         params: Optional[Dict[str, Any]] = None,
-        raise_for_status: bool = True
+        raise_for_status: bool = True,
+        safe_to_retry: RetryCheck = False
     ) -> requests.Response:
         """
         Make HTTP request with error handling.
         
+        Non-idempotent requests (POST) carry an Idempotency-Key header and
+        are not resent blindly: after a 5xx, timeout or dropped connection
+        they are resent only if safe_to_retry is True or its check confirms
+        the request was not applied. Connection failures before anything
+        was sent are always retried by the session. A 429 is resent up to
+        Config.MAX_RETRIES times, after the server's Retry-After (if within
+        Config.RATE_LIMIT_MAX_WAIT) or with exponential backoff without one.
+        
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, PATCH)
             endpoint: API endpoint path
             headers: Optional request headers
-            json_data: Optional JSON request body
+            json_data: Optional JSON request body; bytes or str bodies are
+                       sent as already-encoded JSON
             params: Optional query parameters
             raise_for_status: Whether to raise exception on HTTP error (default: True)
+            safe_to_retry: For non-idempotent methods: True if resending is
+                           harmless, or a check returning True when the
+                           failed request was not applied (default: False)
             
         Returns:
             requests.Response object
@@ -89,22 +140,62 @@ class BaseFactory:
         """
         url = Config.get_api_url(endpoint)
         
-        # Default headers
-        request_headers = headers or {}
+        # Default headers (on a copy: the caller may reuse its dict for other requests)
+        request_headers = dict(headers or {})
         if "Content-Type" not in request_headers:
             request_headers["Content-Type"] = "application/json"
+        if method not in IDEMPOTENT_METHODS and IDEMPOTENCY_KEY_HEADER not in request_headers:
+            request_headers[IDEMPOTENCY_KEY_HEADER] = uuid.uuid4().hex
+        
+        body = self.codec.encode_body(json_data)
+        response = None
+        retries = 0
+        start = time.perf_counter()
         
         try:
-            logger.debug(f"Making {method} request to {url}")
-            
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=request_headers,
-                json=json_data,
-                params=params,
-                timeout=self.timeout
-            )
+            while True:
+                rate_limiter.acquire(endpoint)
+                logger.debug(f"Making {method} request to {url}")
+                
+                try:
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        headers=request_headers,
+                        data=body,
+                        params=params,
+                        timeout=self.timeout
+                    )
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if not self._can_resend(method, endpoint, safe_to_retry, retries, str(e)):
+                        raise
+                    time.sleep(RETRY_BACKOFF_FACTOR * (2 ** retries))
+                    retries += 1
+                    continue
+                
+                # A 429 was not applied, so any method is resent: after the
+                # server's Retry-After (the limiter pauses the endpoint class),
+                # or with exponential backoff when it sends no such header
+                retry_after = rate_limiter.on_response(endpoint, response.status_code, response.headers)
+                if response.status_code == 429:
+                    if retries >= Config.MAX_RETRIES or (
+                        retry_after is not None and retry_after > Config.RATE_LIMIT_MAX_WAIT
+                    ):
+                        break
+                    if retry_after is None:
+                        retry_after = RETRY_BACKOFF_FACTOR * (2 ** retries)
+                        time.sleep(retry_after)
+                    retries += 1
+                    logger.info(f"Rate limited on {method} {endpoint}; retrying after {retry_after:.1f}s")
+                    continue
+                
+                if response.status_code in RETRY_STATUS_CODES and self._can_resend(
+                    method, endpoint, safe_to_retry, retries, f"HTTP {response.status_code}"
+                ):
+                    time.sleep(RETRY_BACKOFF_FACTOR * (2 ** retries))
+                    retries += 1
+                    continue
+                break
             
             if raise_for_status:
                 response.raise_for_status()
@@ -116,23 +207,91 @@ class BaseFactory:
             logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
             raise
         except requests.RequestException as e:
+            response = None
             logger.error(f"Request error: {str(e)}")
             raise
+        finally:
+            self._record_request(method, endpoint, start, body, response, retries)
+    
+    @staticmethod
+    def _can_resend(method: str, endpoint: str, safe_to_retry: RetryCheck, retries: int, reason: str) -> bool:
+        """Whether a non-idempotent request may be resent after an ambiguous failure."""
+        # The session has already retried idempotent methods
+        if method in IDEMPOTENT_METHODS or retries >= Config.MAX_RETRIES:
+            return False
+        
+        if callable(safe_to_retry):
+            try:
+                safe_to_retry = safe_to_retry()
+            except Exception as e:
+                logger.warning(f"Could not check whether {method} {endpoint} was applied: {e}")
+                return False
+        
+        if safe_to_retry:
+            logger.warning(f"{method} {endpoint} failed ({reason}) and was not applied; resending")
+        return bool(safe_to_retry)
+    
+    @staticmethod
+    def _record_request(
+        method: str,
+        endpoint: str,
+        start: float,
+        body: Optional[bytes],
+        response: Optional[requests.Response],
+        retries: int = 0
+    ) -> None:
+        """Record a finished request in the process-wide request metrics."""
+        if response is None:
+            request_metrics.record(
+                method, endpoint, time.perf_counter() - start, retries=retries, bytes_sent=len(body or b"")
+            )
+            return
+        
+        # urllib3 keeps the retry attempts behind this response in retries.history
+        session_retries = getattr(response.raw, "retries", None)
+        request_metrics.record(
+            method,
+            endpoint,
+            time.perf_counter() - start,
+            status=response.status_code,
+            retries=retries + (len(session_retries.history) if session_retries is not None else 0),
+            bytes_sent=len(body or b""),
+            bytes_received=len(response.content)
+        )
+    
+    @staticmethod
+    def metrics() -> Dict[str, Dict[str, Any]]:
+        """
+        Snapshot of request metrics recorded by all factories in the process.
+        
+        Returns:
+            Dictionary keyed by "<METHOD> <endpoint template>" with request,
+            status, retry, error and byte counts and latency percentiles
+            (see RequestMetrics.snapshot)
+        """
+        return request_metrics.snapshot()
     
-    def _handle_response(self, response: requests.Response, expected_status: int = 200) -> Dict[str, Any]:
+    def _handle_response(
+        self,
+        response: requests.Response,
+        expected_status: int = 200,
+        response_type: Optional[Type] = None
+    ) -> Any:
         """
         Handle API response and extract JSON data.
         
         Args:
             response: requests.Response object
             expected_status: Expected HTTP status code (default: 200)
+            response_type: Optional type to decode the body into
+                           (see JsonCodec.decode)
             
         Returns:
-            Response JSON data as dictionary
+            Response JSON data as dictionary (or response_type instance)
             
         Raises:
-            ValueError: If response status doesn't match expected
-            requests.JSONDecodeError: If response is not valid JSON
+            ValueError: If response status doesn't match expected or
+                        response is not valid JSON
         """
         if response.status_code != expected_status:
             raise ValueError(
@@ -141,8 +300,8 @@ class BaseFactory:
             )
         
         try:
-            return response.json()
-        except requests.JSONDecodeError as e:
+            return self.codec.decode(response.content, response_type)
+        except ValueError as e:
             logger.error(f"Failed to decode JSON response: {response.text}")
             raise ValueError(f"Invalid JSON response: {str(e)}")
     
@@ -151,12 +310,14 @@ class BaseFactory:
         """Make GET request."""
         return self._make_request("GET", endpoint, headers=headers, params=params)
     
-    def post(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None,
-             headers: Optional[Dict[str, str]] = None) -> requests.Response:
-        """Make POST request."""
-        return self._make_request("POST", endpoint, headers=headers, json_data=json_data)
+    def post(self, endpoint: str, json_data: Optional[Union[Dict[str, Any], JsonBody]] = None,
+             headers: Optional[Dict[str, str]] = None, safe_to_retry: RetryCheck = False) -> requests.Response:
+        """Make POST request (resent after a failure only as safe_to_retry allows)."""
+        return self._make_request(
+            "POST", endpoint, headers=headers, json_data=json_data, safe_to_retry=safe_to_retry
+        )
     
-    def put(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None,
+    def put(self, endpoint: str, json_data: Optional[Union[Dict[str, Any], JsonBody]] = None,
             headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """Make PUT request."""
         return self._make_request("PUT", endpoint, headers=headers, json_data=json_data)
@@ -165,12 +326,49 @@ class BaseFactory:
         """Make DELETE request."""
         return self._make_request("DELETE", endpoint, headers=headers)
     
-    def patch(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None,
+    def patch(self, endpoint: str, json_data: Optional[Union[Dict[str, Any], JsonBody]] = None,
               headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """Make PATCH request."""
         return self._make_request("PATCH", endpoint, headers=headers, json_data=json_data)
     
+    def map_concurrent(self, fn: Callable[[T], R], iterable: Iterable[T], workers: Optional[int] = None) -> List[R]:
+        """
+        Apply fn to each element on a thread pool.
+        
+        fn may call this factory's methods: each worker thread gets its own
+        session over the shared connection pool. At most 2 * workers
+        elements are in flight, so iterable may be a long generator.
+        
+        Args:
+            fn: Function called with each element
+            iterable: Elements to process
+            workers: Concurrent threads (default: Config.HTTP_POOL_MAXSIZE,
+                     the connections kept per host)
+            
+        Returns:
+            Results in input order
+            
+        Raises:
+            Exception: The first error raised by fn, in input order (elements
+                       not yet submitted are skipped)
+        """
+        workers = workers or Config.HTTP_POOL_MAXSIZE
+        results: List[R] = []
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for element in iterable:
+                if len(pending) >= workers * 2:
+                    results.append(pending.popleft().result())
+                pending.append(executor.submit(fn, element))
+            
+            while pending:
+                results.append(pending.popleft().result())
+        
+        return results
+    
     def close(self):
-        """Close HTTP session."""
-        if self.session:
-            self.session.close()
+        """Close an explicitly assigned HTTP session (shared sessions are closed by client_registry)."""
+        self._check_pid()
+        if self._session:
+            self._session.close()
@@ -0,0 +1,285 @@
+"""
+Bulk Factory for running bulk item operations.
+
+Wraps POST /bulk-operations and GET /bulk-operations/:jobId. The backend
+processes bulk jobs lazily (a few items per status poll), so polling is
+what drives a job to completion; the poll interval adapts to whether the
+last poll made progress.
+"""
+
+import logging
+import time
+from typing import Optional, Dict, Any, List, Callable
+
+from .base_factory import BaseFactory
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+BULK_OPERATIONS = ("delete", "activate", "deactivate")
+
+
+class BulkFactory(BaseFactory):
+    """Factory for running and measuring bulk operations."""
+
+    def __init__(self, base_url: Optional[str] = None, timeout: Optional[int] = None):
+        """
+        Initialize BulkFactory.
+
+        Args:
+            base_url: Optional base URL override
+            timeout: Optional timeout override
+        """
+        super().__init__(base_url, timeout)
+
+    def start_bulk_operation(
+        self,
+        operation: str,
+        item_ids: List[str],
+        token: str,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Start a bulk operation job.
+
+        Args:
+            operation: "delete", "activate", or "deactivate"
+            item_ids: Item IDs to process
+            token: JWT access token (ADMIN or EDITOR)
+            payload: Optional operation data
+
+        Returns:
+            Dictionary with job info:
+            {
+                "job_id": "...",
+                "job_status": "pending" or "completed",
+                "job_progress": 0,
+                "total_items": count
+            }
+
+        Raises:
+            ValueError: If operation or item_ids are invalid
+            requests.HTTPError: If request fails
+        """
+        if operation not in BULK_OPERATIONS:
+            raise ValueError(f"Invalid operation: {operation}. Must be one of {', '.join(BULK_OPERATIONS)}")
+
+        if not item_ids:
+            raise ValueError("item_ids must not be empty")
+
+        logger.info(f"Starting bulk {operation} for {len(item_ids)} items")
+
+        headers = Config.get_auth_headers(token)
+        body = {"operation": operation, "itemIds": list(item_ids)}
+        if payload is not None:
+            body["payload"] = payload
+
+        response = self.post("/bulk-operations", json_data=body, headers=headers)
+
+        return self._handle_response(response, expected_status=201)
+
+    def get_job_status(self, job_id: str, token: str) -> Dict[str, Any]:
+        """
+        Poll a bulk job (also processes its next batch on the backend).
+
+        Args:
+            job_id: Bulk job ID
+            token: JWT access token of the job owner
+
+        Returns:
+            Dictionary with job status:
+            {
+                "job_id": "...",
+                "status": "pending" | "processing" | "completed",
+                "progress": 0-100,
+                "summary": {"total", "success", "failed"},
+                "skippedIds": [...],
+                "failures": [...]
+            }
+        """
+        headers = Config.get_auth_headers(token)
+        response = self.get(f"/bulk-operations/{job_id}", headers=headers)
+
+        result = self._handle_response(response, expected_status=200)
+        return result.get("data", {})
+
+    def wait_for_job(
+        self,
+        job_id: str,
+        token: str,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Poll a bulk job until it completes.
+
+        Args:
+            job_id: Bulk job ID
+            token: JWT access token of the job owner
+            timeout: Max seconds to wait (default: Config.BULK_JOB_TIMEOUT)
+            on_progress: Optional callback receiving a progress dict after each poll
+
+        Returns:
+            Dictionary with final job status and metrics (see run_bulk_operation)
+
+        Raises:
+            TimeoutError: If the job does not complete within timeout
+        """
+        return self._wait_for_jobs([job_id], token, timeout, on_progress)
+
+    def run_bulk_operation(
+        self,
+        operation: str,
+        item_ids: List[str],
+        token: str,
+        payload: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a bulk operation over any number of items and wait for completion.
+
+        Large ID sets are split into jobs of chunk_size items. All jobs are
+        started up front and polled round-robin until they complete.
+
+        Args:
+            operation: "delete", "activate", or "deactivate"
+            item_ids: Item IDs to process
+            token: JWT access token (ADMIN or EDITOR)
+            payload: Optional operation data
+            chunk_size: Items per job (default: Config.BULK_CHUNK_SIZE)
+            timeout: Max seconds to wait (default: Config.BULK_JOB_TIMEOUT)
+            on_progress: Optional callback receiving a progress dict after each poll:
+                {"job_id", "status", "processed", "total", "items_per_second", "eta"}
+
+        Returns:
+            Dictionary with aggregated results and metrics:
+            {
+                "jobs": [final job status, ...],
+                "total": count,
+                "success": count,
+                "failed": count,
+                "skipped": count,
+                "polls": count,
+                "elapsed": seconds,
+                "items_per_second": float
+            }
+
+        Raises:
+            TimeoutError: If jobs do not complete within timeout
+        """
+        chunk_size = chunk_size or Config.BULK_CHUNK_SIZE
+
+        job_ids = []
+        for start in range(0, len(item_ids), chunk_size):
+            job = self.start_bulk_operation(operation, item_ids[start:start + chunk_size], token, payload)
+            job_ids.append(job["job_id"])
+
+        return self._wait_for_jobs(job_ids, token, timeout, on_progress)
+
+    def _wait_for_jobs(
+        self,
+        job_ids: List[str],
+        token: str,
+        timeout: Optional[float],
+        on_progress: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> Dict[str, Any]:
+        """Poll jobs round-robin with adaptive intervals until all complete."""
+        timeout = Config.BULK_JOB_TIMEOUT if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+
+        pending = list(job_ids)
+        final: Dict[str, Dict[str, Any]] = {}
+        done_counts: Dict[str, int] = {job_id: 0 for job_id in job_ids}
+        totals: Dict[str, int] = {}
+        interval = Config.BULK_POLL_MIN_INTERVAL
+        polls = 0
+
+        while pending:
+            progressed = False
+
+            for job_id in list(pending):
+                status = self.get_job_status(job_id, token)
+                polls += 1
+
+                summary = status.get("summary", {})
+                totals[job_id] = summary.get("total", 0)
+                done = summary.get("success", 0) + summary.get("failed", 0) + len(status.get("skippedIds", []))
+                if done > done_counts[job_id]:
+                    progressed = True
+                done_counts[job_id] = done
+
+                if status.get("status") == "completed":
+                    pending.remove(job_id)
+                    final[job_id] = status
+                    progressed = True
+
+                if on_progress:
+                    on_progress(self._progress(job_id, status, done_counts, totals, start))
+
+            if not pending:
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Bulk jobs not complete after {timeout}s: "
+                    f"{sum(done_counts.values())}/{sum(totals.values())} items processed"
+                )
+
+            # Each poll processes a batch, so keep polling while work is moving
+            # and back off when jobs are stalled on in-progress items
+            if progressed:
+                interval = Config.BULK_POLL_MIN_INTERVAL
+            else:
+                interval = min(max(interval * 2, 0.05), Config.BULK_POLL_MAX_INTERVAL)
+
+            if interval > 0:
+                time.sleep(min(interval, remaining))
+
+        elapsed = time.monotonic() - start
+        jobs = [final[job_id] for job_id in job_ids]
+
+        result = {
+            "jobs": jobs,
+            "total": sum(job.get("summary", {}).get("total", 0) for job in jobs),
+            "success": sum(job.get("summary", {}).get("success", 0) for job in jobs),
+            "failed": sum(job.get("summary", {}).get("failed", 0) for job in jobs),
+            "skipped": sum(len(job.get("skippedIds", [])) for job in jobs),
+            "polls": polls,
+            "elapsed": elapsed,
+            "items_per_second": sum(done_counts.values()) / elapsed if elapsed > 0 else 0.0
+        }
+
+        logger.info(
+            f"Bulk jobs completed: {result['success']} succeeded, {result['failed']} failed, "
+            f"{result['skipped']} skipped in {elapsed:.2f}s "
+            f"({result['items_per_second']:.1f} items/s, {polls} polls)"
+        )
+
+        return result
+
+    @staticmethod
+    def _progress(
+        job_id: str,
+        status: Dict[str, Any],
+        done_counts: Dict[str, int],
+        totals: Dict[str, int],
+        start: float
+    ) -> Dict[str, Any]:
+        """Build progress callback payload with throughput and ETA."""
+        elapsed = time.monotonic() - start
+        processed = sum(done_counts.values())
+        total = sum(totals.values())
+        rate = processed / elapsed if elapsed > 0 else 0.0
+
+        return {
+            "job_id": job_id,
+            "status": status.get("status"),
+            "processed": processed,
+            "total": total,
+            "items_per_second": rate,
+            "eta": (total - processed) / rate if rate > 0 else None
+        }
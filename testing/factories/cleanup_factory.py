@@ -10,6 +10,7 @@ from typing import Optional, Dict, Any
 from .base_factory import BaseFactory
 from .config import Config
 from .helpers import validate_object_id
+from .cleanup_ledger import cleanup_ledger
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,8 @@ class CleanupFactory(BaseFactory):
             f"{result.get('deleted', {})}"
         )
         
+        cleanup_ledger.resolve("user", user_id)
+        
         return result
     
     def cleanup_user_items(self, user_id: str) -> Dict[str, Any]:
@@ -164,6 +167,8 @@ class CleanupFactory(BaseFactory):
             f"{result.get('deleted', {})}"
         )
         
+        cleanup_ledger.resolve("user_items", user_id)
+        
         return result
     
     def cleanup_single_item(self, item_id: str) -> Dict[str, Any]:
@@ -213,6 +218,8 @@ class CleanupFactory(BaseFactory):
         
         logger.info(f"Item {item_id} deleted successfully")
         
+        cleanup_ledger.resolve("item", item_id)
+        
         return result
     
     def reset_database(self) -> Dict[str, Any]:
@@ -243,7 +250,7 @@ class CleanupFactory(BaseFactory):
         logger.warning("Resetting entire database - ALL DATA WILL BE DELETED")
         
         headers = Config.get_internal_headers()
-        response = self.post("/internal/reset", headers=headers)
+        response = self.post("/internal/reset", headers=headers, safe_to_retry=True)
         
         if response.status_code != 200:
             raise ValueError(f"Failed to reset database: {response.text}")
@@ -252,4 +259,6 @@ class CleanupFactory(BaseFactory):
         
         logger.info("Database reset completed successfully")
         
+        cleanup_ledger.resolve_all()
+        
         return result
@@ -0,0 +1,326 @@
+"""
+Crash-safe ledger of created test data.
+
+Every user and item created through the factories is appended to an
+on-disk JSONL file, one file per run ID, worker and process, and marked
+done when cleaned up. If a test process is killed before its teardown
+runs, sweep_orphans() replays the unfinished entries through
+CleanupFactory in parallel instead of falling back to reset_database().
+"""
+
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from typing import Optional, Dict, Any, List
+
+from .config import Config
+from .token_cache import decode_jwt_payload
+from .unique_ids import unique_ids
+
+logger = logging.getLogger(__name__)
+
+# Entry kinds: a user's data, a single item, or the items of a user
+# (POST /internal/seed returns no item IDs)
+LEDGER_KINDS = ("user", "item", "user_items")
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process with this PID is running on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+class CleanupLedger:
+    """Append-only JSONL record of created and cleaned-up test data."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        run_id: Optional[str] = None,
+        worker_id: Optional[str] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Initialize CleanupLedger.
+
+        The ledger file is created lazily on the first write.
+
+        Args:
+            directory: Ledger directory (default: Config.CLEANUP_LEDGER_DIR)
+            run_id: Run identifier (default: the run namespace embedded in
+                    generated names and emails, see unique_ids)
+            worker_id: Worker identifier (default: xdist worker name or "main")
+            enabled: Whether to write entries (default: Config.CLEANUP_LEDGER_ENABLED)
+        """
+        self.directory = directory or Config.CLEANUP_LEDGER_DIR
+        self.run_id = run_id or unique_ids.run_id
+        self.worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.enabled = Config.CLEANUP_LEDGER_ENABLED if enabled is None else enabled
+
+        self._file = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        """Ledger file for this run, worker and process."""
+        return os.path.join(self.directory, f"{self.run_id}-{self.worker_id}-{os.getpid()}.jsonl")
+
+    def record(self, kind: str, entity_id: str, owner_id: Optional[str] = None) -> None:
+        """
+        Record a created entity that will need cleanup.
+
+        Args:
+            kind: "user", "item", or "user_items"
+            entity_id: User or item ID
+            owner_id: For items, the creating user's ID (cleaning up that
+                      user's data also covers the item)
+
+        Raises:
+            ValueError: If kind is not a ledger kind
+        """
+        if kind not in LEDGER_KINDS:
+            raise ValueError(f"Invalid ledger kind: {kind}. Must be one of {', '.join(LEDGER_KINDS)}")
+
+        entry = {"op": "create", "kind": kind, "id": entity_id}
+        if owner_id:
+            entry["owner"] = owner_id
+        self._append(entry)
+
+    def record_item(self, item_id: str, token: str) -> None:
+        """
+        Record a created item, owned by the user the token belongs to.
+
+        Args:
+            item_id: Item ID
+            token: JWT access token used to create the item
+        """
+        self.record("item", item_id, decode_jwt_payload(token).get("sub"))
+
+    def resolve(self, kind: str, entity_id: str) -> None:
+        """
+        Mark an entity as cleaned up.
+
+        Args:
+            kind: "user", "item", or "user_items"
+            entity_id: User or item ID
+        """
+        self._append({"op": "done", "kind": kind, "id": entity_id})
+
+    def resolve_all(self) -> None:
+        """Mark every entry in this ledger as cleaned up (after a database reset)."""
+        self._append({"op": "reset"})
+
+    def close(self) -> None:
+        """Close the ledger file, deleting it if nothing is left to clean up."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+
+            pending = load_pending(self.path)
+            if not any(pending.values()):
+                os.remove(self.path)
+
+    def join_run(self, run_id: str) -> None:
+        """
+        Write further entries to this process's ledger file of another run.
+
+        Used by worker processes that create data on behalf of their
+        parent's run, so sweep_orphans(run_id=...) finds it.
+
+        Args:
+            run_id: Run identifier
+        """
+        with self._lock:
+            if run_id == self.run_id:
+                return
+            # The next write opens the file under the new run ID
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self.run_id = run_id
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Append one entry as a JSON line and flush it to the OS."""
+        if not self.enabled:
+            return
+
+        entry["ts"] = time.time()
+        line = json.dumps(entry) + "\n"
+
+        with self._lock:
+            # Reopen after fork so children never write into the parent's file
+            if self._file is None or self._pid != os.getpid():
+                os.makedirs(self.directory, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+                self._pid = os.getpid()
+            self._file.write(line)
+            self._file.flush()
+
+    def _after_fork(self) -> None:
+        """Replace a lock that may have been held by another thread at fork time."""
+        self._lock = threading.Lock()
+
+
+def load_pending(path: str) -> Dict[str, Any]:
+    """
+    Replay a ledger file and return entries that were never cleaned up.
+
+    Cleaning up a user's data also resolves that user's seeded items and
+    the items it created; cleaning up a user's items resolves the latter.
+    A truncated last line (process killed mid-write) is ignored.
+
+    Args:
+        path: Ledger file path
+
+    Returns:
+        Dictionary of pending entries:
+        {
+            "user": [user_id, ...],
+            "user_items": [user_id, ...],
+            "item": [item_id, ...]
+        }
+    """
+    users: Dict[str, None] = {}
+    user_items: Dict[str, None] = {}
+    items: Dict[str, Optional[str]] = {}
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+
+            op, kind, entity_id = entry.get("op"), entry.get("kind"), entry.get("id")
+
+            if op == "reset":
+                users.clear()
+                user_items.clear()
+                items.clear()
+            elif op == "create":
+                if kind == "user":
+                    users[entity_id] = None
+                elif kind == "user_items":
+                    user_items[entity_id] = None
+                elif kind == "item":
+                    items[entity_id] = entry.get("owner")
+            elif op == "done":
+                if kind == "item":
+                    items.pop(entity_id, None)
+                    continue
+                if kind == "user":
+                    users.pop(entity_id, None)
+                user_items.pop(entity_id, None)
+                for item_id in [i for i, owner in items.items() if owner == entity_id]:
+                    del items[item_id]
+
+    return {
+        "user": list(users),
+        "user_items": [user_id for user_id in user_items if user_id not in users],
+        # Items owned by a pending user are removed by that user's cleanup
+        "item": [
+            item_id for item_id, owner in items.items()
+            if owner not in users and owner not in user_items
+        ]
+    }
+
+
+def sweep_orphans(
+    directory: Optional[str] = None,
+    run_id: Optional[str] = None,
+    include_live: bool = False,
+    workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Clean up data left behind by test processes that did not finish teardown.
+
+    Ledger files whose entries are all cleaned up afterwards are deleted.
+
+    Args:
+        directory: Ledger directory (default: Config.CLEANUP_LEDGER_DIR)
+        run_id: Only sweep ledgers of this run (default: all runs)
+        include_live: Also sweep ledgers of processes that are still
+                      running (default: False)
+        workers: Max concurrent cleanup requests (default: Config.CLEANUP_WORKERS)
+
+    Returns:
+        Dictionary with sweep results:
+        {
+            "files": count,
+            "users": count,
+            "user_items": count,
+            "items": count,
+            "failed": count
+        }
+    """
+    # Imported here: CleanupQueue -> CleanupFactory -> this module
+    from .cleanup_queue import CleanupQueue
+
+    directory = directory or Config.CLEANUP_LEDGER_DIR
+    pattern = os.path.join(directory, f"{run_id or '*'}-*.jsonl")
+    own_path = cleanup_ledger.path
+
+    paths: List[str] = []
+    for path in sorted(glob.glob(pattern)):
+        if path == own_path:
+            continue
+        pid = int(path.rsplit("-", 1)[1].split(".")[0])
+        if not include_live and _pid_alive(pid):
+            continue
+        paths.append(path)
+
+    result = {"files": len(paths), "users": 0, "user_items": 0, "items": 0, "failed": 0}
+    if not paths:
+        return result
+
+    queue = CleanupQueue(workers=workers)
+    futures = {}
+
+    for path in paths:
+        pending = load_pending(path)
+        result["users"] += len(pending["user"])
+        result["user_items"] += len(pending["user_items"])
+        result["items"] += len(pending["item"])
+
+        futures[path] = (
+            [queue.enqueue_user_data(user_id) for user_id in pending["user"]]
+            + [queue.enqueue_user_items(user_id) for user_id in pending["user_items"]]
+            + [queue.enqueue_item(item_id) for item_id in pending["item"]]
+        )
+
+    queue.flush()
+    queue.close()
+
+    for path, path_futures in futures.items():
+        failed = sum(1 for future in path_futures if future.exception() is not None)
+        result["failed"] += failed
+        if not failed:
+            os.remove(path)
+
+    # The sweep's own "done" entries leave nothing pending in this process's file
+    cleanup_ledger.close()
+
+    logger.info(f"Orphan sweep completed: {result}")
+
+    return result
+
+
+# Shared by all factories in the process
+cleanup_ledger = CleanupLedger()
+
+# The file is reopened per process in _append; the lock must not be inherited held
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=cleanup_ledger._after_fork)
@@ -0,0 +1,203 @@
+"""
+Deferred cleanup queue for test data.
+
+Fixtures enqueue cleanup work instead of waiting for each DELETE; a pool
+of worker threads drains the queue concurrently. flush() waits for all
+queued work, and close() flushes within Config.CLEANUP_TIMEOUT.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, List, Callable, Set
+
+import requests
+
+from .cleanup_factory import CleanupFactory
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class CleanupQueue:
+    """Runs CleanupFactory calls in the background with bounded parallelism."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        base_url: Optional[str] = None
+    ):
+        """
+        Initialize CleanupQueue.
+
+        Args:
+            workers: Max concurrent cleanup requests (default: Config.CLEANUP_WORKERS)
+            timeout: Seconds close() waits for queued work (default: Config.CLEANUP_TIMEOUT)
+            base_url: Optional base URL override for the cleanup factories
+        """
+        self.workers = workers or Config.CLEANUP_WORKERS
+        self.timeout = Config.CLEANUP_TIMEOUT if timeout is None else timeout
+        self.base_url = base_url
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cleanup")
+        self._local = threading.local()
+        self._factories: List[CleanupFactory] = []
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._stats = {"completed": 0, "failed": 0, "cancelled": 0}
+
+    def enqueue_item(self, item_id: str) -> Future:
+        """
+        Queue hard delete of a single item.
+
+        An item that is already gone (404) counts as cleaned up.
+
+        Args:
+            item_id: Item ID (ObjectId format)
+
+        Returns:
+            Future resolving to the cleanup result
+        """
+        return self._submit(
+            f"item {item_id}",
+            lambda factory: factory.cleanup_single_item(item_id),
+            ignore_not_found=True
+        )
+
+    def enqueue_user_data(
+        self,
+        user_id: str,
+        include_otp: bool = True,
+        include_activity_logs: bool = True
+    ) -> Future:
+        """
+        Queue cleanup of all data for a user (user record is preserved).
+
+        Args:
+            user_id: User ID (ObjectId format)
+            include_otp: Whether to delete OTPs (default: True)
+            include_activity_logs: Whether to delete activity logs (default: True)
+
+        Returns:
+            Future resolving to the cleanup result
+        """
+        return self._submit(
+            f"user {user_id}",
+            lambda factory: factory.cleanup_user_data(user_id, include_otp, include_activity_logs)
+        )
+
+    def enqueue_user_items(self, user_id: str) -> Future:
+        """
+        Queue cleanup of a user's items only.
+
+        Args:
+            user_id: User ID (ObjectId format)
+
+        Returns:
+            Future resolving to the cleanup result
+        """
+        return self._submit(
+            f"items of user {user_id}",
+            lambda factory: factory.cleanup_user_items(user_id)
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> Dict[str, int]:
+        """
+        Wait for all queued cleanup work.
+
+        Args:
+            timeout: Max seconds to wait (default: no limit)
+
+        Returns:
+            Dictionary with counts: {"completed", "failed", "cancelled", "pending"}
+        """
+        with self._lock:
+            pending = list(self._pending)
+
+        _, not_done = wait(pending, timeout=timeout)
+
+        if not_done:
+            logger.warning(f"{len(not_done)} cleanup tasks still pending after {timeout}s")
+
+        return self.stats()
+
+    def stats(self) -> Dict[str, int]:
+        """Return counts of completed, failed, cancelled and pending cleanup tasks."""
+        with self._lock:
+            return {**self._stats, "pending": len(self._pending)}
+
+    def close(self) -> Dict[str, int]:
+        """
+        Flush queued work within the cleanup timeout and stop the workers.
+
+        Work not started by then is cancelled; those items are leaked and
+        logged (the orphan sweep can remove them later).
+
+        Returns:
+            Final counts: {"completed", "failed", "cancelled", "pending"}
+        """
+        self.flush(self.timeout)
+
+        # Drop work not yet started (shutdown(cancel_futures=True) needs Python 3.9)
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+        result = self.stats()
+
+        for factory in self._factories:
+            factory.close()
+
+        logger.info(f"Cleanup queue closed: {result}")
+        return result
+
+    def _submit(
+        self,
+        label: str,
+        task: Callable[[CleanupFactory], Dict[str, Any]],
+        ignore_not_found: bool = False
+    ) -> Future:
+        """Submit a cleanup task and track it until done."""
+        def run() -> Dict[str, Any]:
+            try:
+                return task(self._factory())
+            except requests.HTTPError as e:
+                if ignore_not_found and e.response is not None and e.response.status_code == 404:
+                    return {}
+                raise
+
+        future = self._executor.submit(run)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(lambda f: self._done(label, f))
+
+        return future
+
+    def _done(self, label: str, future: Future):
+        """Record outcome of a finished cleanup task."""
+        if future.cancelled():
+            outcome = "cancelled"
+        elif future.exception() is not None:
+            outcome = "failed"
+        else:
+            outcome = "completed"
+
+        with self._lock:
+            self._pending.discard(future)
+            self._stats[outcome] += 1
+
+        if outcome == "failed":
+            logger.warning(f"Failed to cleanup {label}: {future.exception()}")
+        elif outcome == "cancelled":
+            logger.warning(f"Cleanup of {label} was cancelled before it ran; leaked")
+
+    def _factory(self) -> CleanupFactory:
+        """Return the calling worker thread's CleanupFactory."""
+        factory = getattr(self._local, "factory", None)
+        if factory is None:
+            factory = self._local.factory = CleanupFactory(self.base_url)
+            with self._lock:
+                self._factories.append(factory)
+        return factory
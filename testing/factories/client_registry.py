@@ -0,0 +1,127 @@
+"""
+Shared HTTP connection pool with thread-local sessions.
+
+requests.Session is not documented as thread-safe, but urllib3's pool
+manager is. The registry keeps one HTTPAdapter (sized by
+Config.HTTP_POOL_CONNECTIONS / HTTP_POOL_MAXSIZE, carrying the retry
+policy) and gives each thread its own Session mounted on it, so factories
+can be used from worker threads while all of them reuse the same warm
+connections. After a fork the child starts with a fresh pool instead of
+sharing the parent's sockets.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# Methods resent automatically. PATCH endpoints in this API only set values
+# (activate, role, status), so resending one is harmless.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "PATCH"})
+
+# Failures after which a request may or may not have been applied
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+RETRY_BACKOFF_FACTOR = 1
+
+
+def retry_strategy() -> Retry:
+    """
+    Build the urllib3 retry policy for factory sessions.
+
+    Only idempotent methods are retried on 5xx and read errors; POST is
+    resent by BaseFactory._make_request when its safe_to_retry check
+    allows it. 429 is not retried here: _make_request handles it through
+    the shared adaptive rate limiter, honoring Retry-After.
+
+    Returns:
+        Retry configuration
+    """
+    return Retry(
+        total=Config.MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=list(RETRY_STATUS_CODES),
+        respect_retry_after_header=False,
+        allowed_methods=sorted(IDEMPOTENT_METHODS)
+    )
+
+
+class ClientRegistry:
+    """One shared connection pool, one requests.Session per thread."""
+
+    def __init__(self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None):
+        """
+        Initialize ClientRegistry.
+
+        Args:
+            pool_connections: Number of per-host pools to keep
+                              (default: Config.HTTP_POOL_CONNECTIONS)
+            pool_maxsize: Connections kept per host; should cover the number
+                          of threads making requests (default: Config.HTTP_POOL_MAXSIZE)
+        """
+        self.pool_connections = pool_connections or Config.HTTP_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or Config.HTTP_POOL_MAXSIZE
+        self._after_fork()
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        """Shared adapter, created on first use (and again in a forked child)."""
+        if self._pid != os.getpid():
+            self._after_fork()
+        if self._adapter is None:
+            with self._lock:
+                if self._adapter is None:
+                    self._adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        max_retries=retry_strategy()
+                    )
+        return self._adapter
+
+    def session(self) -> requests.Session:
+        """
+        Return the calling thread's session, creating it on first use.
+
+        Do not close the returned session: that would drop the shared
+        pool's connections for every thread. Use close() instead.
+
+        Returns:
+            requests.Session mounted on the shared adapter
+        """
+        if self._pid != os.getpid():
+            self._after_fork()
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            self._local.session = session
+        return session
+
+    def close(self) -> None:
+        """Close pooled connections (sessions stay usable and reconnect on demand)."""
+        with self._lock:
+            if self._adapter is not None:
+                self._adapter.close()
+
+    def _after_fork(self) -> None:
+        """Drop the pool and sessions inherited from a parent process (without closing its sockets)."""
+        self._adapter = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+
+# Shared by all factories in the process
+client_registry = ClientRegistry()
+
+# A forked child must not share the parent's sockets or a lock held at fork time
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=client_registry._after_fork)
@@ -6,6 +6,7 @@ and other settings used by factory classes.
 """
 
 import os
+import tempfile
 from typing import Optional
 
 
@@ -24,16 +25,86 @@ class Config:
     # HTTP Configuration
     REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    # Shared connection pool: per-host pools kept, and connections per host (cover worker threads)
+    HTTP_POOL_CONNECTIONS: int = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+    HTTP_POOL_MAXSIZE: int = int(os.getenv("HTTP_POOL_MAXSIZE", "32"))
+    USER_PROVISION_WORKERS: int = int(os.getenv("USER_PROVISION_WORKERS", "16"))
+    JSON_CODEC: str = os.getenv("JSON_CODEC", "auto")  # auto, orjson, msgspec or json
+    REQUEST_METRICS_ENABLED: bool = os.getenv("REQUEST_METRICS_ENABLED", "true").lower() == "true"
+    REQUEST_METRICS_FILE: str = os.getenv("REQUEST_METRICS_FILE", "")  # JSON dump at pytest session end
+    
+    # Adaptive Rate Limiting Configuration (per endpoint class, requests/second, 0 = no ceiling)
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_AUTH: float = float(os.getenv("RATE_LIMIT_AUTH", "0"))
+    RATE_LIMIT_OTP: float = float(os.getenv("RATE_LIMIT_OTP", "0"))
+    RATE_LIMIT_ITEMS: float = float(os.getenv("RATE_LIMIT_ITEMS", "0"))
+    RATE_LIMIT_INTERNAL: float = float(os.getenv("RATE_LIMIT_INTERNAL", "0"))
+    RATE_LIMIT_MIN: float = float(os.getenv("RATE_LIMIT_MIN", "1"))
+    RATE_LIMIT_INCREASE: float = float(os.getenv("RATE_LIMIT_INCREASE", "2"))  # req/s gained per second
+    RATE_LIMIT_DECREASE: float = float(os.getenv("RATE_LIMIT_DECREASE", "0.5"))  # rate factor on 429
+    # Longest Retry-After honored with a retry; longer waits return the 429
+    RATE_LIMIT_MAX_WAIT: float = float(os.getenv("RATE_LIMIT_MAX_WAIT", "30"))
+    
+    # Item Batching Configuration (POST /items/batch accepts at most 50 items)
+    ITEM_BATCH_LINGER_MS: int = int(os.getenv("ITEM_BATCH_LINGER_MS", "20"))
+    ITEM_BATCH_MAX_SIZE: int = int(os.getenv("ITEM_BATCH_MAX_SIZE", "50"))
+    ITEM_SEND_WORKERS: int = int(os.getenv("ITEM_SEND_WORKERS", "4"))
+    # Reject payloads client-side before sending (off by default so negative tests reach the API)
+    ITEM_PREFLIGHT_VALIDATION: bool = os.getenv("ITEM_PREFLIGHT_VALIDATION", "false").lower() == "true"
+    
+    # Seeding Configuration
+    SEED_WAIT_TIMEOUT: int = int(os.getenv("SEED_WAIT_TIMEOUT", "60"))
+    SEED_POLL_INTERVAL: float = float(os.getenv("SEED_POLL_INTERVAL", "0.25"))
+    SEED_POLL_MAX_INTERVAL: float = float(os.getenv("SEED_POLL_MAX_INTERVAL", "5"))
+    
+    # Bulk Operations Configuration
+    BULK_CHUNK_SIZE: int = int(os.getenv("BULK_CHUNK_SIZE", "500"))
+    BULK_JOB_TIMEOUT: int = int(os.getenv("BULK_JOB_TIMEOUT", "300"))
+    BULK_POLL_MIN_INTERVAL: float = float(os.getenv("BULK_POLL_MIN_INTERVAL", "0"))
+    BULK_POLL_MAX_INTERVAL: float = float(os.getenv("BULK_POLL_MAX_INTERVAL", "2"))
+    
+    # Async Configuration
+    ASYNC_CONCURRENCY: int = int(os.getenv("ASYNC_CONCURRENCY", "100"))
     
     # Test Data Configuration
     DEFAULT_PASSWORD: str = os.getenv("DEFAULT_PASSWORD", "TestPassword123!")
     UNIQUE_NAME_PREFIX: str = os.getenv("UNIQUE_NAME_PREFIX", "Test")
     UNIQUE_EMAIL_PREFIX: str = os.getenv("UNIQUE_EMAIL_PREFIX", "test")
     UNIQUE_EMAIL_DOMAIN: str = os.getenv("UNIQUE_EMAIL_DOMAIN", "test.com")
+    SEED: Optional[int] = int(os.getenv("FACTORY_SEED")) if os.getenv("FACTORY_SEED") else None  # Deterministic payloads
+    RUN_ID: str = os.getenv("TEST_RUN_ID", "")  # Namespace in generated IDs (default: xdist run UID or random)
+    
+    # Token Cache Configuration (access tokens expire after 15 minutes; used by
+    # logins with use_cache=True, i.e. the pytest fixtures and the user pool)
+    TOKEN_CACHE_ENABLED: bool = os.getenv("TOKEN_CACHE_ENABLED", "true").lower() == "true"
+    TOKEN_REFRESH_MARGIN: int = int(os.getenv("TOKEN_REFRESH_MARGIN", "30"))
+    TOKEN_REFRESH_AHEAD: int = int(os.getenv("TOKEN_REFRESH_AHEAD", "120"))
+    
+    # User Pool Configuration
+    # Serve role fixtures from reused accounts (off by default: each test gets a fresh user)
+    USER_POOL_ENABLED: bool = os.getenv("USER_POOL_ENABLED", "false").lower() == "true"
+    USER_POOL_SIZE: int = int(os.getenv("USER_POOL_SIZE", "0"))
     
     # Cleanup Configuration
     CLEANUP_ON_ERROR: bool = os.getenv("CLEANUP_ON_ERROR", "true").lower() == "true"
     CLEANUP_TIMEOUT: int = int(os.getenv("CLEANUP_TIMEOUT", "60"))
+    # Queue fixture cleanup and drain it in the background (off by default so a failed
+    # cleanup surfaces in the test that caused it, not at session end)
+    CLEANUP_DEFERRED: bool = os.getenv("CLEANUP_DEFERRED", "false").lower() == "true"
+    CLEANUP_WORKERS: int = int(os.getenv("CLEANUP_WORKERS", "8"))
+    CLEANUP_LEDGER_ENABLED: bool = os.getenv("CLEANUP_LEDGER_ENABLED", "true").lower() == "true"
+    CLEANUP_LEDGER_DIR: str = os.getenv(
+        "CLEANUP_LEDGER_DIR",
+        os.path.join(tempfile.gettempdir(), "flowhub-cleanup-ledger")
+    )
+    CLEANUP_SWEEP_ON_START: bool = os.getenv("CLEANUP_SWEEP_ON_START", "false").lower() == "true"
+    
+    # Dataset Cache Configuration (generated payload sets reused across runs)
+    DATASET_CACHE_ENABLED: bool = os.getenv("DATASET_CACHE_ENABLED", "true").lower() == "true"
+    DATASET_CACHE_DIR: str = os.getenv(
+        "DATASET_CACHE_DIR",
+        os.path.join(tempfile.gettempdir(), "flowhub-dataset-cache")
+    )
     
     @classmethod
     def get_api_url(cls, endpoint: str) -> str:
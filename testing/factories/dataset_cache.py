@@ -0,0 +1,232 @@
+"""
+Content-addressed cache of generated datasets.
+
+A dataset is identified by its generation spec (kind, counts, item type,
+seed, ...) plus a fingerprint of this package's source, so any change to
+the factories or helpers produces a new key. The first run streams the
+generated rows to a JSONL file under Config.DATASET_CACHE_DIR; later runs
+(other CI shards, re-runs) memory-map that file and stream it instead of
+regenerating. Files are published with an atomic rename, so concurrent
+writers never expose partial files.
+
+Besides item batches, the edge-case and negative-case catalogs are cached
+as (case name, payload) rows. Only deterministic datasets can be cached:
+they need a seed (explicit or Config.SEED), unseeded requests bypass the
+cache.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import mmap
+import os
+import threading
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterator, Iterable, Callable
+
+from .config import Config
+from .edge_generators import get_all_edge_cases
+from .item_payloads import ItemPayloads
+from .negative_generators import get_negative_test_cases
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@lru_cache(maxsize=1)
+def source_fingerprint() -> str:
+    """
+    Hash of every module in this package.
+
+    Returns:
+        Hex digest that changes whenever factory or helper source changes
+    """
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(PACKAGE_DIR, "*.py"))):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """On-disk cache of generated payload datasets keyed by spec and source."""
+
+    def __init__(self, directory: Optional[str] = None, enabled: Optional[bool] = None):
+        """
+        Initialize DatasetCache.
+
+        Args:
+            directory: Cache directory (default: Config.DATASET_CACHE_DIR)
+            enabled: Read and write cache files (default: Config.DATASET_CACHE_ENABLED);
+                     when disabled every dataset is generated
+        """
+        self.directory = directory or Config.DATASET_CACHE_DIR
+        self.enabled = Config.DATASET_CACHE_ENABLED if enabled is None else enabled
+
+    def key(self, spec: Dict[str, Any]) -> str:
+        """
+        Content address of a dataset.
+
+        Args:
+            spec: JSON-serializable generation spec
+
+        Returns:
+            Hex digest of spec and source fingerprint
+        """
+        encoded = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{source_fingerprint()}:{encoded}".encode("utf-8")).hexdigest()
+
+    def path(self, spec: Dict[str, Any]) -> str:
+        """Cache file path for a spec."""
+        return os.path.join(self.directory, f"{self.key(spec)}.jsonl")
+
+    def dataset(
+        self,
+        spec: Dict[str, Any],
+        generate: Callable[[], Iterable[Any]]
+    ) -> Iterator[Any]:
+        """
+        Stream a dataset, generating and caching it on first use.
+
+        Args:
+            spec: JSON-serializable spec that fully determines the output
+                  of generate
+            generate: Callable returning an iterable of JSON-serializable rows
+
+        Returns:
+            Iterator over rows (dicts, lists, ...)
+        """
+        if not self.enabled:
+            return iter(generate())
+
+        path = self.path(spec)
+        if os.path.exists(path):
+            logger.debug(f"Dataset cache hit: {path}")
+            return self._read(path)
+
+        logger.debug(f"Dataset cache miss, generating: {path}")
+        return self._write_through(path, generate())
+
+    def items(
+        self,
+        count: int,
+        item_type: str = "DIGITAL",
+        seed: Optional[int] = None,
+        **base_overrides
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream count item payloads (same rows as ItemPayloads.iter_batch_items).
+
+        Args:
+            count: Number of items
+            item_type: "PHYSICAL", "DIGITAL", or "SERVICE" (default: "DIGITAL")
+            seed: Payload seed (default: Config.SEED, shared by all shards so
+                  they reuse one file); unseeded datasets are not cached
+            **base_overrides: Fields set on every item
+
+        Returns:
+            Iterator over item data dictionaries
+        """
+        seed = Config.SEED if seed is None else seed
+        generate = lambda: ItemPayloads(seed=seed).iter_batch_items(count, item_type, **base_overrides)
+
+        if seed is None:
+            return iter(generate())
+
+        spec = {
+            "kind": "batch_items",
+            "count": count,
+            "item_type": item_type,
+            "seed": seed,
+            "overrides": base_overrides
+        }
+        return self.dataset(spec, generate)
+
+    def edge_cases(self, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Edge-case catalog (same cases as get_all_edge_cases).
+
+        Args:
+            seed: Catalog seed (default: Config.SEED); unseeded catalogs are
+                  not cached
+
+        Returns:
+            Dictionary with all edge case scenarios
+        """
+        return self._catalog("edge_cases", seed, get_all_edge_cases)
+
+    def negative_cases(self, seed: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Negative-case catalog (same cases as get_negative_test_cases).
+
+        Args:
+            seed: Catalog seed (default: Config.SEED); unseeded catalogs are
+                  not cached
+
+        Returns:
+            Dictionary with all negative test case scenarios
+        """
+        return self._catalog("negative_cases", seed, get_negative_test_cases)
+
+    def clear(self) -> int:
+        """
+        Delete all cached datasets.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for path in glob.glob(os.path.join(self.directory, "*.jsonl")):
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def _catalog(self, kind: str, seed: Optional[int], build: Callable[..., Dict[str, Any]]) -> Dict[str, Any]:
+        """Load a named-case catalog, cached as one [name, payload] row per case."""
+        seed = Config.SEED if seed is None else seed
+        if seed is None:
+            return build()
+
+        rows = self.dataset({"kind": kind, "seed": seed}, lambda: build(seed=seed).items())
+        return {name: case for name, case in rows}
+
+    @staticmethod
+    def _read(path: str) -> Iterator[Any]:
+        """Stream rows from a cache file through a read-only memory map."""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    yield json.loads(line)
+
+    def _write_through(self, path: str, rows: Iterable[Any]) -> Iterator[Any]:
+        """Yield generated rows while writing them; publish the file only when complete."""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        complete = False
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps(row, separators=(",", ":")))
+                    f.write("\n")
+                    yield row
+            complete = True
+            os.replace(tmp_path, path)
+        finally:
+            if not complete:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+# Shared by all factories in the process
+dataset_cache = DatasetCache()
@@ -5,7 +5,10 @@ Provides functions to generate edge case test data (boundaries, special characte
 """
 
 import copy
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from .item_payloads import ItemPayloads
+from .seeding import derive_seed
 
 
 def min_boundary_values() -> Dict[str, Any]:
@@ -15,9 +18,6 @@ def min_boundary_values() -> Dict[str, Any]:
     Returns:
         Dictionary with item data at minimum boundaries
     """
-    from .item_factory import ItemFactory
-    
-    factory = ItemFactory()
     return {
         "name": "ABC",  # Min length: 3
         "description": "1234567890",  # Min length: 10
@@ -36,9 +36,6 @@ def max_boundary_values() -> Dict[str, Any]:
     Returns:
         Dictionary with item data at maximum boundaries
     """
-    from .item_factory import ItemFactory
-    
-    factory = ItemFactory()
     return {
         "name": "A" * 100,  # Max length: 100
         "description": "A" * 500,  # Max length: 500
@@ -50,17 +47,18 @@ def max_boundary_values() -> Dict[str, Any]:
     }
 
 
-def special_characters() -> Dict[str, Any]:
+def special_characters(seed: Optional[int] = None) -> Dict[str, Any]:
     """
     Generate item with special characters in name and description.
     
+    Args:
+        seed: Payload seed (default: derived from Config.SEED)
+        
     Returns:
         Dictionary with item data containing special characters
     """
-    from .item_factory import ItemFactory
-    
-    factory = ItemFactory()
-    base_item = factory.create_digital_item()
+    payloads = ItemPayloads(seed=seed)
+    base_item = payloads.create_digital_item()
     
     return {
         **base_item,
@@ -69,17 +67,18 @@ def special_characters() -> Dict[str, Any]:
     }
 
 
-def unicode_characters() -> Dict[str, Any]:
+def unicode_characters(seed: Optional[int] = None) -> Dict[str, Any]:
     """
     Generate item with Unicode characters.
     
+    Args:
+        seed: Payload seed (default: derived from Config.SEED)
+        
     Returns:
         Dictionary with item data containing Unicode characters
     """
-    from .item_factory import ItemFactory
-    
-    factory = ItemFactory()
-    base_item = factory.create_digital_item()
+    payloads = ItemPayloads(seed=seed)
+    base_item = payloads.create_digital_item()
     
     return {
         **base_item,
@@ -88,10 +87,13 @@ def unicode_characters() -> Dict[str, Any]:
     }
 
 
-def category_case_variations() -> Dict[str, Dict[str, Any]]:
+def category_case_variations(seed: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
     """
     Generate items with category case variations (to test normalization).
     
+    Args:
+        seed: Payload seed (default: derived from Config.SEED)
+        
     Returns:
         Dictionary with different case variations:
         {
@@ -100,10 +102,8 @@ def category_case_variations() -> Dict[str, Dict[str, Any]]:
             "mixed": {...}
         }
     """
-    from .item_factory import ItemFactory
-    
-    factory = ItemFactory()
-    base_item = factory.create_digital_item()
+    payloads = ItemPayloads(seed=seed)
+    base_item = payloads.create_digital_item()
     
     return {
         "lowercase": {
@@ -121,10 +121,13 @@ def category_case_variations() -> Dict[str, Dict[str, Any]]:
     }
 
 
-def price_boundary_cases() -> Dict[str, Dict[str, Any]]:
+def price_boundary_cases(seed: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
     """
     Generate items with price at various boundaries.
     
+    Args:
+        seed: Payload seed (default: derived from Config.SEED)
+        
     Returns:
         Dictionary with price boundary cases:
         {
@@ -134,10 +137,8 @@ def price_boundary_cases() -> Dict[str, Dict[str, Any]]:
             "just_above_max": {...},  # 1000000.00
         }
     """
-    from .item_factory import ItemFactory
-    
-    factory = ItemFactory()
-    base_item = factory.create_digital_item()
+    payloads = ItemPayloads(seed=seed)
+    base_item = payloads.create_digital_item()
     
     return {
         "min_valid": {
@@ -159,10 +160,13 @@ def price_boundary_cases() -> Dict[str, Dict[str, Any]]:
     }
 
 
-def tag_edge_cases() -> Dict[str, Dict[str, Any]]:
+def tag_edge_cases(seed: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
     """
     Generate items with tag edge cases.
     
+    Args:
+        seed: Payload seed (default: derived from Config.SEED)
+        
     Returns:
         Dictionary with tag edge cases:
         {
@@ -172,10 +176,8 @@ def tag_edge_cases() -> Dict[str, Dict[str, Any]]:
             "tags_with_special_chars": {...}
         }
     """
-    from .item_factory import ItemFactory
-    
-    factory = ItemFactory()
-    base_item = factory.create_digital_item()
+    payloads = ItemPayloads(seed=seed)
+    base_item = payloads.create_digital_item()
     
     return {
         "max_tags": {
@@ -197,19 +199,26 @@ def tag_edge_cases() -> Dict[str, Dict[str, Any]]:
     }
 
 
-def get_all_edge_cases() -> Dict[str, Any]:
+def get_all_edge_cases(seed: Optional[int] = None) -> Dict[str, Any]:
     """
     Get all edge case test data.
     
+    Args:
+        seed: Seed for reproducible cases; each scenario gets its own
+              stream derived from it (default: derived from Config.SEED)
+        
     Returns:
         Dictionary with all edge case scenarios
     """
+    def stream(name: str) -> Optional[int]:
+        return None if seed is None else derive_seed(seed, "edge_cases", name)
+
     return {
         "min_boundary": min_boundary_values(),
         "max_boundary": max_boundary_values(),
-        "special_chars": special_characters(),
-        "unicode": unicode_characters(),
-        "category_cases": category_case_variations(),
-        "price_boundaries": price_boundary_cases(),
-        "tag_edges": tag_edge_cases()
+        "special_chars": special_characters(stream("special_chars")),
+        "unicode": unicode_characters(stream("unicode")),
+        "category_cases": category_case_variations(stream("category_cases")),
+        "price_boundaries": price_boundary_cases(stream("price_boundaries")),
+        "tag_edges": tag_edge_cases(stream("tag_edges"))
     }
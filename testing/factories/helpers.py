@@ -5,13 +5,22 @@ Provides utility functions for generating unique identifiers, validating data,
 and other common operations used across factory classes.
 """
 
-import time
 import random
 import string
 import re
-from typing import Optional, Tuple
+import zlib
+from typing import Optional, Tuple, List, Dict
 from datetime import datetime
 
+from .unique_ids import next_unique_id
+
+# The backend counts item names sharing their first 5 normalized characters as
+# similar and allows at most 3 active ones per user and category, so generated
+# names start with a 5-character base-36 key
+NAME_KEY_LENGTH = 5
+NAME_KEY_ALPHABET = string.digits + string.ascii_lowercase
+NAME_KEY_SPACE = len(NAME_KEY_ALPHABET) ** NAME_KEY_LENGTH
+
 
 def generate_unique_name(prefix: str = "Test", suffix: Optional[str] = None) -> str:
     """
@@ -19,19 +28,45 @@ def generate_unique_name(prefix: str = "Test", suffix: Optional[str] = None) ->
     
     Args:
         prefix: Prefix for the name (default: "Test")
-        suffix: Optional suffix (default: None, uses timestamp)
+        suffix: Optional suffix (default: None, uses a unique run-scoped ID)
         
     Returns:
-        Unique name string (e.g., "Test Item 1704456000_abc123")
+        Unique name string (e.g., "Test Item 3f9a1c2e_gw11a2b_18c5d2e3f4a_0")
     """
     if suffix is None:
-        timestamp = int(time.time())
-        random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-        suffix = f"{timestamp}_{random_suffix}"
+        suffix = next_unique_id()
     
     return f"{prefix} {suffix}"
 
 
+def name_key_offset(start: str) -> int:
+    """Hash of `start` at which name_key's sequence begins."""
+    return zlib.crc32(start.encode("utf-8"))
+
+
+def name_key(index: int, start: str = "") -> str:
+    """
+    Generate the key that leads a generated item name.
+    
+    Consecutive indices give distinct keys (up to 36**5), so a batch never
+    trips the backend's similar-names limit; offsetting by a hash of `start`
+    keeps separate batches from reusing the same keys.
+    
+    Args:
+        index: Position of the item, e.g. within its batch
+        start: String the sequence is offset by (e.g. the batch's name prefix)
+        
+    Returns:
+        Five lowercase base-36 characters (e.g. "0k3xa")
+    """
+    value = (name_key_offset(start) + index) % NAME_KEY_SPACE
+    digits = []
+    for _ in range(NAME_KEY_LENGTH):
+        value, digit = divmod(value, len(NAME_KEY_ALPHABET))
+        digits.append(NAME_KEY_ALPHABET[digit])
+    return "".join(reversed(digits))
+
+
 def generate_unique_email(prefix: str = "test", domain: str = "test.com") -> str:
     """
     Generate a unique email address for test users.
@@ -41,11 +76,9 @@ def generate_unique_email(prefix: str = "test", domain: str = "test.com") -> str
         domain: Email domain (default: "test.com")
         
     Returns:
-        Unique email string (e.g., "test_1704456000_abc123@test.com")
+        Unique email string (e.g., "test_3f9a1c2e_1a2b_18c5d2e3f4a_0@test.com")
     """
-    timestamp = int(time.time())
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-    return f"{prefix}_{timestamp}_{random_suffix}@{domain}"
+    return f"{prefix}_{next_unique_id()}@{domain}"
 
 
 def generate_timestamp() -> str:
@@ -93,42 +126,53 @@ def normalize_category(category: str) -> str:
     return category.title()
 
 
-def generate_random_string(length: int = 10, chars: str = string.ascii_letters + string.digits) -> str:
+def generate_random_string(
+    length: int = 10,
+    chars: str = string.ascii_letters + string.digits,
+    rng: Optional[random.Random] = None
+) -> str:
     """
     Generate a random string of specified length.
     
     Args:
         length: Length of the string (default: 10)
         chars: Character set to use (default: alphanumeric)
+        rng: Random generator to draw from (default: global random module)
         
     Returns:
         Random string
     """
-    return ''.join(random.choices(chars, k=length))
+    rng = rng or random
+    return ''.join(rng.choices(chars, k=length))
 
 
-def generate_valid_password() -> str:
+def generate_valid_password(rng: Optional[random.Random] = None) -> str:
     """
     Generate a valid password meeting requirements:
     - Minimum 8 characters
     - Contains uppercase, lowercase, number, and special character
     
+    Args:
+        rng: Random generator to draw from (default: global random module)
+    
     Returns:
         Valid password string
     """
+    rng = rng or random
+    
     # Ensure we meet all requirements
-    uppercase = random.choice(string.ascii_uppercase)
-    lowercase = random.choice(string.ascii_lowercase)
-    digit = random.choice(string.digits)
-    special = random.choice("!@#$%^&*")
+    uppercase = rng.choice(string.ascii_uppercase)
+    lowercase = rng.choice(string.ascii_lowercase)
+    digit = rng.choice(string.digits)
+    special = rng.choice("!@#$%^&*")
     
     # Fill remaining length with random characters
     remaining_length = 8 - 4  # Minimum 8, we have 4 already
-    remaining = ''.join(random.choices(string.ascii_letters + string.digits + "!@#$%^&*", k=remaining_length))
+    remaining = ''.join(rng.choices(string.ascii_letters + string.digits + "!@#$%^&*", k=remaining_length))
     
     # Shuffle all characters
     password_chars = list(uppercase + lowercase + digit + special + remaining)
-    random.shuffle(password_chars)
+    rng.shuffle(password_chars)
     
     return ''.join(password_chars)
 
@@ -185,23 +229,26 @@ def get_price_range_for_category(category: str) -> Tuple[float, float]:
     return price_ranges.get(category, (0.01, 999999.99))
 
 
-def generate_valid_price(category: Optional[str] = None) -> float:
+def generate_valid_price(category: Optional[str] = None, rng: Optional[random.Random] = None) -> float:
     """
     Generate a valid price within the range for the category.
     
     Args:
         category: Optional category to determine price range
+        rng: Random generator to draw from (default: global random module)
         
     Returns:
         Valid price (rounded to 2 decimal places)
     """
+    rng = rng or random
+    
     if category:
         min_price, max_price = get_price_range_for_category(category)
     else:
         min_price, max_price = (0.01, 999999.99)
     
     # Generate random price within range
-    price = random.uniform(min_price, max_price)
+    price = rng.uniform(min_price, max_price)
     return round(price, 2)
 
 
@@ -238,3 +285,32 @@ def ensure_min_length(text: str, min_length: int, fill_char: str = "x") -> str:
     
     padding_needed = min_length - len(text)
     return text + (fill_char * padding_needed)
+
+
+def summarize_latencies(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarize latency samples.
+    
+    Args:
+        samples: Durations in seconds
+        
+    Returns:
+        Dictionary with count, avg, p50, p95, p99 and max (seconds)
+    """
+    if not samples:
+        return {"count": 0, "avg": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    
+    ordered = sorted(samples)
+    
+    def percentile(p: float) -> float:
+        index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+        return ordered[index]
+    
+    return {
+        "count": len(ordered),
+        "avg": sum(ordered) / len(ordered),
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "max": ordered[-1]
+    }
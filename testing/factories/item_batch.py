@@ -0,0 +1,231 @@
+"""
+Columnar item batch generator.
+
+Generates the variable fields of many items at once as NumPy arrays
+(prices, weights, dimensions, file sizes, durations) and only builds
+per-item dicts or JSON rows when they are consumed. Meant for load tests
+that need hundreds of thousands of payloads; ItemPayloads.create_batch_items
+remains the simple path for small batches.
+"""
+
+import itertools
+import json
+from typing import Optional, Dict, Any, List, Iterator
+
+from .helpers import (
+    NAME_KEY_ALPHABET,
+    NAME_KEY_LENGTH,
+    NAME_KEY_SPACE,
+    generate_unique_name,
+    get_category_for_item_type,
+    get_price_range_for_category,
+    name_key_offset,
+    normalize_category,
+    truncate_string
+)
+from .seeding import resolve_seed
+from .specs import ItemSpec
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only needed for ItemBatch
+    np = None
+
+ITEM_TYPES = ("PHYSICAL", "DIGITAL", "SERVICE")
+
+# Rows are materialized from Python lists converted chunk by chunk,
+# which is much faster than indexing NumPy arrays element by element
+MATERIALIZE_CHUNK_SIZE = 10000
+
+# Digit lookup for name keys: base-36 place values, most significant first
+if np is not None:
+    _KEY_DIGITS = np.frombuffer(NAME_KEY_ALPHABET.encode("ascii"), dtype="S1")
+    _KEY_POWERS = len(NAME_KEY_ALPHABET) ** np.arange(NAME_KEY_LENGTH - 1, -1, -1, dtype=np.int64)
+
+# Orders default batch streams under Config.SEED
+_batch_counter = itertools.count()
+
+
+class ItemBatch:
+    """Columnar batch of item payloads of a single item type."""
+
+    def __init__(
+        self,
+        count: int,
+        item_type: str = "DIGITAL",
+        category: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        seed: Optional[int] = None,
+        **overrides
+    ):
+        """
+        Generate column arrays for count items.
+
+        Args:
+            count: Number of items
+            item_type: "PHYSICAL", "DIGITAL", or "SERVICE" (default: "DIGITAL")
+            category: Category (default: business-rule category for item_type)
+            name_prefix: Name prefix; item i is named "<key> <prefix>_<i>",
+                         where key is helpers.name_key(i, prefix)
+                         (default: "Test <item_type> <unique ID or seed>")
+            seed: Optional seed for the NumPy generator (default: derived
+                  from Config.SEED; unseeded if Config.SEED is not set)
+            **overrides: Fields set to the same value on every item
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If item_type is invalid
+        """
+        if np is None:
+            raise ImportError(
+                "numpy is required for ItemBatch. "
+                "Install it with 'pip install numpy'"
+            )
+
+        item_type = item_type.upper()
+        if item_type not in ITEM_TYPES:
+            raise ValueError(f"Invalid item_type: {item_type}. Must be PHYSICAL, DIGITAL, or SERVICE")
+
+        self.count = count
+        self.item_type = item_type
+        self.category = normalize_category(category or get_category_for_item_type(item_type))
+        self.seed = resolve_seed(seed, "item_batch", next(_batch_counter))
+        self.overrides = overrides
+
+        if name_prefix is None:
+            suffix = None if self.seed is None else f"{self.seed:016x}"
+            name_prefix = generate_unique_name(f"Test {item_type}", suffix=suffix)
+        self.name_prefix = name_prefix
+        self._key_offset = name_key_offset(name_prefix)
+
+        rng = np.random.default_rng(self.seed)
+
+        # Prices in integer cents so every value has exactly two decimals
+        min_price, max_price = get_price_range_for_category(self.category)
+        self.price_cents = rng.integers(
+            int(round(min_price * 100)), int(round(max_price * 100)), count, endpoint=True
+        )
+
+        self.weights = None
+        self.dimensions = None
+        self.file_sizes = None
+        self.durations = None
+
+        if item_type == "PHYSICAL":
+            self.weights = np.round(rng.uniform(0.1, 50.0, count), 2)
+            self.dimensions = np.round(rng.uniform(1.0, 100.0, (count, 3)), 1)
+        elif item_type == "DIGITAL":
+            self.file_sizes = rng.integers(1024, 100 * 1024 * 1024, count, endpoint=True)
+        else:
+            self.durations = rng.integers(1, 40, count, endpoint=True)
+
+    @property
+    def prices(self) -> "np.ndarray":
+        """Prices as a float array."""
+        return self.price_cents / 100
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Materialize a single item dict."""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("ItemBatch index out of range")
+        return self._rows(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield item dicts one at a time."""
+        for chunk in self.iter_chunks(MATERIALIZE_CHUNK_SIZE):
+            yield from chunk
+
+    def iter_chunks(self, chunk_size: int = 50) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield lists of item dicts, e.g. chunks of 50 for POST /items/batch.
+
+        Args:
+            chunk_size: Items per chunk (default: 50)
+        """
+        for start in range(0, self.count, chunk_size):
+            yield self._rows(start, min(start + chunk_size, self.count))
+
+    def iter_specs(self) -> Iterator[ItemSpec]:
+        """Yield each item as a slotted ItemSpec instead of a dict."""
+        # Built on the same rows as __iter__; each chunk's dicts are dropped once converted
+        for chunk in self.iter_chunks(MATERIALIZE_CHUNK_SIZE):
+            yield from map(ItemSpec.from_dict, chunk)
+
+    def iter_json(self) -> Iterator[str]:
+        """Yield each item serialized as a JSON string."""
+        for item in self:
+            yield json.dumps(item)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Materialize every item (same output shape as create_batch_items)."""
+        return list(self)
+
+    def _name_keys(self, start: int, stop: int) -> List[str]:
+        """helpers.name_key for rows [start, stop), computed as one array."""
+        values = (self._key_offset + np.arange(start, stop, dtype=np.int64)) % NAME_KEY_SPACE
+        digits = values[:, None] // _KEY_POWERS % len(NAME_KEY_ALPHABET)
+        return _KEY_DIGITS[digits].view(f"S{NAME_KEY_LENGTH}").ravel().astype(str).tolist()
+
+    def _rows(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        """Build item dicts for rows [start, stop)."""
+        item_type = self.item_type
+        category = self.category
+        description = f"Test {item_type.lower()} item description for "
+        names = [
+            truncate_string(f"{key} {self.name_prefix}_{index}", 100)
+            for key, index in zip(self._name_keys(start, stop), range(start, stop))
+        ]
+        prices = (self.price_cents[start:stop] / 100).tolist()
+
+        # Names are at most 100 chars, so descriptions stay under the 500 limit
+        if item_type == "PHYSICAL":
+            rows = [
+                {
+                    "name": name,
+                    "description": description + name,
+                    "item_type": item_type,
+                    "price": price,
+                    "category": category,
+                    "weight": weight,
+                    "dimensions": {"length": length, "width": width, "height": height}
+                }
+                for name, price, weight, (length, width, height) in zip(
+                    names, prices, self.weights[start:stop].tolist(), self.dimensions[start:stop].tolist()
+                )
+            ]
+        elif item_type == "DIGITAL":
+            rows = [
+                {
+                    "name": name,
+                    "description": description + name,
+                    "item_type": item_type,
+                    "price": price,
+                    "category": category,
+                    "download_url": "https://example.com/download",
+                    "file_size": file_size
+                }
+                for name, price, file_size in zip(names, prices, self.file_sizes[start:stop].tolist())
+            ]
+        else:
+            rows = [
+                {
+                    "name": name,
+                    "description": description + name,
+                    "item_type": item_type,
+                    "price": price,
+                    "category": category,
+                    "duration_hours": duration_hours
+                }
+                for name, price, duration_hours in zip(names, prices, self.durations[start:stop].tolist())
+            ]
+
+        if self.overrides:
+            for row in rows:
+                row.update(self.overrides)
+
+        return rows
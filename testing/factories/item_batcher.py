@@ -0,0 +1,156 @@
+"""
+Item batcher for coalescing item creation requests.
+
+Collects single item creations and sends them as POST /items/batch
+requests, either when a batch is full or after a short linger window.
+Each caller gets back its own created item or error.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Tuple
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# Backend limit for POST /items/batch (itemController.createItemsBatch)
+MAX_BATCH_SIZE = 50
+
+
+class ItemBatcher:
+    """Coalesces item creations into POST /items/batch requests."""
+
+    def __init__(
+        self,
+        factory,
+        linger: Optional[float] = None,
+        max_batch_size: Optional[int] = None
+    ):
+        """
+        Initialize ItemBatcher and start its flush thread.
+
+        Args:
+            factory: ItemFactory used to send batch requests
+            linger: Seconds to wait for more items before flushing
+                    (default: Config.ITEM_BATCH_LINGER_MS)
+            max_batch_size: Items per request, capped at 50
+                            (default: Config.ITEM_BATCH_MAX_SIZE)
+        """
+        self.factory = factory
+        self.linger = Config.ITEM_BATCH_LINGER_MS / 1000 if linger is None else linger
+        self.max_batch_size = min(max_batch_size or Config.ITEM_BATCH_MAX_SIZE, MAX_BATCH_SIZE)
+
+        # Batches are per token: /items/batch creates items for the caller's user
+        self._pending: Dict[str, List[Tuple[Dict[str, Any], Future]]] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="item-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, item_data: Dict[str, Any], token: str) -> Future:
+        """
+        Queue an item for creation.
+
+        Args:
+            item_data: Item data dictionary
+            token: JWT access token of the item owner
+
+        Returns:
+            Future resolving to the created item, or raising ValueError
+            if the backend rejected it
+
+        Raises:
+            RuntimeError: If the batcher is closed
+        """
+        future = Future()
+        batch = None
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ItemBatcher is closed")
+
+            pending = self._pending.setdefault(token, [])
+            pending.append((item_data, future))
+
+            if len(pending) >= self.max_batch_size:
+                batch = self._take(token)
+            elif len(pending) == 1:
+                self._deadlines[token] = time.monotonic() + self.linger
+                self._cond.notify()
+
+        # Full batches are sent by the submitting thread
+        if batch:
+            self._send(token, batch)
+
+        return future
+
+    def flush(self):
+        """Send all pending items immediately."""
+        with self._cond:
+            batches = [(token, self._take(token)) for token in list(self._pending)]
+
+        for token, batch in batches:
+            self._send(token, batch)
+
+    def close(self):
+        """Flush pending items and stop the flush thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    def _take(self, token: str) -> List[Tuple[Dict[str, Any], Future]]:
+        """Remove and return the pending batch for a token (caller holds lock)."""
+        self._deadlines.pop(token, None)
+        return self._pending.pop(token, [])
+
+    def _run(self):
+        """Flush batches whose linger window has expired."""
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+
+                    now = time.monotonic()
+                    due = [token for token, deadline in self._deadlines.items() if deadline <= now]
+                    if due:
+                        batches = [(token, self._take(token)) for token in due]
+                        break
+
+                    timeout = min(self._deadlines.values()) - now if self._deadlines else None
+                    self._cond.wait(timeout)
+
+            for token, batch in batches:
+                self._send(token, batch)
+
+    def _send(self, token: str, batch: List[Tuple[Dict[str, Any], Future]]):
+        """Send one batch request and resolve each caller's future."""
+        try:
+            result = self.factory.create_items_batch([item_data for item_data, _ in batch], token)
+        except Exception as e:
+            logger.warning(f"Batch of {len(batch)} items failed: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        results_by_index = {entry.get("index"): entry for entry in result.get("results", [])}
+
+        for index, (item_data, future) in enumerate(batch):
+            entry = results_by_index.get(index)
+            if entry and entry.get("status") == "created":
+                future.set_result({**item_data, "_id": entry.get("item_id")})
+            else:
+                reason = entry.get("reason") if entry else "Missing from batch response"
+                future.set_exception(ValueError(f"Failed to create item: {reason}"))
+
+        logger.debug(
+            f"Batch sent: {result.get('created', 0)} created, "
+            f"{result.get('failed', 0)} failed"
+        )
@@ -5,413 +5,902 @@ Provides methods to create items of different types (PHYSICAL, DIGITAL, SERVICE)
 with valid schemas, business rules enforcement, and batch operations.
 """
 
+import itertools
 import logging
-from typing import Optional, Dict, Any, List
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, Dict, Any, List, Tuple, Iterator, Iterable, Callable, Union
+
+import requests
 
 from .base_factory import BaseFactory
 from .config import Config
-from .helpers import (
-    generate_unique_name,
-    get_category_for_item_type,
-    get_price_range_for_category,
-    generate_valid_price,
-    normalize_category,
-    ensure_min_length,
-    truncate_string
-)
+from .item_payloads import ItemPayloads
+from .item_batcher import ItemBatcher, MAX_BATCH_SIZE
+from .cleanup_ledger import cleanup_ledger
+from .helpers import validate_object_id
+from .item_validator import check_item, validate_items
+from .specs import ItemSpec, ITEM_FIELDS
 
 logger = logging.getLogger(__name__)
 
+# POST /items/check-exists accepts at most 100 items
+MAX_CHECK_SIZE = 100
+
+
+def _as_dict(item: Union[Dict[str, Any], ItemSpec]) -> Dict[str, Any]:
+    """Item data dictionary for an item dict or ItemSpec."""
+    return item.to_dict() if isinstance(item, ItemSpec) else item
+
+
+def _field(item: Union[Dict[str, Any], ItemSpec], key: str) -> Any:
+    """Read one field of an item dict or ItemSpec (None if absent)."""
+    if isinstance(item, ItemSpec):
+        return getattr(item, key) if key in ITEM_FIELDS else (item.extra or {}).get(key)
+    return item.get(key)
+
+
+def _exists_query(items: List[Union[Dict[str, Any], ItemSpec]]) -> Dict[str, Any]:
+    """POST /items/check-exists body: name and category of each item."""
+    return {"items": [{"name": _field(item, "name"), "category": _field(item, "category")} for item in items]}
+
+
+def _record_existing(results: List[Dict[str, Any]], found: Dict[int, str]) -> bool:
+    """Store IDs of items check-exists found in found by index; True if none exist."""
+    for index, match in enumerate(results):
+        if match.get("exists") and match.get("item_id"):
+            found[index] = match["item_id"]
+    return not found
+
+
+def _seed_done(status: Dict[str, Any], min_items: Optional[int]) -> bool:
+    """Whether a seed-status response satisfies the requested item count."""
+    if min_items is not None:
+        return status.get("total_items", 0) >= min_items
+    return bool(status.get("seed_complete"))
 
-class ItemFactory(BaseFactory):
-    """Factory for creating test items."""
+
+class ItemFactory(ItemPayloads, BaseFactory):
+    """Factory for creating test items (payload builders come from ItemPayloads)."""
+    
+    # A batcher owns a sender thread; an unpickled factory sends unbatched
+    _UNPICKLED_ATTRIBUTES = BaseFactory._UNPICKLED_ATTRIBUTES + ("_batcher",)
     
-    def __init__(self, base_url: Optional[str] = None, timeout: Optional[int] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        seed: Optional[int] = None
+    ):
         """
         Initialize ItemFactory.
         
         Args:
             base_url: Optional base URL override
             timeout: Optional timeout override
+            seed: Optional payload seed (default: derived from Config.SEED)
         """
-        super().__init__(base_url, timeout)
+        BaseFactory.__init__(self, base_url, timeout)
+        ItemPayloads.__init__(self, seed)
+        self._batcher: Optional[ItemBatcher] = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = BaseFactory.__getstate__(self)
+        # itertools.count is not picklable on newer Pythons; keep its position
+        state["_name_counter"] = next(self._name_counter)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        BaseFactory.__setstate__(self, state)
+        self._name_counter = itertools.count(self._name_counter)
+    
+    def _after_fork(self) -> None:
+        """Also drop the batcher: its sender thread does not exist in a child process."""
+        super()._after_fork()
+        self._batcher = None
     
-    def create_physical_item(
+    def create_item_via_api(
         self,
-        name: Optional[str] = None,
-        description: Optional[str] = None,
-        category: Optional[str] = None,
-        price: Optional[float] = None,
-        weight: Optional[float] = None,
-        dimensions: Optional[Dict[str, float]] = None,
-        tags: Optional[List[str]] = None,
-        embed_url: Optional[str] = None,
-        **overrides
+        item_data: Dict[str, Any],
+        token: str,
+        validate: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
-        Create a PHYSICAL item with valid schema.
+        Create item via API endpoint.
         
-        Required fields for PHYSICAL:
-        - name (3-100 chars)
-        - description (10-500 chars)
-        - item_type: "PHYSICAL"
-        - price (0.01-999999.99)
-        - category (1-50 chars)
-        - weight (> 0)
-        - dimensions: {length, width, height} (all > 0)
+        When batching is enabled (see enable_batching), the item is sent
+        through POST /items/batch together with other pending items, and
+        the returned dict is item_data plus the created "_id".
+        
+        After a 5xx or dropped connection the item is resent only if
+        POST /items/check-exists shows it was not created; if it was, the
+        created item is fetched and returned instead of a duplicate.
         
         Args:
-            name: Item name (default: auto-generated unique name)
-            description: Item description (default: auto-generated, min 10 chars)
-            category: Category (default: "Electronics" for PHYSICAL)
-            price: Price (default: valid price for category)
-            weight: Weight in kg (default: 1.0)
-            dimensions: Dict with length, width, height (default: {10, 5, 2})
-            tags: Optional tags array (max 10, each 1-30 chars)
-            embed_url: Optional embed URL
-            **overrides: Additional fields to override
+            item_data: Item data dictionary or ItemSpec
+            token: JWT access token
+            validate: Check the payload client-side before sending
+                      (default: Config.ITEM_PREFLIGHT_VALIDATION)
             
         Returns:
-            Dictionary with item data ready for API request
+            API response with created item
+            
+        Raises:
+            ItemValidationError: If pre-flight validation rejects the item
+            requests.HTTPError: If creation fails
+            ValueError: If response is invalid
         """
-        # Generate unique name if not provided
-        if name is None:
-            name = generate_unique_name("Test Physical")
+        if self._should_validate(validate):
+            check_item(_as_dict(item_data))
+        
+        self._check_pid()
+        if self._batcher is not None:
+            # The batcher returns the payload dict plus the created _id
+            return self._batcher.submit(_as_dict(item_data), token).result()
         
-        # Generate description if not provided
-        if description is None:
-            description = ensure_min_length(
-                f"Test physical item description for {name}",
-                10
+        headers = Config.get_auth_headers(token)
+        found: Dict[int, str] = {}
+        try:
+            response = self.post(
+                "/items",
+                json_data=item_data,
+                headers=headers,
+                safe_to_retry=self._not_yet_created([item_data], token, found)
             )
+        except requests.RequestException:
+            if not found:
+                raise
+            # The failed attempt was applied; use the item it created
+            return self._recover_item(found[0], token)
         
-        # Use Electronics category for PHYSICAL (business rule)
-        if category is None:
-            category = "Electronics"
+        if response.status_code != 201:
+            raise ValueError(f"Failed to create item: {response.text}")
         
-        # Generate valid price for category
-        if price is None:
-            price = generate_valid_price(category)
+        result = self.codec.decode(response.content)
+        created_item = result.get("data", {})
         
-        # Default weight
-        if weight is None:
-            weight = 1.0
+        if created_item.get("_id"):
+            cleanup_ledger.record_item(created_item["_id"], token)
         
-        # Default dimensions
-        if dimensions is None:
-            dimensions = {
-                "length": 10.0,
-                "width": 5.0,
-                "height": 2.0
-            }
+        return created_item
+    
+    def submit_item_via_api(
+        self,
+        item_data: Union[Dict[str, Any], ItemSpec],
+        token: str,
+        validate: Optional[bool] = None
+    ) -> Future:
+        """
+        Queue item creation without waiting for the result.
+        
+        Lets a single thread fill batches: submit many items, then call
+        result() on the returned futures. Without batching enabled the item
+        is created immediately and a completed future is returned.
+        
+        Args:
+            item_data: Item data dictionary or ItemSpec
+            token: JWT access token
+            validate: Check the payload client-side before queueing
+                      (default: Config.ITEM_PREFLIGHT_VALIDATION)
+            
+        Returns:
+            Future resolving to the created item
+        """
+        future = Future()
+        
+        self._check_pid()
+        if self._batcher is not None:
+            item_data = _as_dict(item_data)
+            try:
+                if self._should_validate(validate):
+                    check_item(item_data)
+            except ValueError as e:
+                future.set_exception(e)
+                return future
+            return self._batcher.submit(item_data, token)
+        
+        try:
+            future.set_result(self.create_item_via_api(item_data, token, validate=validate))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def create_items_batch(
+        self,
+        items: List[Dict[str, Any]],
+        token: str,
+        skip_existing: bool = False,
+        validate: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Create up to 50 items in one request via POST /items/batch.
         
-        # Build item data
-        item_data = {
-            "name": truncate_string(name, 100),
-            "description": truncate_string(description, 500),
-            "item_type": "PHYSICAL",
-            "price": round(price, 2),
-            "category": normalize_category(category),
-            "weight": weight,
-            "dimensions": dimensions
-        }
+        With validation enabled, items the backend would reject are reported
+        as failed without being sent; the request carries only valid items.
+        
+        The backend creates batch items one by one, so a failed request may
+        have created some of them. After a 5xx or dropped connection the
+        items are checked via POST /items/check-exists: items found are
+        reported as created and only the rest are resent. (An item that
+        existed before the request is indistinguishable from one the failed
+        attempt created, and is also reported as created.)
+        
+        Args:
+            items: List of item data dictionaries or ItemSpecs (max 50)
+            token: JWT access token
+            skip_existing: Report duplicates as skipped instead of failed
+            validate: Check payloads client-side before sending
+                      (default: Config.ITEM_PREFLIGHT_VALIDATION)
+            
+        Returns:
+            Batch result:
+            {
+                "created": count,
+                "skipped": count,
+                "failed": count,
+                "results": [{"index", "name", "status", "item_id", "reason"}],
+                "errors": [...]
+            }
+            
+        Raises:
+            ValueError: If more than 50 items are given or response is invalid
+            requests.HTTPError: If request fails
+        """
+        if len(items) > MAX_BATCH_SIZE:
+            raise ValueError(f"Maximum {MAX_BATCH_SIZE} items allowed per batch request, got {len(items)}")
         
-        # Add optional fields
-        if tags is not None:
-            item_data["tags"] = tags[:10]  # Max 10 tags
+        # ItemSpecs are encoded by the codec as they are sent
+        invalid = validate_items([_as_dict(item) for item in items]) if self._should_validate(validate) else {}
+        sent_indexes = [index for index in range(len(items)) if index not in invalid]
         
-        if embed_url is not None:
-            item_data["embed_url"] = embed_url
+        if sent_indexes:
+            result = self._post_batch([items[index] for index in sent_indexes], token, skip_existing)
+        else:
+            result = {"created": 0, "skipped": 0, "failed": 0, "results": [], "errors": []}
         
-        # Apply overrides
-        item_data.update(overrides)
+        if invalid:
+            # Map indexes of sent items back to positions in the caller's list
+            for entry in result.get("results", []):
+                if isinstance(entry.get("index"), int) and entry["index"] < len(sent_indexes):
+                    entry["index"] = sent_indexes[entry["index"]]
+            
+            result["results"] = sorted(
+                result.get("results", []) + [
+                    {
+                        "index": index,
+                        "name": _field(items[index], "name"),
+                        "status": "failed",
+                        "reason": "; ".join(error["message"] for error in errors)
+                    }
+                    for index, errors in invalid.items()
+                ],
+                key=lambda entry: entry.get("index", 0)
+            )
+            result["failed"] = result.get("failed", 0) + len(invalid)
+            logger.info(f"Pre-flight validation rejected {len(invalid)} of {len(items)} items")
         
-        return item_data
+        return result
     
-    def create_digital_item(
+    def send_items(
         self,
-        name: Optional[str] = None,
-        description: Optional[str] = None,
-        category: Optional[str] = None,
-        price: Optional[float] = None,
-        download_url: Optional[str] = None,
-        file_size: Optional[int] = None,
-        tags: Optional[List[str]] = None,
-        embed_url: Optional[str] = None,
-        **overrides
+        items: Iterable[Dict[str, Any]],
+        token: str,
+        use_batch: bool = True,
+        batch_size: int = MAX_BATCH_SIZE,
+        workers: Optional[int] = None,
+        skip_existing: bool = False,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+        validate: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
-        Create a DIGITAL item with valid schema.
+        Stream items to the API while they are being generated.
         
-        Required fields for DIGITAL:
-        - name (3-100 chars)
-        - description (10-500 chars)
-        - item_type: "DIGITAL"
-        - price (0.01-999999.99)
-        - category (1-50 chars)
-        - download_url (valid URL)
-        - file_size (>= 1)
+        Items are pulled from the iterable only as requests complete: at
+        most 2 * workers requests are queued or in flight, so memory use
+        does not depend on how many items the iterable produces. Works with
+        iter_batch_items, ItemBatch or any other iterable of item dicts.
         
         Args:
-            name: Item name (default: auto-generated unique name)
-            description: Item description (default: auto-generated, min 10 chars)
-            category: Category (default: "Software" for DIGITAL)
-            price: Price (default: valid price for category)
-            download_url: Download URL (default: "https://example.com/download")
-            file_size: File size in bytes (default: 1024)
-            tags: Optional tags array (max 10, each 1-30 chars)
-            embed_url: Optional embed URL
-            **overrides: Additional fields to override
+            items: Iterable of item data dictionaries or ItemSpecs
+            token: JWT access token
+            use_batch: Send chunks via POST /items/batch (default: True);
+                       otherwise one POST /items per item
+            batch_size: Items per batch request, max 50 (default: 50)
+            workers: Concurrent requests (default: Config.ITEM_SEND_WORKERS)
+            skip_existing: Report duplicates as skipped (batch mode only)
+            on_result: Optional callback receiving each batch result, or
+                       {"item": created_item} / {"item_data", "error"} per item
+            validate: Check payloads client-side and count rejected items as
+                      failed without sending them
+                      (default: Config.ITEM_PREFLIGHT_VALIDATION)
             
         Returns:
-            Dictionary with item data ready for API request
+            Dictionary with totals:
+            {
+                "created": count,
+                "skipped": count,
+                "failed": count,
+                "errors": [{"name", "reason"}, ...]
+            }
         """
-        # Generate unique name if not provided
-        if name is None:
-            name = generate_unique_name("Test Digital")
+        workers = workers or Config.ITEM_SEND_WORKERS
+        summary = {"created": 0, "skipped": 0, "failed": 0, "errors": []}
+        items = iter(items)
+        
+        if use_batch:
+            if batch_size > MAX_BATCH_SIZE:
+                raise ValueError(f"Maximum {MAX_BATCH_SIZE} items allowed per batch request, got {batch_size}")
+            units = iter(lambda: list(islice(items, batch_size)), [])
+            send = lambda chunk: self._send_chunk(chunk, token, skip_existing, validate)
+        else:
+            units = items
+            send = lambda item_data: self._send_one(item_data, token, validate)
+        
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for unit in units:
+                if len(pending) >= workers * 2:
+                    self._collect_sent(pending.popleft().result(), summary, on_result)
+                pending.append(executor.submit(send, unit))
+            
+            while pending:
+                self._collect_sent(pending.popleft().result(), summary, on_result)
         
-        # Generate description if not provided
-        if description is None:
-            description = ensure_min_length(
-                f"Test digital item description for {name}",
-                10
+        logger.info(
+            f"Sent items: {summary['created']} created, {summary['skipped']} skipped, "
+            f"{summary['failed']} failed"
+        )
+        
+        return summary
+    
+    def _send_chunk(
+        self,
+        chunk: List[Dict[str, Any]],
+        token: str,
+        skip_existing: bool,
+        validate: Optional[bool]
+    ) -> Dict[str, Any]:
+        """Send one chunk via /items/batch; request errors fail the whole chunk."""
+        try:
+            return self.create_items_batch(chunk, token, skip_existing=skip_existing, validate=validate)
+        except Exception as e:
+            return {
+                "created": 0,
+                "skipped": 0,
+                "failed": len(chunk),
+                "results": [
+                    {"index": i, "name": _field(item, "name"), "status": "failed", "reason": str(e)}
+                    for i, item in enumerate(chunk)
+                ]
+            }
+    
+    def _send_one(self, item_data: Dict[str, Any], token: str, validate: Optional[bool]) -> Dict[str, Any]:
+        """Send one item via POST /items, capturing the error instead of raising."""
+        try:
+            return {"item": self.create_item_via_api(item_data, token, validate=validate)}
+        except Exception as e:
+            return {"item_data": item_data, "error": str(e)}
+    
+    def _post_batch(self, items: List[Dict[str, Any]], token: str, skip_existing: bool) -> Dict[str, Any]:
+        """POST items to /items/batch, recovering from a partially applied request."""
+        headers = Config.get_auth_headers(token)
+        found: Dict[int, str] = {}
+        try:
+            response = self.post(
+                "/items/batch",
+                json_data={"items": items, "skip_existing": skip_existing},
+                headers=headers,
+                safe_to_retry=self._not_yet_created(items, token, found)
             )
+            result = self._handle_response(response, expected_status=200)
+        except requests.RequestException:
+            if not found:
+                raise
+            return self._recover_batch(items, token, skip_existing, found)
         
-        # Use Software category for DIGITAL (business rule)
-        if category is None:
-            category = "Software"
+        for entry in result.get("results", []):
+            if entry.get("status") == "created" and entry.get("item_id"):
+                cleanup_ledger.record_item(entry["item_id"], token)
         
-        # Generate valid price for category
-        if price is None:
-            price = generate_valid_price(category)
+        return result
+    
+    def _recover_batch(
+        self,
+        items: List[Dict[str, Any]],
+        token: str,
+        skip_existing: bool,
+        found: Dict[int, str]
+    ) -> Dict[str, Any]:
+        """Report items a failed batch request created, and send the rest again."""
+        logger.warning(
+            f"Batch request failed after creating {len(found)} of {len(items)} items; sending the rest"
+        )
+        missing = [index for index in range(len(items)) if index not in found]
+        if missing:
+            result = self._post_batch([items[index] for index in missing], token, skip_existing)
+        else:
+            result = {"created": 0, "skipped": 0, "failed": 0, "results": [], "errors": []}
         
-        # Default download URL
-        if download_url is None:
-            download_url = "https://example.com/download"
+        for entry in result.get("results", []):
+            if isinstance(entry.get("index"), int) and entry["index"] < len(missing):
+                entry["index"] = missing[entry["index"]]
         
-        # Default file size
-        if file_size is None:
-            file_size = 1024
+        for index, item_id in found.items():
+            cleanup_ledger.record_item(item_id, token)
+            result["results"].append(
+                {"index": index, "name": _field(items[index], "name"), "status": "created", "item_id": item_id}
+            )
+        result["results"].sort(key=lambda entry: entry.get("index", 0))
+        result["created"] = result.get("created", 0) + len(found)
+        return result
+    
+    def _not_yet_created(
+        self,
+        items: List[Dict[str, Any]],
+        token: str,
+        found: Dict[int, str]
+    ) -> Callable[[], bool]:
+        """
+        Build the safe_to_retry check for an item create request.
         
-        # Build item data
-        item_data = {
-            "name": truncate_string(name, 100),
-            "description": truncate_string(description, 500),
-            "item_type": "DIGITAL",
-            "price": round(price, 2),
-            "category": normalize_category(category),
-            "download_url": download_url,
-            "file_size": file_size
-        }
+        The check passes when none of the items exists yet; IDs of items
+        that do exist are stored in found by index.
+        """
+        def check() -> bool:
+            return _record_existing(self.check_items_exist(items, token), found)
         
-        # Add optional fields
-        if tags is not None:
-            item_data["tags"] = tags[:10]  # Max 10 tags
+        return check
+    
+    def _recover_item(self, item_id: str, token: str) -> Dict[str, Any]:
+        """Fetch an item a failed create request turned out to have created."""
+        logger.warning(f"Create request failed after creating item {item_id}; using it")
+        cleanup_ledger.record_item(item_id, token)
+        response = self.get(f"/items/{item_id}", headers=Config.get_auth_headers(token))
+        return self._handle_response(response, expected_status=200).get("data", {})
+    
+    @staticmethod
+    def _should_validate(validate: Optional[bool]) -> bool:
+        """Resolve per-call validate flag against Config.ITEM_PREFLIGHT_VALIDATION."""
+        return Config.ITEM_PREFLIGHT_VALIDATION if validate is None else validate
+    
+    @staticmethod
+    def _collect_sent(
+        result: Dict[str, Any],
+        summary: Dict[str, Any],
+        on_result: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> None:
+        """Add a batch or single-item send result to the summary."""
+        if "results" in result:
+            summary["created"] += result.get("created", 0)
+            summary["skipped"] += result.get("skipped", 0)
+            summary["failed"] += result.get("failed", 0)
+            summary["errors"].extend(
+                {"name": entry.get("name"), "reason": entry.get("reason")}
+                for entry in result["results"]
+                if entry.get("status") == "failed"
+            )
+        elif "error" in result:
+            summary["failed"] += 1
+            summary["errors"].append({"name": _field(result["item_data"], "name"), "reason": result["error"]})
+        else:
+            summary["created"] += 1
         
-        if embed_url is not None:
-            item_data["embed_url"] = embed_url
+        if on_result:
+            on_result(result)
+    
+    def check_items_exist(
+        self,
+        items: List[Dict[str, Any]],
+        token: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Check which items already exist via POST /items/check-exists.
+        
+        Items match on name and category (case-insensitive, active items
+        only, own items unless the user is ADMIN or VIEWER).
         
-        # Apply overrides
-        item_data.update(overrides)
+        Args:
+            items: List of item data dictionaries or ItemSpecs (max 100);
+                   only "name" and "category" are sent
+            token: JWT access token
+            
+        Returns:
+            List of {"name", "category", "exists", "item_id"} in input order
+            
+        Raises:
+            ValueError: If more than 100 items are given or response is invalid
+            requests.HTTPError: If request fails
+        """
+        if len(items) > MAX_CHECK_SIZE:
+            raise ValueError(f"Maximum {MAX_CHECK_SIZE} items allowed per check request, got {len(items)}")
         
-        return item_data
+        headers = Config.get_auth_headers(token)
+        response = self.post(
+            "/items/check-exists",
+            json_data=_exists_query(items),
+            headers=headers,
+            safe_to_retry=True
+        )
+        
+        result = self._handle_response(response, expected_status=200)
+        return result.get("results", [])
     
-    def create_service_item(
+    def ensure_items(
         self,
-        name: Optional[str] = None,
-        description: Optional[str] = None,
-        category: Optional[str] = None,
-        price: Optional[float] = None,
-        duration_hours: Optional[int] = None,
-        tags: Optional[List[str]] = None,
-        embed_url: Optional[str] = None,
-        **overrides
+        spec: Iterable[Dict[str, Any]],
+        token: str,
+        batch_size: int = MAX_BATCH_SIZE,
+        workers: Optional[int] = None,
+        validate: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
-        Create a SERVICE item with valid schema.
+        Make sure every item in spec exists, creating only the missing ones.
         
-        Required fields for SERVICE:
-        - name (3-100 chars)
-        - description (10-500 chars)
-        - item_type: "SERVICE"
-        - price (0.01-999999.99)
-        - category (1-50 chars)
-        - duration_hours (>= 1, integer)
+        Checks the spec in chunks of 100 via POST /items/check-exists and
+        streams the missing items to POST /items/batch (skip_existing, so
+        items created concurrently are skipped rather than failed). Re-running
+        a seed against a populated environment only costs the existence
+        checks.
         
         Args:
-            name: Item name (default: auto-generated unique name)
-            description: Item description (default: auto-generated, min 10 chars)
-            category: Category (default: "Services" for SERVICE)
-            price: Price (default: valid price for category)
-            duration_hours: Duration in hours (default: 1)
-            tags: Optional tags array (max 10, each 1-30 chars)
-            embed_url: Optional embed URL
-            **overrides: Additional fields to override
+            spec: Iterable of item data dictionaries or ItemSpecs whose
+                  names are stable across runs (e.g. iter_batch_items, or
+                  ItemBatch with a fixed name_prefix)
+            token: JWT access token
+            batch_size: Items per batch request, max 50 (default: 50)
+            workers: Concurrent batch requests (default: Config.ITEM_SEND_WORKERS)
+            validate: Check missing items client-side before sending
+                      (default: Config.ITEM_PREFLIGHT_VALIDATION)
             
         Returns:
-            Dictionary with item data ready for API request
+            Dictionary with totals:
+            {
+                "created": count,
+                "skipped": count,  # already existed
+                "failed": count,
+                "errors": [{"name", "reason"}, ...]
+            }
         """
-        # Generate unique name if not provided
-        if name is None:
-            name = generate_unique_name("Test Service")
-        
-        # Generate description if not provided
-        if description is None:
-            description = ensure_min_length(
-                f"Test service item description for {name}",
-                10
-            )
-        
-        # Use Services category for SERVICE (business rule)
-        if category is None:
-            category = "Services"
+        existing = 0
+        spec = iter(spec)
+        
+        def missing_items() -> Iterator[Dict[str, Any]]:
+            nonlocal existing
+            for chunk in iter(lambda: list(islice(spec, MAX_CHECK_SIZE)), []):
+                results = self.check_items_exist(chunk, token)
+                if len(results) != len(chunk):
+                    raise ValueError(f"Expected {len(chunk)} check-exists results, got {len(results)}")
+                for item_data, result in zip(chunk, results):
+                    if result.get("exists"):
+                        existing += 1
+                    else:
+                        yield item_data
+        
+        summary = self.send_items(
+            missing_items(),
+            token,
+            batch_size=batch_size,
+            workers=workers,
+            skip_existing=True,
+            validate=validate
+        )
+        summary["skipped"] += existing
+        
+        logger.info(
+            f"Ensured items: {summary['created']} created, {summary['skipped']} already existed, "
+            f"{summary['failed']} failed"
+        )
+        
+        return summary
+    
+    def seed_items(self, user_id: str, count: int = 10) -> Dict[str, Any]:
+        """
+        Insert items for a user directly in the database via POST /internal/seed.
         
-        # Generate valid price for category
-        if price is None:
-            price = generate_valid_price(category)
+        One request regardless of count; items skip the HTTP validation
+        middleware and are inserted with insertMany (DIGITAL items named
+        "Auto Item <timestamp> <n>").
         
-        # Default duration
-        if duration_hours is None:
-            duration_hours = 1
+        The items are not tagged "seed", so seed-status does not count
+        them; use wait_for_item_count() with the owner's token to wait
+        for them.
         
-        # Build item data
-        item_data = {
-            "name": truncate_string(name, 100),
-            "description": truncate_string(description, 500),
-            "item_type": "SERVICE",
-            "price": round(price, 2),
-            "category": normalize_category(category),
-            "duration_hours": duration_hours
-        }
+        Args:
+            user_id: Owner user ID (ObjectId format)
+            count: Number of items to insert (default: 10)
+            
+        Returns:
+            Dictionary with seed result:
+            {
+                "message": "Successfully seeded N items",
+                "count": N
+            }
+            
+        Raises:
+            ValueError: If user_id is invalid or response is invalid
+            requests.HTTPError: If seeding fails
+        """
+        if not validate_object_id(user_id):
+            raise ValueError(
+                f"Invalid user ID format: {user_id}. "
+                "Expected 24-character hexadecimal string."
+            )
         
-        # Add optional fields
-        if tags is not None:
-            item_data["tags"] = tags[:10]  # Max 10 tags
+        logger.info(f"Seeding {count} items for user: {user_id}")
         
-        if embed_url is not None:
-            item_data["embed_url"] = embed_url
+        headers = Config.get_internal_headers()
+        response = self.post(
+            "/internal/seed",
+            json_data={"userId": user_id, "count": count},
+            headers=headers
+        )
         
-        # Apply overrides
-        item_data.update(overrides)
+        result = self._handle_response(response, expected_status=201)
+        cleanup_ledger.record("user_items", user_id)
         
-        return item_data
+        return result.get("data", {})
     
-    def create_item(
+    def get_seed_status(
         self,
-        item_type: str,
-        **kwargs
+        user_id: str,
+        token: str,
+        seed_version: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Generic method to create item of any type.
+        Get seed status for a user via GET /items/seed-status/:userId.
+        
+        The backend counts the user's active items tagged "seed" (and
+        seed_version, if given).
         
         Args:
-            item_type: Item type - "PHYSICAL", "DIGITAL", or "SERVICE"
-            **kwargs: Arguments passed to specific create method
+            user_id: User ID to check
+            token: JWT access token
+            seed_version: Optional seed version tag
             
         Returns:
-            Dictionary with item data ready for API request
+            Dictionary with seed status:
+            {
+                "seed_complete": bool,
+                "total_items": count,
+                "required_count": count,
+                "missing_items": [],
+                "seed_version": str or None
+            }
         """
-        item_type = item_type.upper()
+        headers = Config.get_auth_headers(token)
+        params = {"seed_version": seed_version} if seed_version else None
+        response = self.get(f"/items/seed-status/{user_id}", headers=headers, params=params)
         
-        if item_type == "PHYSICAL":
-            return self.create_physical_item(**kwargs)
-        elif item_type == "DIGITAL":
-            return self.create_digital_item(**kwargs)
-        elif item_type == "SERVICE":
-            return self.create_service_item(**kwargs)
-        else:
-            raise ValueError(f"Invalid item_type: {item_type}. Must be PHYSICAL, DIGITAL, or SERVICE")
+        return self._handle_response(response, expected_status=200)
     
-    def create_item_with_tags(
+    def wait_until_seeded(
         self,
-        tags: List[str],
-        item_type: str = "DIGITAL",
-        **kwargs
+        user_id: str,
+        token: str,
+        timeout: Optional[float] = None,
+        min_items: Optional[int] = None,
+        seed_version: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Create item with tags.
+        Poll seed status with exponential backoff until seeding is complete.
+        
+        Only items tagged "seed" count (see get_seed_status), so this waits
+        for tag-based seed sets, not for items inserted by seed_items().
         
         Args:
-            tags: List of tags (max 10, each 1-30 chars)
-            item_type: Item type (default: "DIGITAL")
-            **kwargs: Additional arguments
+            user_id: User ID to check
+            token: JWT access token
+            timeout: Max seconds to wait (default: Config.SEED_WAIT_TIMEOUT)
+            min_items: Wait for at least this many seed items instead of the
+                       backend's required_count
+            seed_version: Optional seed version tag
             
         Returns:
-            Dictionary with item data
+            Last seed status dictionary
+            
+        Raises:
+            TimeoutError: If seeding is not complete within timeout
         """
-        kwargs["tags"] = tags[:10]  # Max 10 tags
-        return self.create_item(item_type, **kwargs)
+        timeout = Config.SEED_WAIT_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        interval = Config.SEED_POLL_INTERVAL
+        
+        while True:
+            status = self.get_seed_status(user_id, token, seed_version)
+            if _seed_done(status, min_items):
+                return status
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Seeding not complete for user {user_id} after {timeout}s: "
+                    f"{status.get('total_items')}/{min_items or status.get('required_count')} items"
+                )
+            
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, Config.SEED_POLL_MAX_INTERVAL)
     
-    def create_item_with_price(
-        self,
-        price: float,
-        item_type: str = "DIGITAL",
-        **kwargs
-    ) -> Dict[str, Any]:
+    def get_item_count(self, token: str, filters: Optional[Dict[str, Any]] = None) -> int:
         """
-        Create item with specific price.
+        Count items via GET /items/count without fetching them.
+        
+        EDITOR tokens count only the user's own items; ADMIN and VIEWER
+        tokens count all users' items.
         
         Args:
-            price: Price value
-            item_type: Item type (default: "DIGITAL")
-            **kwargs: Additional arguments
+            token: JWT access token
+            filters: Optional filters - search, status ("active"/"inactive"), category
             
         Returns:
-            Dictionary with item data
+            Number of matching items
         """
-        kwargs["price"] = price
-        return self.create_item(item_type, **kwargs)
+        params = {key: value for key, value in (filters or {}).items() if value is not None}
+        headers = Config.get_auth_headers(token)
+        response = self.get("/items/count", headers=headers, params=params or None)
+        
+        return self._handle_response(response, expected_status=200).get("count", 0)
     
-    def create_batch_items(
+    def wait_for_item_count(
         self,
-        count: int,
-        item_type: str = "DIGITAL",
-        **base_overrides
-    ) -> List[Dict[str, Any]]:
+        token: str,
+        min_items: int,
+        timeout: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> int:
         """
-        Create multiple items of the same type.
+        Poll the item count with exponential backoff until it reaches min_items.
+        
+        Pairs with seed_items(): pass the seeded user's (EDITOR) token so
+        only that user's items are counted, and the expected total, e.g.
+        items the user already had plus the seeded count.
         
         Args:
-            count: Number of items to create
-            item_type: Item type (default: "DIGITAL")
-            **base_overrides: Base overrides applied to all items
+            token: JWT access token
+            min_items: Number of items to wait for
+            timeout: Max seconds to wait (default: Config.SEED_WAIT_TIMEOUT)
+            filters: Count filters (default: {"status": "active"})
             
         Returns:
-            List of item data dictionaries
+            Last item count
+            
+        Raises:
+            TimeoutError: If the count stays below min_items within timeout
         """
-        items = []
-        for i in range(count):
-            # Generate unique name for each item
-            name = generate_unique_name(f"Test {item_type}", suffix=str(i))
-            item = self.create_item(item_type, name=name, **base_overrides)
-            items.append(item)
-        
-        return items
+        filters = {"status": "active"} if filters is None else filters
+        timeout = Config.SEED_WAIT_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        interval = Config.SEED_POLL_INTERVAL
+        
+        while True:
+            count = self.get_item_count(token, filters)
+            if count >= min_items:
+                return count
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Item count still {count}/{min_items} after {timeout}s")
+            
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, Config.SEED_POLL_MAX_INTERVAL)
     
-    def create_item_via_api(
+    def get_items(
         self,
-        item_data: Dict[str, Any],
-        token: str
+        token: str,
+        page: int = 1,
+        limit: int = 20,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, str]]] = None
     ) -> Dict[str, Any]:
         """
-        Create item via API endpoint.
+        Get one page of items via GET /items.
         
         Args:
-            item_data: Item data dictionary
             token: JWT access token
+            page: Page number, starting at 1 (default: 1)
+            limit: Items per page, 1-100 (default: 20)
+            filters: Optional filters - search, status ("active"/"inactive"), category
+            sort: Optional list of (field, "asc"/"desc") pairs,
+                  e.g. [("price", "asc"), ("createdAt", "desc")]
             
         Returns:
-            API response with created item
-            
-        Raises:
-            requests.HTTPError: If creation fails
-            ValueError: If response is invalid
+            Dictionary with page data:
+            {
+                "items": [...],
+                "pagination": {"page", "limit", "total", "total_pages", "has_next", "has_prev"}
+            }
         """
+        params: Dict[str, Any] = {"page": page, "limit": limit}
+        params.update({key: value for key, value in (filters or {}).items() if value is not None})
+        if sort:
+            params["sort_by"] = [field for field, _ in sort]
+            params["sort_order"] = [order for _, order in sort]
+        
         headers = Config.get_auth_headers(token)
-        response = self.post("/items", json_data=item_data, headers=headers)
+        response = self.get("/items", headers=headers, params=params)
         
-        if response.status_code != 201:
-            raise ValueError(f"Failed to create item: {response.text}")
+        return self._handle_response(response, expected_status=200)
+    
+    def iter_items(
+        self,
+        token: str,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, str]]] = None,
+        page_size: int = 100,
+        prefetch: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all items matching filters, page by page.
         
-        result = response.json()
-        return result.get("data", {})
+        While the caller consumes page N, page N+1 is fetched on a
+        background thread, so at most two pages are held in memory.
+        
+        Args:
+            token: JWT access token
+            filters: Optional filters - search, status, category
+            sort: Optional list of (field, "asc"/"desc") pairs
+            page_size: Items per request, 1-100 (default: 100)
+            prefetch: Fetch the next page in the background (default: True)
+            
+        Yields:
+            Item dictionaries
+        """
+        if not 1 <= page_size <= 100:
+            raise ValueError(f"page_size must be between 1 and 100, got {page_size}")
+        
+        def fetch(page: int) -> Dict[str, Any]:
+            return self.get_items(token, page=page, limit=page_size, filters=filters, sort=sort)
+        
+        if not prefetch:
+            page = 1
+            while True:
+                result = fetch(page)
+                yield from result.get("items", [])
+                if not result.get("pagination", {}).get("has_next"):
+                    return
+                page += 1
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="items-prefetch") as executor:
+            page = 1
+            result = fetch(page)
+            while True:
+                has_next = result.get("pagination", {}).get("has_next")
+                next_page = executor.submit(fetch, page + 1) if has_next else None
+                
+                yield from result.get("items", [])
+                
+                if next_page is None:
+                    return
+                result = next_page.result()
+                page += 1
+    
+    def enable_batching(
+        self,
+        linger: Optional[float] = None,
+        max_batch_size: Optional[int] = None
+    ) -> None:
+        """
+        Route create_item_via_api through POST /items/batch.
+        
+        Calls made within the linger window (or until max_batch_size items
+        are pending) for the same token are merged into one request.
+        
+        Args:
+            linger: Seconds to wait for more items (default: Config.ITEM_BATCH_LINGER_MS)
+            max_batch_size: Items per request, max 50 (default: Config.ITEM_BATCH_MAX_SIZE)
+        """
+        self.disable_batching()
+        self._batcher = ItemBatcher(self, linger=linger, max_batch_size=max_batch_size)
+    
+    def disable_batching(self) -> None:
+        """Flush pending items and go back to one POST /items per item."""
+        if self._batcher is not None:
+            batcher = self._batcher
+            self._batcher = None
+            batcher.close()
+    
+    def close(self):
+        """Flush pending batched items and close HTTP session."""
+        self.disable_batching()
+        super().close()
@@ -0,0 +1,187 @@
+"""
+Pluggable JSON codec for request bodies and responses.
+
+The factories encode request bodies and decode responses through a codec
+instead of requests' stdlib json handling. orjson or msgspec are used when
+installed (Config.JSON_CODEC="auto"); otherwise the stdlib json module.
+All codecs produce compact UTF-8 bytes and raise ValueError on invalid
+input, so callers behave the same whichever backend is active.
+"""
+
+import json
+from functools import lru_cache
+from typing import Optional, Any, Type, Union
+
+from .config import Config
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional
+    msgspec = None
+
+JsonBody = Union[bytes, bytearray, memoryview, str]
+
+
+def _default(obj: Any) -> Any:
+    """Encode spec records nested in a body (and other objects) with to_dict()."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _convert(obj: Any, type_: Optional[Type]) -> Any:
+    """Build type_ from decoded data (via from_dict when available)."""
+    if type_ is None:
+        return obj
+    from_dict = getattr(type_, "from_dict", None)
+    if from_dict is not None:
+        return [from_dict(entry) for entry in obj] if isinstance(obj, list) else from_dict(obj)
+    return type_(**obj)
+
+
+class JsonCodec:
+    """Stdlib json codec; base class for faster backends."""
+
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        """
+        Encode obj as compact JSON.
+
+        Args:
+            obj: JSON-serializable object (objects with to_dict() are converted)
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return json.dumps(obj, separators=(",", ":"), default=_default).encode("utf-8")
+
+    def encode_body(self, body: Any) -> Optional[bytes]:
+        """
+        Encode a request body; pre-encoded bytes or str bodies pass through.
+
+        A spec record (ItemSpec, UserSpec) sent as the whole body writes its
+        own JSON with to_json(), without an intermediate dict. Specs nested
+        in a larger body (e.g. a batch) go through to_dict(): the backends
+        encode that faster than joining to_json() strings.
+
+        Args:
+            body: JSON-serializable object, spec record, encoded JSON, or None
+
+        Returns:
+            Body bytes, or None if there is no body
+        """
+        if body is None:
+            return None
+        if isinstance(body, str):
+            return body.encode("utf-8")
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            return bytes(body)
+        to_json = getattr(body, "to_json", None)
+        if to_json is not None:
+            return to_json().encode("utf-8")
+        return self.encode(body)
+
+    def decode(self, data: JsonBody, type_: Optional[Type] = None) -> Any:
+        """
+        Decode JSON.
+
+        Args:
+            data: JSON bytes or string
+            type_: Optional type to decode into: a class with from_dict
+                   (e.g. ItemSpec; lists decode to a list of instances), or
+                   any class accepting the decoded fields as keywords
+                   (msgspec decodes Structs and dataclasses natively)
+
+        Returns:
+            Decoded object
+
+        Raises:
+            ValueError: If data is not valid JSON
+        """
+        return _convert(json.loads(data), type_)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson backend."""
+
+    name = "orjson"
+
+    def encode(self, obj: Any) -> bytes:
+        # Dataclasses go through _default, as with the stdlib codec
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    def decode(self, data: JsonBody, type_: Optional[Type] = None) -> Any:
+        return _convert(orjson.loads(data), type_)
+
+
+class MsgspecCodec(JsonCodec):
+    """msgspec backend."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: JsonBody, type_: Optional[Type] = None) -> Any:
+        try:
+            if type_ is not None and not hasattr(type_, "from_dict"):
+                return msgspec.json.decode(data, type=type_)
+            return _convert(self._decoder.decode(data), type_)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS = {
+    "orjson": (OrjsonCodec, lambda: orjson is not None),
+    "msgspec": (MsgspecCodec, lambda: msgspec is not None),
+    "json": (JsonCodec, lambda: True)
+}
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Return the JSON codec to use.
+
+    Args:
+        name: "auto", "orjson", "msgspec" or "json" (default: Config.JSON_CODEC);
+              "auto" picks orjson, then msgspec, then stdlib json
+
+    Returns:
+        Shared codec instance
+
+    Raises:
+        ValueError: If name is unknown
+        ImportError: If the requested backend is not installed
+    """
+    return _codec((name or Config.JSON_CODEC).lower())
+
+
+@lru_cache(maxsize=None)
+def _codec(name: str) -> JsonCodec:
+    """Create the codec for a normalized name (one instance per name)."""
+    if name == "auto":
+        for codec_class, available in CODECS.values():
+            if available():
+                return codec_class()
+
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec: {name}. Must be auto, {', '.join(CODECS)}")
+
+    codec_class, available = CODECS[name]
+    if not available():
+        raise ImportError(
+            f"{name} is required for the {name} JSON codec. "
+            f"Install it with 'pip install {name}'"
+        )
+    return codec_class()
@@ -7,6 +7,10 @@ Provides functions to generate invalid test data for negative test cases.
 import copy
 from typing import Dict, Any, List, Optional
 
+from .item_payloads import ItemPayloads
+from .item_validator import validate_item
+from .seeding import derive_seed
+
 
 def missing_required_fields(
     base_data: Dict[str, Any],
@@ -52,10 +56,36 @@ def invalid_data_types(
     return invalid_data
 
 
-def validation_failures() -> Dict[str, Dict[str, Any]]:
+def accepted_cases(cases: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    Find negative cases the client-side validator would accept.
+    
+    Args:
+        cases: Dictionary of negative test case payloads
+        
+    Returns:
+        Names of cases that do not fail validation (should be empty)
+    """
+    return [name for name, item in cases.items() if not validate_item(item)]
+
+
+def _self_checked(cases: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Raise if any negative case would pass validation."""
+    accepted = accepted_cases(cases)
+    if accepted:
+        raise ValueError(f"Negative test cases pass validation: {', '.join(accepted)}")
+    return cases
+
+
+def validation_failures(self_check: bool = False, seed: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
     """
     Get pre-built validation failure test cases.
     
+    Args:
+        self_check: Raise ValueError if a case would pass the client-side
+                    validator (default: False)
+        seed: Payload seed (default: derived from Config.SEED)
+        
     Returns:
         Dictionary with validation failure scenarios:
         {
@@ -67,12 +97,10 @@ def validation_failures() -> Dict[str, Dict[str, Any]]:
             ...
         }
     """
-    from .item_factory import ItemFactory
-    
-    factory = ItemFactory()
-    base_item = factory.create_digital_item()
+    payloads = ItemPayloads(seed=seed)
+    base_item = payloads.create_digital_item()
     
-    return {
+    failures = {
         "name_too_short": {
             **base_item,
             "name": "AB"  # Min is 3 chars
@@ -102,11 +130,11 @@ def validation_failures() -> Dict[str, Dict[str, Any]]:
             "item_type": "INVALID"
         },
         "missing_weight_physical": {
-            **factory.create_physical_item(),
+            **payloads.create_physical_item(),
             "weight": None
         },
         "missing_dimensions_physical": {
-            **factory.create_physical_item(),
+            **payloads.create_physical_item(),
             "dimensions": None
         },
         "missing_download_url_digital": {
@@ -118,7 +146,7 @@ def validation_failures() -> Dict[str, Dict[str, Any]]:
             "file_size": None
         },
         "missing_duration_service": {
-            **factory.create_service_item(),
+            **payloads.create_service_item(),
             "duration_hours": None
         },
         "invalid_category_item_type": {
@@ -139,23 +167,24 @@ def validation_failures() -> Dict[str, Dict[str, Any]]:
             "download_url": "not-a-valid-url"
         }
     }
+    
+    return _self_checked(failures) if self_check else failures
 
 
-def boundary_values(field: str, boundary_type: str = "min") -> Dict[str, Any]:
+def boundary_values(field: str, boundary_type: str = "min", seed: Optional[int] = None) -> Dict[str, Any]:
     """
     Generate boundary values for a field.
     
     Args:
         field: Field name
         boundary_type: "min" or "max"
+        seed: Payload seed (default: derived from Config.SEED)
         
     Returns:
         Dictionary with boundary value for the field
     """
-    from .item_factory import ItemFactory
-    
-    factory = ItemFactory()
-    base_item = factory.create_digital_item()
+    payloads = ItemPayloads(seed=seed)
+    base_item = payloads.create_digital_item()
     
     boundaries = {
         "name": {
@@ -196,19 +225,23 @@ def boundary_values(field: str, boundary_type: str = "min") -> Dict[str, Any]:
     return result
 
 
-def get_negative_test_cases() -> Dict[str, Dict[str, Any]]:
+def get_negative_test_cases(self_check: bool = False, seed: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
     """
     Get all negative test cases.
     
+    Args:
+        self_check: Raise ValueError if a case would pass the client-side
+                    validator (default: False)
+        seed: Seed for reproducible cases (default: derived from Config.SEED)
+        
     Returns:
         Dictionary with all negative test case scenarios
     """
-    failures = validation_failures()
+    failures = validation_failures(seed=None if seed is None else derive_seed(seed, "negative_cases", "failures"))
     
     # Add missing field cases
-    from .item_factory import ItemFactory
-    factory = ItemFactory()
-    base_item = factory.create_digital_item()
+    payloads = ItemPayloads(seed=None if seed is None else derive_seed(seed, "negative_cases", "base"))
+    base_item = payloads.create_digital_item()
     
     failures["missing_name"] = missing_required_fields(base_item, ["name"])
     failures["missing_description"] = missing_required_fields(base_item, ["description"])
@@ -221,4 +254,4 @@ def get_negative_test_cases() -> Dict[str, Dict[str, Any]]:
     failures["invalid_name_type"] = invalid_data_types(base_item, "name", 123)
     failures["invalid_item_type_type"] = invalid_data_types(base_item, "item_type", 123)
     
-    return failures
+    return _self_checked(failures) if self_check else failures
@@ -0,0 +1,212 @@
+"""
+Multi-process item seeding.
+
+Generating and encoding payloads is CPU-bound, so a single process caps
+seeding throughput at one core no matter how many threads send requests.
+ProcessPoolSeeder splits a seeding spec into shards and sends each shard
+from a worker process with its own ItemFactory and, through
+client_registry, its own connection pool. Workers share the parent's run
+namespace, so generated names and cleanup ledgers belong to the same run;
+their results and request metrics are aggregated in the parent.
+"""
+
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Dict, Any, List, Union
+
+from .config import Config
+from .cleanup_ledger import cleanup_ledger
+from .item_batcher import MAX_BATCH_SIZE
+from .item_factory import ItemFactory
+from .request_metrics import request_metrics
+from .seeding import derive_seed
+from .unique_ids import unique_ids
+
+logger = logging.getLogger(__name__)
+
+# {item_type: count}, or [{"count": n, "item_type": ..., **overrides}, ...]
+SeedSpec = Union[Dict[str, int], List[Dict[str, Any]]]
+
+
+def _init_worker(run_id: str, base_url: Optional[str]) -> None:
+    """Join the parent's run namespace (spawned workers start with their own)."""
+    if base_url:
+        Config.API_BASE_URL = base_url
+    unique_ids.join_run(run_id)
+    cleanup_ledger.join_run(run_id)
+
+
+def _seed_shard(shard: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate and send one shard in a worker process."""
+    start = time.perf_counter()
+    factory = ItemFactory(seed=shard["seed"])
+    try:
+        # Default names are unique per shard (seeded or run-scoped), unlike iter_batch_items'
+        summary = factory.send_items(
+            (factory.create_item(shard["item_type"], **shard["overrides"]) for _ in range(shard["count"])),
+            shard["token"],
+            batch_size=shard["batch_size"],
+            workers=shard["threads"],
+            skip_existing=shard["skip_existing"],
+            validate=shard["validate"]
+        )
+    finally:
+        factory.close()
+
+    summary["pid"] = os.getpid()
+    summary["elapsed"] = time.perf_counter() - start
+    summary["metrics"] = request_metrics.export()
+    return summary
+
+
+class ProcessPoolSeeder:
+    """Seed items from a pool of worker processes."""
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        threads: Optional[int] = None,
+        base_url: Optional[str] = None,
+        mp_context=None
+    ):
+        """
+        Initialize ProcessPoolSeeder.
+
+        Workers read their configuration from the environment (spawned
+        workers do not see Config changes made at runtime), except for
+        base_url, which is passed on explicitly.
+
+        Args:
+            processes: Worker processes (default: os.cpu_count())
+            threads: Concurrent requests per worker (default: Config.ITEM_SEND_WORKERS)
+            base_url: API base URL for the workers (default: Config.API_BASE_URL)
+            mp_context: multiprocessing context, e.g. multiprocessing.get_context("spawn")
+                        (default: the platform default)
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.threads = threads or Config.ITEM_SEND_WORKERS
+        self.base_url = base_url or Config.API_BASE_URL
+        self.mp_context = mp_context
+
+    def seed(
+        self,
+        spec: SeedSpec,
+        token: str,
+        seed: Optional[int] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+        skip_existing: bool = False,
+        validate: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Create the items described by spec across the worker pool.
+
+        Each spec entry is split into up to one shard per process (at least
+        one batch each). With a seed, every shard gets a seed derived from
+        it and the shard's position, so the same spec and number of
+        processes produce the same payloads.
+
+        Args:
+            spec: {item_type: count}, or a list of
+                  {"count": n, "item_type": "DIGITAL", **overrides}
+            token: JWT access token (must stay valid for the whole run)
+            seed: Payload seed (default: Config.SEED; unseeded if not set)
+            batch_size: Items per batch request, max 50 (default: 50)
+            skip_existing: Report duplicates as skipped
+            validate: Check payloads client-side before sending
+                      (default: Config.ITEM_PREFLIGHT_VALIDATION)
+
+        Returns:
+            Dictionary with totals and per-worker stats:
+            {
+                "created": count,
+                "skipped": count,
+                "failed": count,
+                "errors": [{"name", "reason"}, ...],
+                "elapsed": seconds,
+                "workers": {pid: {"shards", "created", "skipped", "failed", "elapsed"}}
+            }
+            Worker request metrics are merged into request_metrics.
+
+        Raises:
+            ValueError: If batch_size exceeds 50 or a spec entry has no count
+        """
+        if batch_size > MAX_BATCH_SIZE:
+            raise ValueError(f"Maximum {MAX_BATCH_SIZE} items allowed per batch request, got {batch_size}")
+
+        seed = Config.SEED if seed is None else seed
+        shards = [
+            {
+                "token": token,
+                "batch_size": batch_size,
+                "threads": self.threads,
+                "skip_existing": skip_existing,
+                "validate": validate,
+                **shard
+            }
+            for shard in self._shard(spec, seed, batch_size)
+        ]
+
+        summary: Dict[str, Any] = {"created": 0, "skipped": 0, "failed": 0, "errors": [], "workers": {}}
+        start = time.perf_counter()
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.processes, len(shards)) or 1,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=(unique_ids.run_id, self.base_url)
+        ) as executor:
+            futures = [executor.submit(_seed_shard, shard) for shard in shards]
+            for future in as_completed(futures):
+                self._collect(future.result(), summary)
+
+        summary["elapsed"] = time.perf_counter() - start
+        logger.info(
+            f"Seeded items with {len(summary['workers'])} processes in {summary['elapsed']:.1f}s: "
+            f"{summary['created']} created, {summary['skipped']} skipped, {summary['failed']} failed"
+        )
+
+        return summary
+
+    def _shard(self, spec: SeedSpec, seed: Optional[int], batch_size: int) -> List[Dict[str, Any]]:
+        """Split spec entries into shards of whole batches, one seed per shard."""
+        if isinstance(spec, dict):
+            spec = [{"item_type": item_type, "count": count} for item_type, count in spec.items()]
+
+        shards = []
+        for entry_index, entry in enumerate(spec):
+            overrides = dict(entry)
+            if "count" not in overrides:
+                raise ValueError(f"Seed spec entry {entry_index} has no count: {entry}")
+            count = overrides.pop("count")
+            item_type = overrides.pop("item_type", "DIGITAL")
+
+            shard_size = max(batch_size, math.ceil(count / self.processes))
+            shard_size = math.ceil(shard_size / batch_size) * batch_size
+            for shard_index, offset in enumerate(range(0, count, shard_size)):
+                shards.append({
+                    "item_type": item_type,
+                    "count": min(shard_size, count - offset),
+                    "overrides": overrides,
+                    "seed": None if seed is None else derive_seed(seed, "process-seeder", entry_index, shard_index)
+                })
+
+        return shards
+
+    @staticmethod
+    def _collect(result: Dict[str, Any], summary: Dict[str, Any]) -> None:
+        """Add one shard's result to the totals and its worker's stats."""
+        request_metrics.merge(result.pop("metrics"))
+
+        for key in ("created", "skipped", "failed"):
+            summary[key] += result[key]
+        summary["errors"].extend(result["errors"])
+
+        worker = summary["workers"].setdefault(
+            result["pid"], {"shards": 0, "created": 0, "skipped": 0, "failed": 0, "elapsed": 0.0}
+        )
+        worker["shards"] += 1
+        for key in ("created", "skipped", "failed", "elapsed"):
+            worker[key] += result[key]
@@ -5,14 +5,20 @@ Provides reusable fixtures for creating test data and managing cleanup
 in pytest test suites.
 """
 
+import os
 import pytest
 import logging
 from typing import Dict, Any, Generator, Callable, Optional
 
 from .base_factory import BaseFactory
+from .client_registry import client_registry
 from .user_factory import UserFactory
 from .item_factory import ItemFactory
 from .cleanup_factory import CleanupFactory
+from .cleanup_queue import CleanupQueue
+from .cleanup_ledger import cleanup_ledger, sweep_orphans
+from .user_pool import UserPool
+from .request_metrics import request_metrics
 from .config import Config
 
 logger = logging.getLogger(__name__)
@@ -23,12 +29,16 @@ def api_client() -> BaseFactory:
     """
     HTTP client fixture (session-scoped).
     
+    All factories use thread-local sessions over one shared connection
+    pool; the pool is closed at session end.
+    
     Returns:
         BaseFactory instance with HTTP client
     """
     client = BaseFactory()
     yield client
     client.close()
+    client_registry.close()
 
 
 @pytest.fixture(scope="function")
@@ -37,13 +47,12 @@ def user_factory(api_client: BaseFactory) -> UserFactory:
     UserFactory fixture (function-scoped).
     
     Args:
-        api_client: HTTP client fixture
+        api_client: HTTP client fixture (factories share its connection pool)
         
     Returns:
         UserFactory instance
     """
     factory = UserFactory()
-    factory.session = api_client.session  # Share session
     yield factory
     factory.close()
 
@@ -54,13 +63,12 @@ def item_factory(api_client: BaseFactory) -> ItemFactory:
     ItemFactory fixture (function-scoped).
     
     Args:
-        api_client: HTTP client fixture
+        api_client: HTTP client fixture (factories share its connection pool)
         
     Returns:
         ItemFactory instance
     """
     factory = ItemFactory()
-    factory.session = api_client.session  # Share session
     yield factory
     factory.close()
 
@@ -71,64 +79,142 @@ def cleanup_factory(api_client: BaseFactory) -> CleanupFactory:
     CleanupFactory fixture (function-scoped).
     
     Args:
-        api_client: HTTP client fixture
+        api_client: HTTP client fixture (factories share its connection pool)
         
     Returns:
         CleanupFactory instance
     """
     factory = CleanupFactory()
-    factory.session = api_client.session  # Share session
     yield factory
     factory.close()
 
 
-@pytest.fixture(scope="function")
-def test_user(user_factory: UserFactory, cleanup_factory: CleanupFactory) -> Generator[Dict[str, Any], None, None]:
+@pytest.fixture(scope="session", autouse=True)
+def request_metrics_report() -> Generator[None, None, None]:
     """
-    Create a test editor user with automatic cleanup.
+    Report per-endpoint request metrics at session end (session-scoped, autouse).
+    
+    Logs a latency table and, if Config.REQUEST_METRICS_FILE is set, writes
+    the snapshot as JSON there (suffixed with the xdist worker name).
+    """
+    yield
+    
+    if not request_metrics.snapshot():
+        return
+    
+    logger.info(f"Request metrics:\n{request_metrics.format_table()}")
+    
+    if Config.REQUEST_METRICS_FILE:
+        path = Config.REQUEST_METRICS_FILE
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        if worker:
+            root, ext = os.path.splitext(path)
+            path = f"{root}-{worker}{ext}"
+        request_metrics.dump(path)
+
+
+@pytest.fixture(scope="session")
+def cleanup_queue() -> Generator[Optional[CleanupQueue], None, None]:
+    """
+    Deferred cleanup queue (session-scoped).
+    
+    Fixtures enqueue cleanup here instead of deleting synchronously; the
+    queue is drained in the background and flushed at session end within
+    Config.CLEANUP_TIMEOUT. Opt-in via Config.CLEANUP_DEFERRED; otherwise
+    yields None and fixtures clean up synchronously in their own teardown.
+    
+    With Config.CLEANUP_SWEEP_ON_START, data leaked by earlier crashed runs
+    is swept from the cleanup ledger first.
     
     Yields:
-        Dictionary with user data and token:
-        {
-            "user": {...},
-            "token": "JWT token",
-            "email": "...",
-            "password": "..."
-        }
+        CleanupQueue instance or None
     """
-    # Setup: Create user
-    user = user_factory.create_editor()
-    login_result = user_factory.login(user["email"], user["password"])
-    token = login_result["token"]
+    if Config.CLEANUP_SWEEP_ON_START:
+        sweep_orphans()
+    
+    if not Config.CLEANUP_DEFERRED:
+        yield None
+        cleanup_ledger.close()
+        return
+    
+    queue = CleanupQueue()
+    yield queue
+    queue.close()
+    cleanup_ledger.close()
+
+
+@pytest.fixture(scope="session")
+def user_pool(cleanup_queue: Optional[CleanupQueue]) -> Generator[UserPool, None, None]:
+    """
+    Pool of reusable logged-in users (session-scoped).
     
-    test_data = {
-        "user": user,
-        "token": token,
-        "email": user["email"],
-        "password": user["password"],
-        "_id": user["_id"]
-    }
+    Pre-creates Config.USER_POOL_SIZE accounts per role when
+    Config.USER_POOL_ENABLED is set; grows on demand.
     
-    yield test_data
+    Yields:
+        UserPool instance
+    """
+    pool = UserPool(cleanup_queue=cleanup_queue)
+    if Config.USER_POOL_ENABLED and pool.size_per_role > 0:
+        pool.warm()
+    yield pool
+    pool.close()
+
+
+def _cleanup_user(
+    user_id: str,
+    cleanup_factory: CleanupFactory,
+    cleanup_queue: Optional[CleanupQueue]
+) -> None:
+    """Clean up user data, deferred through the queue when available."""
+    if cleanup_queue is not None:
+        cleanup_queue.enqueue_user_data(user_id)
+        return
     
-    # Teardown: Cleanup user data
     try:
-        cleanup_factory.cleanup_user_data(user["_id"])
+        cleanup_factory.cleanup_user_data(user_id)
     except Exception as e:
-        logger.warning(f"Failed to cleanup user {user['_id']}: {e}")
+        logger.warning(f"Failed to cleanup user {user_id}: {e}")
 
 
-@pytest.fixture(scope="function")
-def test_admin(user_factory: UserFactory, cleanup_factory: CleanupFactory) -> Generator[Dict[str, Any], None, None]:
+def _cleanup_item(
+    item_id: str,
+    cleanup_factory: CleanupFactory,
+    cleanup_queue: Optional[CleanupQueue]
+) -> None:
+    """Hard delete an item, deferred through the queue when available."""
+    if cleanup_queue is not None:
+        cleanup_queue.enqueue_item(item_id)
+        return
+    
+    try:
+        cleanup_factory.cleanup_single_item(item_id)
+    except Exception as e:
+        logger.warning(f"Failed to cleanup item {item_id}: {e}")
+
+
+def _role_user(
+    role: str,
+    user_factory: UserFactory,
+    cleanup_factory: CleanupFactory,
+    user_pool: UserPool,
+    cleanup_queue: Optional[CleanupQueue]
+) -> Generator[Dict[str, Any], None, None]:
     """
-    Create a test admin user with automatic cleanup.
+    Yield a logged-in user of the given role and clean up its data afterwards.
     
-    Yields:
-        Dictionary with admin user data and token
+    Uses the user pool when Config.USER_POOL_ENABLED is set (opt-in),
+    otherwise signs up a fresh user.
     """
-    # Setup: Create admin
-    user = user_factory.create_admin()
-    login_result = user_factory.login(user["email"], user["password"])
+    if Config.USER_POOL_ENABLED:
+        test_data = user_pool.acquire(role)
+        yield test_data
+        user_pool.release(test_data)
+        return
+    
+    # Setup: Create user
+    user = user_factory.create_user(role=role)
+    login_result = user_factory.login(user["email"], user["password"], use_cache=True)
     token = login_result["token"]
     
     test_data = {
@@ -142,77 +228,85 @@ def test_admin(user_factory: UserFactory, cleanup_factory: CleanupFactory) -> Ge
     yield test_data
     
     # Teardown: Cleanup user data
-    try:
-        cleanup_factory.cleanup_user_data(user["_id"])
-    except Exception as e:
-        logger.warning(f"Failed to cleanup admin {user['_id']}: {e}")
+    _cleanup_user(user["_id"], cleanup_factory, cleanup_queue)
 
 
 @pytest.fixture(scope="function")
-def test_editor(user_factory: UserFactory, cleanup_factory: CleanupFactory) -> Generator[Dict[str, Any], None, None]:
+def test_user(
+    user_factory: UserFactory,
+    cleanup_factory: CleanupFactory,
+    user_pool: UserPool,
+    cleanup_queue: Optional[CleanupQueue]
+) -> Generator[Dict[str, Any], None, None]:
     """
     Create a test editor user with automatic cleanup.
     
     Yields:
-        Dictionary with editor user data and token
+        Dictionary with user data and token:
+        {
+            "user": {...},
+            "token": "JWT token",
+            "email": "...",
+            "password": "..."
+        }
     """
-    # Setup: Create editor
-    user = user_factory.create_editor()
-    login_result = user_factory.login(user["email"], user["password"])
-    token = login_result["token"]
-    
-    test_data = {
-        "user": user,
-        "token": token,
-        "email": user["email"],
-        "password": user["password"],
-        "_id": user["_id"]
-    }
+    yield from _role_user("EDITOR", user_factory, cleanup_factory, user_pool, cleanup_queue)
+
+
+@pytest.fixture(scope="function")
+def test_admin(
+    user_factory: UserFactory,
+    cleanup_factory: CleanupFactory,
+    user_pool: UserPool,
+    cleanup_queue: Optional[CleanupQueue]
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Create a test admin user with automatic cleanup.
     
-    yield test_data
+    Yields:
+        Dictionary with admin user data and token
+    """
+    yield from _role_user("ADMIN", user_factory, cleanup_factory, user_pool, cleanup_queue)
+
+
+@pytest.fixture(scope="function")
+def test_editor(
+    user_factory: UserFactory,
+    cleanup_factory: CleanupFactory,
+    user_pool: UserPool,
+    cleanup_queue: Optional[CleanupQueue]
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Create a test editor user with automatic cleanup.
     
-    # Teardown: Cleanup user data
-    try:
-        cleanup_factory.cleanup_user_data(user["_id"])
-    except Exception as e:
-        logger.warning(f"Failed to cleanup editor {user['_id']}: {e}")
+    Yields:
+        Dictionary with editor user data and token
+    """
+    yield from _role_user("EDITOR", user_factory, cleanup_factory, user_pool, cleanup_queue)
 
 
 @pytest.fixture(scope="function")
-def test_viewer(user_factory: UserFactory, cleanup_factory: CleanupFactory) -> Generator[Dict[str, Any], None, None]:
+def test_viewer(
+    user_factory: UserFactory,
+    cleanup_factory: CleanupFactory,
+    user_pool: UserPool,
+    cleanup_queue: Optional[CleanupQueue]
+) -> Generator[Dict[str, Any], None, None]:
     """
     Create a test viewer user with automatic cleanup.
     
     Yields:
         Dictionary with viewer user data and token
     """
-    # Setup: Create viewer
-    user = user_factory.create_viewer()
-    login_result = user_factory.login(user["email"], user["password"])
-    token = login_result["token"]
-    
-    test_data = {
-        "user": user,
-        "token": token,
-        "email": user["email"],
-        "password": user["password"],
-        "_id": user["_id"]
-    }
-    
-    yield test_data
-    
-    # Teardown: Cleanup user data
-    try:
-        cleanup_factory.cleanup_user_data(user["_id"])
-    except Exception as e:
-        logger.warning(f"Failed to cleanup viewer {user['_id']}: {e}")
+    yield from _role_user("VIEWER", user_factory, cleanup_factory, user_pool, cleanup_queue)
 
 
 @pytest.fixture(scope="function")
 def test_item(
     item_factory: ItemFactory,
     test_user: Dict[str, Any],
-    cleanup_factory: CleanupFactory
+    cleanup_factory: CleanupFactory,
+    cleanup_queue: Optional[CleanupQueue]
 ) -> Generator[Dict[str, Any], None, None]:
     """
     Create a test item with automatic cleanup.
@@ -230,16 +324,17 @@ def test_item(
     yield created_item
     
     # Teardown: Cleanup item
-    try:
-        item_id = created_item.get("_id")
-        if item_id:
-            cleanup_factory.cleanup_single_item(item_id)
-    except Exception as e:
-        logger.warning(f"Failed to cleanup item {created_item.get('_id')}: {e}")
+    item_id = created_item.get("_id")
+    if item_id:
+        _cleanup_item(item_id, cleanup_factory, cleanup_queue)
 
 
 @pytest.fixture(scope="function")
-def make_user(user_factory: UserFactory, cleanup_factory: CleanupFactory) -> Callable:
+def make_user(
+    user_factory: UserFactory,
+    cleanup_factory: CleanupFactory,
+    cleanup_queue: Optional[CleanupQueue]
+) -> Callable:
     """
     Factory as fixture pattern - returns a function to create users.
     
@@ -269,7 +364,7 @@ def make_user(user_factory: UserFactory, cleanup_factory: CleanupFactory) -> Cal
             password=password,
             role=role
         )
-        login_result = user_factory.login(user["email"], user["password"])
+        login_result = user_factory.login(user["email"], user["password"], use_cache=True)
         
         user_data = {
             "user": user,
@@ -286,14 +381,15 @@ def make_user(user_factory: UserFactory, cleanup_factory: CleanupFactory) -> Cal
     
     # Teardown: Cleanup all created users
     for user_data in created_users:
-        try:
-            cleanup_factory.cleanup_user_data(user_data["_id"])
-        except Exception as e:
-            logger.warning(f"Failed to cleanup user {user_data['_id']}: {e}")
+        _cleanup_user(user_data["_id"], cleanup_factory, cleanup_queue)
 
 
 @pytest.fixture(scope="function")
-def make_item(item_factory: ItemFactory, cleanup_factory: CleanupFactory) -> Callable:
+def make_item(
+    item_factory: ItemFactory,
+    cleanup_factory: CleanupFactory,
+    cleanup_queue: Optional[CleanupQueue]
+) -> Callable:
     """
     Factory as fixture pattern - returns a function to create items.
     
@@ -327,9 +423,6 @@ def make_item(item_factory: ItemFactory, cleanup_factory: CleanupFactory) -> Cal
     
     # Teardown: Cleanup all created items
     for item in created_items:
-        try:
-            item_id = item.get("_id")
-            if item_id:
-                cleanup_factory.cleanup_single_item(item_id)
-        except Exception as e:
-            logger.warning(f"Failed to cleanup item {item.get('_id')}: {e}")
+        item_id = item.get("_id")
+        if item_id:
+            _cleanup_item(item_id, cleanup_factory, cleanup_queue)
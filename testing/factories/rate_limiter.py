@@ -0,0 +1,302 @@
+"""
+Adaptive client-side rate limiting.
+
+Requests are grouped into endpoint classes (auth, otp, items, internal),
+each with a token bucket shared by every factory in the process. The
+bucket rate follows an AIMD controller: a 429 cuts the rate
+multiplicatively (at most once per cooldown, since in-flight requests
+often fail together) and pauses the class for any Retry-After the server
+sent; each success raises the rate additively by about
+Config.RATE_LIMIT_INCREASE requests/second per second.
+
+A class without a configured ceiling (rate 0) is unlimited until a 429
+arrives under load, which starts the bucket at half the observed request
+rate; once the rate has recovered well past the observed demand the
+bucket is lifted again.
+"""
+
+import email.utils
+import logging
+import os
+import threading
+import time
+from typing import Optional, Dict, Mapping
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT_CLASSES = ("auth", "otp", "items", "internal")
+
+# Reset headers above this are absolute epoch seconds rather than deltas
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def endpoint_class(endpoint: str) -> str:
+    """
+    Classify an endpoint for rate limiting.
+
+    Args:
+        endpoint: Endpoint path (e.g. "/auth/signup/request-otp")
+
+    Returns:
+        "internal", "otp", "auth", or "items" (everything else)
+    """
+    path = endpoint.split("?", 1)[0]
+    if path.startswith("/internal"):
+        return "internal"
+    if "otp" in path:
+        return "otp"
+    if path.startswith("/auth"):
+        return "auth"
+    return "items"
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Read how long to wait from rate-limit response headers.
+
+    Understands Retry-After (seconds or HTTP date) and the RateLimit-Reset /
+    X-RateLimit-Reset headers (delta seconds or epoch seconds).
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+
+    Returns:
+        Seconds to wait, or None if no header says
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                parsed = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                parsed = None
+            if parsed is not None:
+                return max(0.0, parsed.timestamp() - time.time())
+
+    for name in ("RateLimit-Reset", "X-RateLimit-Reset"):
+        reset = headers.get(name)
+        if reset:
+            try:
+                value = float(reset)
+            except ValueError:
+                continue
+            if value > _EPOCH_THRESHOLD:
+                value -= time.time()
+            return max(0.0, value)
+
+    return None
+
+
+class EndpointLimiter:
+    """Token bucket with an AIMD-controlled rate for one endpoint class."""
+
+    def __init__(
+        self,
+        name: str,
+        max_rate: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+        decrease: Optional[float] = None,
+        cooldown: float = 1.0
+    ):
+        """
+        Initialize EndpointLimiter.
+
+        Args:
+            name: Endpoint class name (for logging)
+            max_rate: Rate ceiling in requests/second; None or 0 for no ceiling
+            min_rate: Rate floor (default: Config.RATE_LIMIT_MIN)
+            increase: Additive increase in requests/second per second
+                      (default: Config.RATE_LIMIT_INCREASE)
+            decrease: Multiplicative decrease factor on 429
+                      (default: Config.RATE_LIMIT_DECREASE)
+            cooldown: Minimum seconds between two decreases (default: 1.0)
+        """
+        self.name = name
+        self.max_rate = max_rate or None
+        self.min_rate = min_rate or Config.RATE_LIMIT_MIN
+        self.increase = increase or Config.RATE_LIMIT_INCREASE
+        self.decrease = decrease or Config.RATE_LIMIT_DECREASE
+        self.cooldown = cooldown
+
+        self.rate: Optional[float] = self.max_rate  # None: not limited
+        self.throttled = 0
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._last_request = 0.0
+        self._interval = None  # EWMA of time between requests
+        self._lock = threading.Lock()
+
+    @property
+    def observed_rate(self) -> float:
+        """Recent request rate (requests/second), from an EWMA of request intervals."""
+        if not self._interval:
+            return 0.0
+        return 1.0 / self._interval
+
+    def reserve(self) -> float:
+        """
+        Take a token for one request.
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            if self._last_request:
+                interval = now - self._last_request
+                self._interval = interval if self._interval is None else 0.9 * self._interval + 0.1 * interval
+            self._last_request = now
+
+            pause = max(0.0, self._paused_until - now)
+            if self.rate is None:
+                return pause
+
+            # Refill, then reserve; a negative balance is the queue ahead of us
+            self._tokens = min(1.0, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(pause, wait)
+
+    def on_success(self) -> None:
+        """Additive increase after a request that was not throttled."""
+        with self._lock:
+            if self.rate is None:
+                return
+            self.rate += self.increase / self.rate
+            if self.max_rate is not None:
+                self.rate = min(self.rate, self.max_rate)
+            elif self.rate > 2 * self.observed_rate + self.min_rate:
+                # Demand is well below the limit; stop limiting until the next 429
+                logger.info(f"Rate limit for '{self.name}' lifted")
+                self.rate = None
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Multiplicative decrease after a 429.
+
+        Args:
+            retry_after: Seconds the server asked to wait, paused for the
+                         whole class
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.throttled += 1
+
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+            current = self.rate if self.rate is not None else self.observed_rate
+            # No request history to size a rate from: only the pause applies
+            if not current or now - self._last_decrease < self.cooldown:
+                decreased = False
+            else:
+                self._last_decrease = now
+                self.rate = max(self.min_rate, current * self.decrease)
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = now
+                decreased = True
+
+        if decreased:
+            logger.warning(
+                f"Rate limited on '{self.name}' endpoints; rate lowered to {self.rate:.1f} req/s"
+                + (f", pausing {retry_after:.1f}s" if retry_after else "")
+            )
+        elif retry_after:
+            logger.info(f"Rate limited on '{self.name}' endpoints; pausing {retry_after:.1f}s")
+
+
+class AdaptiveRateLimiter:
+    """Per endpoint class limiters shared by all factories in the process."""
+
+    def __init__(self, enabled: Optional[bool] = None, max_rates: Optional[Dict[str, float]] = None):
+        """
+        Initialize AdaptiveRateLimiter.
+
+        Args:
+            enabled: Apply rate limiting (default: Config.RATE_LIMIT_ENABLED)
+            max_rates: Rate ceiling per endpoint class in requests/second, 0
+                       for none (default: Config.RATE_LIMIT_AUTH/_OTP/_ITEMS/_INTERNAL)
+        """
+        self.enabled = Config.RATE_LIMIT_ENABLED if enabled is None else enabled
+        self.max_rates = max_rates or {
+            "auth": Config.RATE_LIMIT_AUTH,
+            "otp": Config.RATE_LIMIT_OTP,
+            "items": Config.RATE_LIMIT_ITEMS,
+            "internal": Config.RATE_LIMIT_INTERNAL
+        }
+        self._after_fork()
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Take a token for a request to endpoint.
+
+        Returns:
+            Seconds to wait before sending (sleep or asyncio.sleep)
+        """
+        if not self.enabled:
+            return 0.0
+        return self.limiters[endpoint_class(endpoint)].reserve()
+
+    def acquire(self, endpoint: str) -> None:
+        """Block until a request to endpoint may be sent."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_response(self, endpoint: str, status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Feed a response into the controller.
+
+        Args:
+            endpoint: Endpoint path
+            status_code: HTTP status code
+            headers: Response headers
+
+        Returns:
+            Seconds the server asked to wait for a 429 with a Retry-After or
+            reset header, None otherwise
+        """
+        if not self.enabled:
+            return None
+
+        limiter = self.limiters[endpoint_class(endpoint)]
+        if status_code == 429:
+            retry_after = parse_retry_after(headers)
+            limiter.on_throttle(retry_after)
+            return retry_after
+
+        if status_code < 500:
+            limiter.on_success()
+        return None
+
+    def stats(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Current rate, observed rate and 429 count per endpoint class."""
+        return {
+            name: {
+                "rate": limiter.rate,
+                "observed_rate": limiter.observed_rate,
+                "throttled": limiter.throttled
+            }
+            for name, limiter in self.limiters.items()
+        }
+
+    def _after_fork(self) -> None:
+        """Start from fresh limiters (new locks, no inherited rate state)."""
+        self.limiters = {name: EndpointLimiter(name, self.max_rates.get(name)) for name in ENDPOINT_CLASSES}
+
+
+# Shared by all factories in the process
+rate_limiter = AdaptiveRateLimiter()
+
+# A forked child must not inherit a lock held at fork time
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=rate_limiter._after_fork)
@@ -0,0 +1,294 @@
+"""
+Per-endpoint request metrics for the factories.
+
+Every request made through BaseFactory or AsyncBaseFactory is recorded
+under "<METHOD> <endpoint template>", where IDs in the path collapse to
+":id" (e.g. "DELETE /internal/items/:id/permanent"). Each endpoint keeps
+request, status, retry, error and byte counters plus a latency histogram
+with fixed log-spaced buckets, so recording is O(1) memory and cheap
+enough to leave on in load runs. Percentiles are accurate to the bucket
+width (about 5%). Metrics recorded in other processes (e.g. seeding
+workers) can be folded in with export() and merge().
+"""
+
+import bisect
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Optional, Dict, Any
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# MongoDB ObjectIds, UUIDs and numeric IDs
+ID_SEGMENT_PATTERN = re.compile(
+    r"^(?:[0-9a-fA-F]{24}|[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}|\d+)$"
+)
+
+# Latency bucket upper bounds in ms: 0.1 ms to ~10 min, 5% apart
+BUCKET_GROWTH = 1.05
+BUCKET_BOUNDS = [0.1 * BUCKET_GROWTH ** i for i in range(int(math.log(6_000_000) / math.log(BUCKET_GROWTH)) + 2)]
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Normalize an endpoint path for grouping.
+
+    Args:
+        endpoint: Endpoint path, optionally with query string
+
+    Returns:
+        Path without query string, with ID segments replaced by ":id"
+    """
+    path = endpoint.split("?", 1)[0]
+    return "/".join(
+        ":id" if ID_SEGMENT_PATTERN.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, ms: float) -> None:
+        """Add one sample."""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            p: Percentile (0-100)
+
+        Returns:
+            Upper bound of the bucket holding the percentile, capped at the
+            largest sample (0.0 without samples)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max, self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples."""
+        for index, bucket_count in enumerate(other.counts):
+            self.counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def summary(self) -> Dict[str, float]:
+        """Return count, avg, p50, p95, p99 and max (ms)."""
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max
+        }
+
+
+class EndpointStats:
+    """Counters and latency histogram for one method and endpoint template."""
+
+    __slots__ = ("requests", "statuses", "errors", "retries", "bytes_sent", "bytes_received", "latency")
+
+    def __init__(self):
+        self.requests = 0
+        self.statuses: Counter = Counter()
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return counters and latency summary as a dictionary."""
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency_ms": self.latency.summary()
+        }
+
+    def merge(self, other: "EndpointStats") -> None:
+        """Add another endpoint's counters and latency samples."""
+        self.requests += other.requests
+        self.statuses.update(other.statuses)
+        self.errors += other.errors
+        self.retries += other.retries
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+        self.latency.merge(other.latency)
+
+
+class RequestMetrics:
+    """Thread-safe registry of per-endpoint request metrics."""
+
+    def __init__(self, enabled: Optional[bool] = None):
+        """
+        Initialize RequestMetrics.
+
+        Args:
+            enabled: Record requests (default: Config.REQUEST_METRICS_ENABLED)
+        """
+        self.enabled = Config.REQUEST_METRICS_ENABLED if enabled is None else enabled
+        self._stats: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        seconds: float,
+        status: Optional[int] = None,
+        retries: int = 0,
+        bytes_sent: int = 0,
+        bytes_received: int = 0
+    ) -> None:
+        """
+        Record one request.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint path (normalized with endpoint_template)
+            seconds: Total duration including retries
+            status: Final HTTP status, or None if the request raised
+            retries: Retries performed before the final attempt
+            bytes_sent: Request body size
+            bytes_received: Response body size
+        """
+        if not self.enabled:
+            return
+
+        key = f"{method} {endpoint_template(endpoint)}"
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats()
+            stats.requests += 1
+            if status is None:
+                stats.errors += 1
+            else:
+                stats.statuses[status] += 1
+            stats.retries += retries
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.latency.record(seconds * 1000)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return a copy of all metrics.
+
+        Returns:
+            Dictionary keyed by "<METHOD> <endpoint template>":
+            {
+                "requests", "statuses": {code: count}, "errors", "retries",
+                "bytes_sent", "bytes_received",
+                "latency_ms": {"count", "avg", "p50", "p95", "p99", "max"}
+            }
+        """
+        with self._lock:
+            return {key: stats.snapshot() for key, stats in sorted(self._stats.items())}
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._stats.clear()
+
+    def export(self) -> Dict[str, EndpointStats]:
+        """
+        Take the recorded metrics, with full histograms, and reset.
+
+        Returns:
+            Picklable per-endpoint stats for merge() in another process
+        """
+        with self._lock:
+            stats, self._stats = self._stats, {}
+        return stats
+
+    def merge(self, stats: Dict[str, EndpointStats]) -> None:
+        """
+        Add metrics exported by another RequestMetrics (e.g. a worker process).
+
+        Args:
+            stats: Result of export()
+        """
+        with self._lock:
+            for key, other in stats.items():
+                own = self._stats.get(key)
+                if own is None:
+                    own = self._stats[key] = EndpointStats()
+                own.merge(other)
+
+    def _after_fork(self) -> None:
+        """Start empty with a fresh lock: a child reports only its own requests."""
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def format_table(self) -> str:
+        """Render the snapshot as a text table, slowest p95 first."""
+        rows = sorted(
+            self.snapshot().items(),
+            key=lambda entry: entry[1]["latency_ms"]["p95"],
+            reverse=True
+        )
+        lines = [
+            f"{'endpoint':<50} {'count':>7} {'p50':>9} {'p95':>9} {'p99':>9} "
+            f"{'retries':>7} {'errors':>6}  statuses"
+        ]
+        for key, stats in rows:
+            latency = stats["latency_ms"]
+            statuses = " ".join(f"{code}:{count}" for code, count in sorted(stats["statuses"].items()))
+            lines.append(
+                f"{key:<50} {stats['requests']:>7} {latency['p50']:>8.1f}ms {latency['p95']:>8.1f}ms "
+                f"{latency['p99']:>8.1f}ms {stats['retries']:>7} {stats['errors']:>6}  {statuses}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+        """
+        Write the snapshot to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+# Shared by all factories in the process
+request_metrics = RequestMetrics()
+
+# A forked child must not inherit (and later re-report) the parent's metrics
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=request_metrics._after_fork)
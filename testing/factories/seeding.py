@@ -0,0 +1,50 @@
+"""
+Deterministic random streams for reproducible test data.
+
+With Config.SEED set, every payload builder draws from its own
+random.Random seeded from (SEED, worker, stream). Each pytest-xdist
+worker and each factory instance gets an independent stream, so parallel
+runs with the same seed produce identical data regardless of how work is
+interleaved. Without a seed, streams are seeded from OS entropy.
+"""
+
+import hashlib
+import os
+from typing import Optional, Union
+
+from .config import Config
+
+StreamKey = Union[str, int]
+
+
+def derive_seed(seed: int, *stream: StreamKey) -> int:
+    """
+    Derive an independent 64-bit child seed for a named stream.
+
+    Args:
+        seed: Parent seed
+        *stream: Stream path, e.g. ("gw0", "payloads", 3)
+
+    Returns:
+        Child seed
+    """
+    key = "/".join(str(part) for part in (seed, *stream))
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big")
+
+
+def resolve_seed(seed: Optional[int], *stream: StreamKey) -> Optional[int]:
+    """
+    Pick the seed for a generator.
+
+    Args:
+        seed: Explicit seed; used as-is when given
+        *stream: Stream path under Config.SEED and the current worker
+
+    Returns:
+        Explicit seed, seed derived from Config.SEED, or None (unseeded)
+    """
+    if seed is not None:
+        return seed
+    if Config.SEED is None:
+        return None
+    return derive_seed(Config.SEED, os.getenv("PYTEST_XDIST_WORKER", "main"), *stream)
@@ -0,0 +1,288 @@
+"""
+Compact item and user spec records.
+
+ItemSpec and UserSpec are __slots__ classes: fields live in fixed slots
+instead of a per-object dict (about 30% less memory per generated item;
+most of the rest is the name and description strings). They convert to
+and from the existing dict format, and a spec sent as a request body is
+serialized straight to JSON by to_json() without building an intermediate
+dict (see JsonCodec.encode_body). For fully columnar storage use
+ItemBatch, whose iter_specs yields ItemSpecs.
+"""
+
+import json
+import math
+from json.encoder import encode_basestring_ascii
+from typing import Optional, Dict, Any, List, Tuple
+
+from .helpers import generate_unique_email, generate_valid_password
+
+# Item fields held in slots; anything else goes to ItemSpec.extra
+ITEM_FIELDS = (
+    "name", "description", "item_type", "price", "category", "tags",
+    "weight", "dimensions", "download_url", "file_size", "duration_hours"
+)
+_OPTIONAL_ITEM_FIELDS = ITEM_FIELDS[5:]
+
+
+def _encode(value: Any) -> str:
+    """
+    Encode one value exactly as json.dumps(allow_nan=False) would.
+
+    Raises:
+        ValueError: If value is or contains NaN or an infinite float
+    """
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if value_type is int:
+        return repr(value)
+    if value_type is float:
+        if not math.isfinite(value):
+            raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+        return repr(value)
+    return json.dumps(value, separators=(",", ":"), allow_nan=False)
+
+
+class _SlotsRecord:
+    """Equality and repr over __slots__ for the spec records."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class ItemSpec(_SlotsRecord):
+    """Item payload record (same fields as ItemPayloads dicts)."""
+
+    __slots__ = ITEM_FIELDS + ("extra",)
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        item_type: str,
+        price: float,
+        category: str,
+        tags: Optional[List[str]] = None,
+        weight: Optional[float] = None,
+        dimensions: Optional[Tuple[float, float, float]] = None,
+        download_url: Optional[str] = None,
+        file_size: Optional[int] = None,
+        duration_hours: Optional[int] = None,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize ItemSpec.
+
+        Args:
+            name, description, item_type, price, category: Common item fields
+            tags: Optional list of tags
+            weight, dimensions: PHYSICAL fields; dimensions is (length, width, height)
+            download_url, file_size: DIGITAL fields
+            duration_hours: SERVICE field
+            extra: Other fields, and fields explicitly set to None
+        """
+        self.name = name
+        self.description = description
+        self.item_type = item_type
+        self.price = price
+        self.category = category
+        self.tags = tags
+        self.weight = weight
+        self.dimensions = dimensions
+        self.download_url = download_url
+        self.file_size = file_size
+        self.duration_hours = duration_hours
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ItemSpec":
+        """
+        Build a spec from an item data dictionary.
+
+        Unknown fields, fields explicitly set to None and dimensions that
+        are not a complete {"length", "width", "height"} dict are kept in
+        extra, so to_dict round-trips the input.
+
+        Args:
+            data: Item data dictionary
+
+        Returns:
+            ItemSpec
+        """
+        values = {}
+        extra = {}
+
+        for key, value in data.items():
+            if key not in ITEM_FIELDS or value is None:
+                extra[key] = value
+            elif key == "dimensions":
+                if isinstance(value, dict) and value.keys() == {"length", "width", "height"}:
+                    values[key] = (value["length"], value["width"], value["height"])
+                else:
+                    extra[key] = value
+            else:
+                values[key] = value
+
+        # Required fields may be missing (negative test cases); keep them absent
+        spec = cls(
+            values.pop("name", None),
+            values.pop("description", None),
+            values.pop("item_type", None),
+            values.pop("price", None),
+            values.pop("category", None),
+            **values
+        )
+        if extra:
+            spec.extra = extra
+        return spec
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the item data dictionary the factories and API use.
+
+        Returns:
+            Item data dictionary (fields that are None are omitted)
+        """
+        return dict(self._fields())
+
+    def to_json(self) -> str:
+        """
+        Serialize to compact JSON without building a dict.
+
+        Returns:
+            JSON object string, equal to json.dumps(to_dict(), separators=(",", ":"))
+        """
+        return "{" + ",".join(
+            f"{encode_basestring_ascii(key)}:{_encode(value)}" for key, value in self._fields()
+        ) + "}"
+
+    def _fields(self):
+        """Yield (key, value) pairs in payload order."""
+        if self.name is not None:
+            yield "name", self.name
+        if self.description is not None:
+            yield "description", self.description
+        if self.item_type is not None:
+            yield "item_type", self.item_type
+        if self.price is not None:
+            yield "price", self.price
+        if self.category is not None:
+            yield "category", self.category
+        for key in _OPTIONAL_ITEM_FIELDS:
+            value = getattr(self, key)
+            if value is None:
+                continue
+            if key == "dimensions":
+                value = {"length": value[0], "width": value[1], "height": value[2]}
+            yield key, value
+        if self.extra:
+            yield from self.extra.items()
+
+
+class UserSpec(_SlotsRecord):
+    """User signup record (fields UserFactory.create_user accepts)."""
+
+    __slots__ = ("email", "password", "role", "first_name", "last_name")
+
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        role: str = "EDITOR",
+        first_name: str = "Test",
+        last_name: str = "User"
+    ):
+        """
+        Initialize UserSpec.
+
+        Args:
+            email: User's email
+            password: User's password
+            role: ADMIN, EDITOR, or VIEWER (default: "EDITOR")
+            first_name: First name (default: "Test")
+            last_name: Last name (default: "User")
+        """
+        self.email = email
+        self.password = password
+        self.role = role
+        self.first_name = first_name
+        self.last_name = last_name
+
+    @classmethod
+    def generate(cls, role: str = "EDITOR", first_name: str = "Test", last_name: str = "User") -> "UserSpec":
+        """
+        Build a spec with a unique email and a valid password.
+
+        Args:
+            role: ADMIN, EDITOR, or VIEWER (default: "EDITOR")
+            first_name: First name (default: "Test")
+            last_name: Last name (default: "User")
+
+        Returns:
+            UserSpec
+        """
+        return cls(generate_unique_email(), generate_valid_password(), role, first_name, last_name)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UserSpec":
+        """
+        Build a spec from a user dictionary.
+
+        Accepts signup payload keys (firstName/lastName) as well as
+        first_name/last_name, e.g. users returned by UserFactory.
+
+        Args:
+            data: User dictionary with at least email and password
+
+        Returns:
+            UserSpec
+        """
+        return cls(
+            data["email"],
+            data["password"],
+            data.get("role", "EDITOR"),
+            data.get("firstName", data.get("first_name", "Test")),
+            data.get("lastName", data.get("last_name", "User"))
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the signup payload format (without OTP).
+
+        Returns:
+            {"firstName", "lastName", "email", "password", "role"}
+        """
+        return {
+            "firstName": self.first_name,
+            "lastName": self.last_name,
+            "email": self.email,
+            "password": self.password,
+            "role": self.role
+        }
+
+    def to_json(self) -> str:
+        """Serialize the signup payload to compact JSON without building a dict."""
+        return (
+            f'{{"firstName":{_encode(self.first_name)},"lastName":{_encode(self.last_name)},'
+            f'"email":{_encode(self.email)},"password":{_encode(self.password)},'
+            f'"role":{_encode(self.role)}}}'
+        )
+
+    def create_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for UserFactory.create_user."""
+        return {
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "email": self.email,
+            "password": self.password,
+            "role": self.role
+        }
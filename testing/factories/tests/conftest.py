@@ -0,0 +1,138 @@
+"""
+Shared setup for the factory unit tests.
+
+Puts the repository root on sys.path, so `pytest` works from the repo root,
+from testing/factories (as in the README) or with any path to this
+directory, and provides fake HTTP sessions so no API is needed.
+"""
+
+import importlib
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+import requests
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from testing.factories.cleanup_ledger import cleanup_ledger  # noqa: E402
+from testing.factories.config import Config  # noqa: E402
+
+# The package re-exports the rate_limiter instance under the module's name
+base_factory_module = importlib.import_module("testing.factories.base_factory")
+async_base_factory_module = importlib.import_module("testing.factories.async_base_factory")
+
+
+def make_response(status_code, body=None, headers=None, url="http://test/api/v1/items"):
+    """Build a requests.Response with a JSON (or raw bytes) body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body if isinstance(body, bytes) else json.dumps({} if body is None else body).encode()
+    response.headers.update(headers or {})
+    response.url = url
+    return response
+
+
+class FakeSession:
+    """
+    Stands in for a requests session: answers each request with the next
+    scripted outcome (or from a handler) and records it.
+
+    An outcome is a status code, a (status, body) or (status, body, headers)
+    tuple, a requests.Response, or an exception to raise. A handler gets the
+    recorded request dict and returns an outcome; it runs outside the lock,
+    so concurrent callers really overlap.
+    """
+
+    def __init__(self, *outcomes, handler=None):
+        self.outcomes = list(outcomes)
+        self.handler = handler
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, data=None, params=None, timeout=None):
+        request = {
+            "method": method,
+            "url": url,
+            "path": url.split("/api/v1", 1)[-1],
+            "headers": dict(headers or {}),
+            "params": params,
+            "data": data,
+            "json": json.loads(data) if data else None
+        }
+        with self._lock:
+            self.requests.append(request)
+            outcome = None if self.handler else self.outcomes.pop(0)
+        if self.handler:
+            outcome = self.handler(request)
+
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, requests.Response):
+            return outcome
+        if isinstance(outcome, int):
+            return make_response(outcome, url=url)
+        return make_response(*outcome, url=url)
+
+    def paths(self):
+        """Request paths in the order they were sent, e.g. "/items/batch"."""
+        return [request["path"] for request in self.requests]
+
+
+class _FakeAiohttpResponse:
+    """The parts of an aiohttp response the async factories read."""
+
+    def __init__(self, response):
+        self.status = response.status_code
+        self.headers = dict(response.headers)
+        self._content = response.content
+
+    async def read(self):
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeAsyncSession(FakeSession):
+    """FakeSession for the async factories, shaped like an aiohttp.ClientSession."""
+
+    closed = False
+
+    def request(self, method, url, headers=None, data=None, params=None, **kwargs):
+        return _FakeAiohttpResponse(super().request(method, url, headers=headers, data=data, params=params))
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """No pacing, no retry backoff, no ledger files: nothing real is sent or created."""
+    monkeypatch.setattr(base_factory_module.rate_limiter, "enabled", False)
+    monkeypatch.setattr(base_factory_module, "RETRY_BACKOFF_FACTOR", 0)
+    monkeypatch.setattr(async_base_factory_module, "RETRY_BACKOFF_FACTOR", 0)
+    monkeypatch.setattr(cleanup_ledger, "enabled", False)
+    monkeypatch.setattr(Config, "MAX_RETRIES", 3)
+
+
+@pytest.fixture
+def fake_session():
+    """Factory for FakeSession; assign the result to a factory's session."""
+    return FakeSession
+
+
+@pytest.fixture
+def fake_async_session():
+    """
+    Factory for FakeAsyncSession; return the result from an async factory's
+    _create_session so the session is picked up on first request.
+    """
+    return FakeAsyncSession
@@ -0,0 +1,63 @@
+"""
+Unit tests for AsyncBaseFactory request handling (requires aiohttp; no API
+needed: the session is faked).
+"""
+
+import asyncio
+import importlib
+
+import pytest
+import requests
+
+pytest.importorskip("aiohttp")
+
+from testing.factories.async_base_factory import AsyncBaseFactory
+from testing.factories.config import Config
+
+async_base_factory_module = importlib.import_module("testing.factories.async_base_factory")
+
+
+@pytest.fixture
+def make_factory(offline, fake_async_session):
+    def make(*outcomes):
+        factory = AsyncBaseFactory(base_url="http://test/api/v1")
+        session = fake_async_session(*outcomes)
+        factory._create_session = lambda: session
+        return factory
+    return make
+
+
+def test_429_without_retry_after_backs_off(make_factory, monkeypatch):
+    """FlowHub's rate limiter sends no Retry-After; a 429 is still resent with backoff."""
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(async_base_factory_module, "RETRY_BACKOFF_FACTOR", 1)
+    monkeypatch.setattr(async_base_factory_module.asyncio, "sleep", sleep)
+    factory = make_factory(429, 429, 201)
+
+    response = asyncio.run(factory.post("/items", {"name": "x"}))
+
+    assert response.status_code == 201
+    assert sleeps == [1, 2]
+    assert len(factory.session.requests) == 3
+
+
+def test_429_resends_capped_at_max_retries(make_factory):
+    factory = make_factory(*[429] * (Config.MAX_RETRIES + 1))
+
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(factory.get("/items"))
+
+    assert len(factory.session.requests) == Config.MAX_RETRIES + 1
+
+
+def test_5xx_on_post_not_resent_by_default(make_factory):
+    factory = make_factory(503)
+
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(factory.post("/items", {"name": "x"}))
+
+    assert len(factory.session.requests) == 1
@@ -0,0 +1,126 @@
+"""
+Unit tests for the async item and user factories (requires aiohttp; no API
+needed: the session is faked).
+"""
+
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+import requests
+
+pytest.importorskip("aiohttp")
+
+from testing.factories.async_item_factory import AsyncItemFactory
+from testing.factories.async_user_factory import AsyncUserFactory
+from testing.factories.config import Config
+from testing.factories.item_payloads import ItemPayloads
+from testing.factories.specs import ItemSpec
+from testing.factories.token_cache import token_cache
+
+ITEM_ID = "65a1b2c3d4e5f6a7b8c9d0e1"
+
+
+def make_token(role: str = "EDITOR") -> str:
+    """Unsigned JWT valid for an hour."""
+    claims = json.dumps({"exp": time.time() + 3600, "role": role}).encode()
+    return f"header.{base64.urlsafe_b64encode(claims).decode().rstrip('=')}.signature"
+
+
+@pytest.fixture
+def make_factory(offline, fake_async_session):
+    def make(factory_class, *outcomes, handler=None):
+        factory = factory_class(base_url="http://test/api/v1")
+        session = fake_async_session(*outcomes, handler=handler)
+        factory._create_session = lambda: session
+        return factory
+    return make
+
+
+@pytest.fixture
+def spec():
+    return ItemSpec.from_dict(ItemPayloads(seed=1).create_digital_item())
+
+
+def exists(found: bool):
+    return 200, {"results": [{"exists": found, "item_id": ITEM_ID if found else None}]}
+
+
+def test_create_item_accepts_item_spec(make_factory, spec):
+    factory = make_factory(AsyncItemFactory, (201, {"data": {"_id": ITEM_ID, "name": spec.name}}))
+
+    created = asyncio.run(factory.create_item_via_api(spec, "token", validate=True))
+
+    assert created["_id"] == ITEM_ID
+    assert factory.session.requests[0]["json"] == spec.to_dict()
+
+
+def test_create_item_resent_when_check_exists_finds_nothing(make_factory, spec):
+    factory = make_factory(AsyncItemFactory, 503, exists(False), (201, {"data": {"_id": ITEM_ID}}))
+
+    assert asyncio.run(factory.create_item_via_api(spec, "token"))["_id"] == ITEM_ID
+
+    assert factory.session.paths() == ["/items", "/items/check-exists", "/items"]
+    assert factory.session.requests[1]["json"] == {"items": [{"name": spec.name, "category": spec.category}]}
+
+
+def test_create_item_uses_item_created_by_failed_attempt(make_factory, spec):
+    """A 5xx that was applied is not resent; the created item is fetched instead."""
+    factory = make_factory(AsyncItemFactory, 503, exists(True), (200, {"data": {"_id": ITEM_ID}}))
+
+    assert asyncio.run(factory.create_item_via_api(spec, "token"))["_id"] == ITEM_ID
+
+    assert factory.session.paths() == ["/items", "/items/check-exists", f"/items/{ITEM_ID}"]
+
+
+def test_wait_for_item_count_polls(make_factory, monkeypatch):
+    monkeypatch.setattr(Config, "SEED_POLL_INTERVAL", 0.001)
+    monkeypatch.setattr(Config, "SEED_POLL_MAX_INTERVAL", 0.002)
+    counts = [(200, {"status": "success", "count": n}) for n in (0, 4, 10)]
+    factory = make_factory(AsyncItemFactory, *counts)
+
+    assert asyncio.run(factory.wait_for_item_count("token", 10, timeout=5)) == 10
+    assert factory.session.paths() == ["/items/count"] * 3
+
+
+@pytest.fixture
+def login_ok():
+    token = make_token()
+    yield 200, {"token": token, "user": {"email": "async@example.com"}}
+    token_cache.invalidate(email="async@example.com")
+
+
+def test_login_shares_the_token_cache(make_factory, login_ok, monkeypatch):
+    """Concurrent logins of one account send one request; later ones hit the cache."""
+    monkeypatch.setattr(Config, "TOKEN_CACHE_ENABLED", True)
+    factory = make_factory(AsyncUserFactory, handler=lambda request: login_ok)
+
+    async def run():
+        first = await asyncio.gather(*(factory.login("async@example.com", "secret", use_cache=True) for _ in range(5)))
+        return first + [await factory.login("async@example.com", "secret", use_cache=True)]
+
+    results = asyncio.run(run())
+
+    assert len(factory.session.requests) == 1
+    assert all(result["token"] == login_ok[1]["token"] for result in results)
+
+
+def test_login_without_cache_always_sends(make_factory, login_ok):
+    factory = make_factory(AsyncUserFactory, login_ok, login_ok)
+
+    asyncio.run(factory.login("async@example.com", "secret", use_cache=False))
+    asyncio.run(factory.login("async@example.com", "secret", use_cache=False))
+
+    assert len(factory.session.requests) == 2
+
+
+def test_failed_login_is_not_cached(make_factory, login_ok, monkeypatch):
+    monkeypatch.setattr(Config, "TOKEN_CACHE_ENABLED", True)
+    factory = make_factory(AsyncUserFactory, (401, {"message": "Invalid credentials"}), login_ok)
+
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(factory.login("async@example.com", "secret", use_cache=True))
+
+    assert asyncio.run(factory.login("async@example.com", "secret", use_cache=True))["token"] == login_ok[1]["token"]
@@ -0,0 +1,149 @@
+"""
+Unit tests for BaseFactory request handling: resending non-idempotent
+requests only when safe, Idempotency-Key headers and 429 backoff (no API
+needed: the session is faked).
+"""
+
+import importlib
+
+import pytest
+import requests
+
+from testing.factories.base_factory import BaseFactory, IDEMPOTENCY_KEY_HEADER
+from testing.factories.config import Config
+
+base_factory_module = importlib.import_module("testing.factories.base_factory")
+
+
+@pytest.fixture
+def make_factory(offline, fake_session):
+    def make(*outcomes):
+        factory = BaseFactory(base_url="http://test/api/v1")
+        factory.session = fake_session(*outcomes)
+        return factory
+    return make
+
+
+def test_post_not_resent_by_default(make_factory):
+    """A 5xx on a POST may have been applied, so it is not resent blindly."""
+    factory = make_factory(503)
+
+    with pytest.raises(requests.HTTPError):
+        factory.post("/items", {"name": "x"})
+
+    assert len(factory.session.requests) == 1
+
+
+def test_post_resent_when_safe_with_same_idempotency_key(make_factory):
+    factory = make_factory(502, requests.ConnectionError("reset"), 201)
+
+    response = factory.post("/items", {"name": "x"}, safe_to_retry=True)
+
+    sent = factory.session.requests
+    assert response.status_code == 201
+    assert len(sent) == 3
+    assert len({request["headers"][IDEMPOTENCY_KEY_HEADER] for request in sent}) == 1
+    assert sent[0]["data"] == sent[2]["data"] == b'{"name":"x"}'
+
+
+@pytest.mark.parametrize("applied, expected_requests", [(False, 2), (True, 1)])
+def test_check_decides_resend_after_timeout(make_factory, applied, expected_requests):
+    """After an ambiguous failure the check is asked whether the request was applied."""
+    checks = []
+
+    def not_applied():
+        checks.append(1)
+        return not applied
+
+    factory = make_factory(requests.Timeout("read timeout"), 201)
+
+    if applied:
+        with pytest.raises(requests.Timeout):
+            factory.post("/items", {"name": "x"}, safe_to_retry=not_applied)
+    else:
+        assert factory.post("/items", {"name": "x"}, safe_to_retry=not_applied).status_code == 201
+
+    assert len(checks) == 1
+    assert len(factory.session.requests) == expected_requests
+
+
+def test_failing_check_does_not_resend(make_factory):
+    def broken_check():
+        raise requests.ConnectionError("API down")
+
+    factory = make_factory(503)
+
+    with pytest.raises(requests.HTTPError):
+        factory.post("/items", {"name": "x"}, safe_to_retry=broken_check)
+    assert len(factory.session.requests) == 1
+
+
+def test_resends_capped_at_max_retries(make_factory):
+    factory = make_factory(503, 503, 503, 503, 201)
+
+    with pytest.raises(requests.HTTPError):
+        factory.post("/items", {"name": "x"}, safe_to_retry=True)
+
+    assert len(factory.session.requests) == Config.MAX_RETRIES + 1
+
+
+def test_idempotent_methods_left_to_session_retries(make_factory):
+    """GET/PUT/DELETE are retried by the session's urllib3 Retry, not resent here."""
+    factory = make_factory(503)
+
+    with pytest.raises(requests.HTTPError):
+        factory.get("/items")
+
+    assert len(factory.session.requests) == 1
+    assert IDEMPOTENCY_KEY_HEADER not in factory.session.requests[0]["headers"]
+
+
+def test_can_resend():
+    assert not BaseFactory._can_resend("PUT", "/items/1", True, 0, "HTTP 503")
+    assert not BaseFactory._can_resend("POST", "/items", False, 0, "HTTP 503")
+    assert not BaseFactory._can_resend("POST", "/items", True, Config.MAX_RETRIES, "HTTP 503")
+    assert BaseFactory._can_resend("POST", "/items", True, 0, "HTTP 503")
+    assert BaseFactory._can_resend("POST", "/items", lambda: True, 0, "timeout")
+
+
+def test_caller_headers_are_not_modified(make_factory):
+    """Each request gets its own Idempotency-Key; the caller's dict is reused safely."""
+    factory = make_factory(201, 201)
+    headers = {"Authorization": "Bearer token"}
+
+    factory.post("/items", {"name": "a"}, headers=headers)
+    factory.post("/items", {"name": "b"}, headers=headers)
+
+    sent = factory.session.requests
+    assert headers == {"Authorization": "Bearer token"}
+    assert sent[0]["headers"][IDEMPOTENCY_KEY_HEADER] != sent[1]["headers"][IDEMPOTENCY_KEY_HEADER]
+    assert sent[0]["headers"]["Content-Type"] == "application/json"
+
+
+def test_caller_idempotency_key_is_kept(make_factory):
+    factory = make_factory(201)
+
+    factory.post("/items", {"name": "a"}, headers={IDEMPOTENCY_KEY_HEADER: "fixed"})
+
+    assert factory.session.requests[0]["headers"][IDEMPOTENCY_KEY_HEADER] == "fixed"
+
+
+def test_429_without_retry_after_backs_off(make_factory, monkeypatch):
+    """FlowHub's rate limiter sends no Retry-After; a 429 is still resent with backoff."""
+    sleeps = []
+    monkeypatch.setattr(base_factory_module, "RETRY_BACKOFF_FACTOR", 1)
+    monkeypatch.setattr(base_factory_module.time, "sleep", sleeps.append)
+    factory = make_factory(429, 429, 201)
+
+    assert factory.post("/items", {"name": "x"}).status_code == 201
+    assert sleeps == [1, 2]
+    assert len(factory.session.requests) == 3
+
+
+def test_429_resends_capped_at_max_retries(make_factory):
+    factory = make_factory(*[429] * (Config.MAX_RETRIES + 1))
+
+    with pytest.raises(requests.HTTPError):
+        factory.get("/items")
+
+    assert len(factory.session.requests) == Config.MAX_RETRIES + 1
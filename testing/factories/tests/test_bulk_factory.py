@@ -0,0 +1,132 @@
+"""
+Unit tests for BulkFactory job polling: adaptive intervals, timeout,
+progress callbacks and throughput (no API needed: the session and clock
+are faked).
+"""
+
+import importlib
+
+import pytest
+
+from testing.factories.bulk_factory import BulkFactory
+from testing.factories.config import Config
+
+bulk_factory_module = importlib.import_module("testing.factories.bulk_factory")
+
+
+class FakeClock:
+    """Stands in for the time module inside bulk_factory; sleeps are recorded."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class JobsAPI:
+    """Serves scripted status sequences per job; each poll takes poll_time on the clock."""
+
+    def __init__(self, clock, statuses, poll_time=0.0):
+        self.clock = clock
+        self.statuses = {job_id: list(sequence) for job_id, sequence in statuses.items()}
+        self.poll_time = poll_time
+        self.started = []
+
+    def __call__(self, request):
+        if request["method"] == "POST":
+            job_id = f"job{len(self.started)}"
+            self.started.append(request["json"]["itemIds"])
+            return 201, {"job_id": job_id, "job_status": "pending", "total_items": len(request["json"]["itemIds"])}
+
+        self.clock.now += self.poll_time
+        sequence = self.statuses[request["path"].rsplit("/", 1)[-1]]
+        return 200, {"data": sequence.pop(0) if len(sequence) > 1 else sequence[0]}
+
+
+def status(success, total, completed=False, failed=0):
+    return {
+        "status": "completed" if completed else "processing",
+        "summary": {"total": total, "success": success, "failed": failed},
+        "skippedIds": []
+    }
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(bulk_factory_module, "time", fake)
+    monkeypatch.setattr(Config, "BULK_POLL_MIN_INTERVAL", 0.0)
+    monkeypatch.setattr(Config, "BULK_POLL_MAX_INTERVAL", 0.3)
+    return fake
+
+
+@pytest.fixture
+def make_factory(offline, fake_session):
+    def make(api):
+        factory = BulkFactory(base_url="http://test/api/v1")
+        factory.session = fake_session(handler=api)
+        return factory
+    return make
+
+
+def test_interval_doubles_while_stalled_and_resets_on_progress(clock, make_factory):
+    stalled = [status(0, 10)] * 5
+    api = JobsAPI(clock, {"job0": stalled + [status(5, 10), status(10, 10, completed=True)]})
+    factory = make_factory(api)
+
+    result = factory.wait_for_job("job0", "token", timeout=60)
+
+    assert clock.sleeps == [0.05, 0.1, 0.2, 0.3, 0.3]
+    assert result["polls"] == 7
+    assert result["success"] == 10
+
+
+def test_timeout_when_job_stalls(clock, make_factory):
+    factory = make_factory(JobsAPI(clock, {"job0": [status(3, 10)]}))
+
+    with pytest.raises(TimeoutError, match="3/10 items processed"):
+        factory.wait_for_job("job0", "token", timeout=1)
+
+    # The last sleep is cut short at the deadline
+    assert sum(clock.sleeps) == pytest.approx(1)
+
+
+def test_progress_callbacks_and_throughput(clock, make_factory):
+    """Jobs are polled round-robin; each callback reports totals across all jobs."""
+    api = JobsAPI(clock, {
+        "job0": [status(2, 4), status(3, 4, completed=True, failed=1)],
+        "job1": [status(2, 4), status(4, 4, completed=True)]
+    }, poll_time=0.5)
+    factory = make_factory(api)
+    progress = []
+
+    result = factory.run_bulk_operation(
+        "delete", [f"id{i}" for i in range(8)], "token", chunk_size=4, timeout=60, on_progress=progress.append
+    )
+
+    assert api.started == [[f"id{i}" for i in range(4)], [f"id{i}" for i in range(4, 8)]]
+    assert [(entry["job_id"], entry["processed"], entry["total"]) for entry in progress] == [
+        ("job0", 2, 4), ("job1", 4, 8), ("job0", 6, 8), ("job1", 8, 8)
+    ]
+    assert progress[1]["items_per_second"] == pytest.approx(4.0)
+    assert progress[1]["eta"] == pytest.approx(1.0)
+    assert progress[-1]["eta"] == 0
+    assert (result["total"], result["success"], result["failed"], result["polls"]) == (8, 7, 1, 4)
+    assert result["elapsed"] == pytest.approx(2.0)
+    assert result["items_per_second"] == pytest.approx(4.0)
+    assert clock.sleeps == []
+
+
+def test_invalid_operation_raises(make_factory, clock):
+    factory = make_factory(JobsAPI(clock, {}))
+
+    with pytest.raises(ValueError):
+        factory.start_bulk_operation("archive", ["id0"], "token")
+    with pytest.raises(ValueError):
+        factory.start_bulk_operation("delete", [], "token")
@@ -0,0 +1,148 @@
+"""
+Unit tests for the crash-safe cleanup ledger.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from testing.factories import cleanup_queue as cleanup_queue_module
+from testing.factories.cleanup_ledger import CleanupLedger, load_pending, sweep_orphans
+
+
+def make_ledger(directory, run_id: str = "run1") -> CleanupLedger:
+    return CleanupLedger(directory=str(directory), run_id=run_id, worker_id="gw0", enabled=True)
+
+
+def dead_pid() -> int:
+    """PID of a process that has exited."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_records_pending_entries(tmp_path):
+    """Created entities stay pending until resolved."""
+    ledger = make_ledger(tmp_path)
+    ledger.record("user", "u1")
+    ledger.record("item", "i1", owner_id="u2")
+    ledger.record("user_items", "u3")
+    ledger.record("item", "i2")
+    ledger.resolve("item", "i2")
+
+    assert load_pending(ledger.path) == {"user": ["u1"], "user_items": ["u3"], "item": ["i1"]}
+
+
+def test_user_cleanup_covers_owned_items(tmp_path):
+    """Items of a pending user are left to that user's cleanup, and resolved with it."""
+    ledger = make_ledger(tmp_path)
+    ledger.record("user", "u1")
+    ledger.record("item", "i1", owner_id="u1")
+    ledger.record("user_items", "u1")
+    assert load_pending(ledger.path) == {"user": ["u1"], "user_items": [], "item": []}
+
+    ledger.resolve("user", "u1")
+    assert load_pending(ledger.path) == {"user": [], "user_items": [], "item": []}
+
+
+def test_reset_resolves_everything(tmp_path):
+    """A database reset marks all earlier entries as done."""
+    ledger = make_ledger(tmp_path)
+    ledger.record("user", "u1")
+    ledger.resolve_all()
+    ledger.record("item", "i1")
+
+    assert load_pending(ledger.path) == {"user": [], "user_items": [], "item": ["i1"]}
+
+
+def test_truncated_line_is_ignored(tmp_path):
+    """A line cut off by a killed process does not break replay."""
+    ledger = make_ledger(tmp_path)
+    ledger.record("user", "u1")
+    ledger.close()
+    with open(ledger.path, "a", encoding="utf-8") as f:
+        f.write('{"op": "create", "kind": "us')
+
+    assert load_pending(ledger.path)["user"] == ["u1"]
+
+
+def test_invalid_kind_raises(tmp_path):
+    with pytest.raises(ValueError):
+        make_ledger(tmp_path).record("order", "o1")
+
+
+def test_close_deletes_fully_resolved_file(tmp_path):
+    """Nothing left to clean up: the file is removed; otherwise it is kept."""
+    done = make_ledger(tmp_path, "done")
+    done.record("user", "u1")
+    done.resolve("user", "u1")
+    done.close()
+
+    pending = make_ledger(tmp_path, "pending")
+    pending.record("user", "u1")
+    pending.close()
+
+    assert not os.path.exists(done.path)
+    assert os.path.exists(pending.path)
+
+
+def test_disabled_ledger_writes_nothing(tmp_path):
+    ledger = CleanupLedger(directory=str(tmp_path), run_id="run1", enabled=False)
+    ledger.record("user", "u1")
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_join_run_switches_file(tmp_path):
+    """Entries after join_run go to the new run's file."""
+    ledger = make_ledger(tmp_path, "old")
+    ledger.record("user", "u1")
+    old_path = ledger.path
+
+    ledger.join_run("new")
+    ledger.record("user", "u2")
+
+    assert ledger.path != old_path
+    assert load_pending(old_path)["user"] == ["u1"]
+    assert load_pending(ledger.path)["user"] == ["u2"]
+
+
+def test_sweep_orphans_replays_dead_ledgers(tmp_path, monkeypatch):
+    """Pending entries of exited processes are cleaned up and their files deleted."""
+    calls = []
+
+    class FakeCleanupFactory:
+        def __init__(self, base_url=None):
+            pass
+
+        def cleanup_user_data(self, user_id, include_otp=True, include_activity_logs=True):
+            calls.append(("user", user_id))
+
+        def cleanup_user_items(self, user_id):
+            calls.append(("user_items", user_id))
+
+        def cleanup_single_item(self, item_id):
+            calls.append(("item", item_id))
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(cleanup_queue_module, "CleanupFactory", FakeCleanupFactory)
+
+    orphan = tmp_path / f"run1-gw0-{dead_pid()}.jsonl"
+    orphan.write_text(
+        '{"op": "create", "kind": "user", "id": "u1"}\n'
+        '{"op": "create", "kind": "item", "id": "i1"}\n'
+        '{"op": "create", "kind": "user_items", "id": "u2"}\n'
+    )
+    live = tmp_path / f"run1-gw1-{os.getpid()}.jsonl"
+    live.write_text('{"op": "create", "kind": "user", "id": "u9"}\n')
+
+    result = sweep_orphans(directory=str(tmp_path), workers=2)
+
+    assert result == {"files": 1, "users": 1, "user_items": 1, "items": 1, "failed": 0}
+    assert sorted(calls) == [("item", "i1"), ("user", "u1"), ("user_items", "u2")]
+    assert not orphan.exists()
+    assert live.exists()
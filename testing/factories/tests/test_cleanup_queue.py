@@ -0,0 +1,128 @@
+"""
+Unit tests for the deferred cleanup queue (no API needed: CleanupFactory is faked).
+"""
+
+import threading
+
+import pytest
+import requests
+
+from testing.factories import cleanup_queue as cleanup_queue_module
+from testing.factories.cleanup_queue import CleanupQueue
+
+
+class FakeCleanupFactory:
+    """Records cleanup calls; optionally blocks or fails."""
+
+    instances = []
+    gate = None
+    fail_with = None
+
+    def __init__(self, base_url=None):
+        self.calls = []
+        self.closed = False
+        FakeCleanupFactory.instances.append(self)
+
+    def _run(self, call):
+        if FakeCleanupFactory.gate is not None:
+            FakeCleanupFactory.gate.wait()
+        if FakeCleanupFactory.fail_with is not None:
+            raise FakeCleanupFactory.fail_with
+        self.calls.append(call)
+        return {"status": "success"}
+
+    def cleanup_single_item(self, item_id):
+        return self._run(("item", item_id))
+
+    def cleanup_user_data(self, user_id, include_otp=True, include_activity_logs=True):
+        return self._run(("user", user_id))
+
+    def cleanup_user_items(self, user_id):
+        return self._run(("user_items", user_id))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_factory(monkeypatch):
+    FakeCleanupFactory.instances = []
+    FakeCleanupFactory.gate = None
+    FakeCleanupFactory.fail_with = None
+    monkeypatch.setattr(cleanup_queue_module, "CleanupFactory", FakeCleanupFactory)
+
+
+def http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+def test_runs_all_queued_work():
+    """Every enqueued call runs once; flush reports the counts."""
+    queue = CleanupQueue(workers=4, timeout=5)
+    for i in range(20):
+        queue.enqueue_item(f"item{i}")
+    queue.enqueue_user_data("user1")
+    queue.enqueue_user_items("user2")
+
+    stats = queue.flush()
+    queue.close()
+
+    calls = [call for factory in FakeCleanupFactory.instances for call in factory.calls]
+    assert stats == {"completed": 22, "failed": 0, "cancelled": 0, "pending": 0}
+    assert sorted(calls) == sorted(
+        [("item", f"item{i}") for i in range(20)] + [("user", "user1"), ("user_items", "user2")]
+    )
+    assert all(factory.closed for factory in FakeCleanupFactory.instances)
+
+
+def test_one_factory_per_worker_thread():
+    """Factories are created per worker thread, not per task."""
+    queue = CleanupQueue(workers=2, timeout=5)
+    for i in range(50):
+        queue.enqueue_item(f"item{i}")
+    queue.close()
+
+    assert 1 <= len(FakeCleanupFactory.instances) <= 2
+
+
+def test_missing_item_counts_as_cleaned_up():
+    """A 404 on item delete is not a failure; other errors are."""
+    FakeCleanupFactory.fail_with = http_error(404)
+    queue = CleanupQueue(workers=1, timeout=5)
+    item_future = queue.enqueue_item("gone")
+    user_future = queue.enqueue_user_data("user1")
+    stats = queue.close()
+
+    assert item_future.result() == {}
+    assert isinstance(user_future.exception(), requests.HTTPError)
+    assert stats == {"completed": 1, "failed": 1, "cancelled": 0, "pending": 0}
+
+
+def test_close_cancels_work_not_started():
+    """close() returns after its timeout and drops queued work (works on Python 3.8)."""
+    FakeCleanupFactory.gate = threading.Event()
+    queue = CleanupQueue(workers=1, timeout=0.1)
+    running = queue.enqueue_item("running")
+    queued = [queue.enqueue_item(f"queued{i}") for i in range(3)]
+
+    stats = queue.close()
+    FakeCleanupFactory.gate.set()
+
+    assert stats == {"completed": 0, "failed": 0, "cancelled": 3, "pending": 1}
+    assert all(future.cancelled() for future in queued)
+    assert running.result(timeout=5) == {"status": "success"}
+
+
+def test_cancelled_work_is_logged_as_leaked(caplog):
+    FakeCleanupFactory.gate = threading.Event()
+    queue = CleanupQueue(workers=1, timeout=0.05)
+    queue.enqueue_item("running")
+    queue.enqueue_item("queued")
+
+    with caplog.at_level("WARNING"):
+        queue.close()
+    FakeCleanupFactory.gate.set()
+
+    assert any("item queued" in record.getMessage() and "leaked" in record.getMessage() for record in caplog.records)
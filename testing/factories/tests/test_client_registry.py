@@ -0,0 +1,82 @@
+"""
+Unit tests for the shared connection pool with thread-local sessions.
+"""
+
+import os
+import threading
+
+import pytest
+
+from testing.factories.base_factory import BaseFactory
+from testing.factories.client_registry import IDEMPOTENT_METHODS, ClientRegistry, client_registry, retry_strategy
+
+
+def test_session_per_thread_over_one_adapter():
+    registry = ClientRegistry(pool_connections=2, pool_maxsize=8)
+    sessions = []
+
+    def worker():
+        sessions.append(registry.session())
+        sessions.append(registry.session())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(session) for session in sessions}) == 4
+    assert all(session.get_adapter("http://api/") is registry.adapter for session in sessions)
+    assert all(session.get_adapter("https://api/") is registry.adapter for session in sessions)
+    assert registry.adapter._pool_maxsize == 8
+
+
+def test_same_thread_reuses_session():
+    registry = ClientRegistry()
+
+    assert registry.session() is registry.session()
+
+
+def test_close_keeps_sessions_usable():
+    registry = ClientRegistry()
+    session = registry.session()
+
+    registry.close()
+
+    assert registry.session() is session
+
+
+def test_retry_policy_excludes_post():
+    """POST is only resent by BaseFactory after its safe_to_retry check."""
+    retry = retry_strategy()
+
+    assert "POST" not in retry.allowed_methods
+    assert set(retry.allowed_methods) == IDEMPOTENT_METHODS
+    assert 429 not in retry.status_forcelist
+
+
+def test_factories_share_the_registry_session():
+    first, second = BaseFactory(), BaseFactory()
+
+    assert first.session is second.session is client_registry.session()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_gets_new_pool():
+    parent_session = client_registry.session()
+    parent_adapter = client_registry.adapter
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        fresh = client_registry.session() is not parent_session and client_registry.adapter is not parent_adapter
+        os.write(write_fd, b"1" if fresh else b"0")
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as f:
+        result = f.read()
+    os.waitpid(pid, 0)
+
+    assert result == b"1"
+    assert client_registry.session() is parent_session
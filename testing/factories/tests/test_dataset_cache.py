@@ -0,0 +1,134 @@
+"""
+Unit tests for the content-addressed dataset cache.
+"""
+
+import os
+
+import pytest
+
+from testing.factories.config import Config
+from testing.factories.dataset_cache import DatasetCache
+from testing.factories.edge_generators import get_all_edge_cases
+from testing.factories.item_payloads import ItemPayloads
+from testing.factories.negative_generators import get_negative_test_cases
+
+
+class CountingGenerator:
+    """generate callable that counts how often it runs."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return iter(self.rows)
+
+
+def test_generates_once_then_reads_from_file(tmp_path):
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+    generate = CountingGenerator([{"a": 1}, {"b": [1, 2]}, "row"])
+    spec = {"kind": "test", "n": 3}
+
+    first = list(cache.dataset(spec, generate))
+    second = list(cache.dataset(spec, generate))
+
+    assert first == second == [{"a": 1}, {"b": [1, 2]}, "row"]
+    assert generate.calls == 1
+    assert os.path.exists(cache.path(spec))
+
+
+def test_key_ignores_spec_key_order(tmp_path):
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+
+    assert cache.key({"a": 1, "b": 2}) == cache.key({"b": 2, "a": 1})
+    assert cache.key({"a": 1}) != cache.key({"a": 2})
+
+
+def test_partial_generation_is_not_published(tmp_path):
+    """A consumer that stops early leaves no cache file (and no temp file) behind."""
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+    spec = {"kind": "test"}
+
+    rows = cache.dataset(spec, CountingGenerator([1, 2, 3]))
+    next(rows)
+    rows.close()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_empty_dataset(tmp_path):
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+    generate = CountingGenerator([])
+
+    assert list(cache.dataset({"kind": "empty"}, generate)) == []
+    assert list(cache.dataset({"kind": "empty"}, generate)) == []
+    assert generate.calls == 1
+
+
+def test_disabled_cache_always_generates(tmp_path):
+    cache = DatasetCache(directory=str(tmp_path), enabled=False)
+    generate = CountingGenerator([1])
+
+    list(cache.dataset({"kind": "test"}, generate))
+    list(cache.dataset({"kind": "test"}, generate))
+
+    assert generate.calls == 2
+    assert os.listdir(tmp_path) == []
+
+
+def test_seeded_items_match_generated_payloads(tmp_path):
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+    expected = list(ItemPayloads(seed=3).iter_batch_items(20, "PHYSICAL"))
+
+    assert list(cache.items(20, "PHYSICAL", seed=3)) == expected
+    assert list(cache.items(20, "PHYSICAL", seed=3)) == expected
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_unseeded_items_bypass_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "SEED", None)
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+
+    assert len(list(cache.items(5))) == 5
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("load, build", [
+    (DatasetCache.edge_cases, get_all_edge_cases),
+    (DatasetCache.negative_cases, get_negative_test_cases)
+])
+def test_seeded_catalogs_are_cached(tmp_path, load, build):
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+    expected = build(seed=3)
+
+    assert load(cache, seed=3) == expected
+    assert load(cache, seed=3) == expected
+    assert load(cache, seed=4) != expected
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_unseeded_catalogs_bypass_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "SEED", None)
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+
+    assert cache.edge_cases().keys() == get_all_edge_cases().keys()
+    assert cache.negative_cases().keys() == get_negative_test_cases().keys()
+    assert os.listdir(tmp_path) == []
+
+
+def test_clear_removes_cached_files(tmp_path):
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+    list(cache.dataset({"kind": "a"}, CountingGenerator([1])))
+    list(cache.dataset({"kind": "b"}, CountingGenerator([2])))
+
+    assert cache.clear() == 2
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("row", [{"name": "Ünïcode ✓"}, {"nested": {"list": [1.5, None, True]}}])
+def test_rows_round_trip(tmp_path, row):
+    cache = DatasetCache(directory=str(tmp_path), enabled=True)
+    list(cache.dataset({"row": row}, CountingGenerator([row])))
+
+    assert list(cache.dataset({"row": row}, CountingGenerator([]))) == [row]
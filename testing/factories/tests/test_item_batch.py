@@ -0,0 +1,86 @@
+"""
+Unit tests for the columnar ItemBatch generator (requires numpy).
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from testing.factories.helpers import name_key
+from testing.factories.item_batch import ItemBatch
+from testing.factories.item_validator import validate_items
+from testing.factories.specs import ItemSpec
+
+
+@pytest.mark.parametrize("item_type", ["PHYSICAL", "DIGITAL", "SERVICE"])
+def test_rows_pass_backend_validation(item_type):
+    """Generated payloads satisfy the backend rules, similar-names limit included."""
+    batch = ItemBatch(500, item_type, seed=1)
+
+    assert validate_items(batch) == {}
+
+
+def test_rows_are_unique_and_ordered():
+    batch = ItemBatch(120, "DIGITAL", name_prefix="Load", seed=1)
+    names = [item["name"] for item in batch]
+
+    assert len(batch) == 120
+    assert names == [f"{name_key(i, 'Load')} Load_{i}" for i in range(120)]
+    assert batch[-1] == batch[119]
+    with pytest.raises(IndexError):
+        batch[120]
+
+
+def test_batches_sharing_a_category_pass_similar_check():
+    """Name keys are offset per prefix, so separate batches do not pile onto the same keys."""
+    batches = [ItemBatch(200, "SERVICE", seed=seed) for seed in range(4)]
+
+    assert validate_items([item for batch in batches for item in batch]) == {}
+
+
+def test_prices_have_two_decimals_within_category_range():
+    batch = ItemBatch(1000, "PHYSICAL", category="Electronics", seed=1)
+
+    assert batch.prices.min() >= 10 and batch.prices.max() <= 50000
+    assert all(round(item["price"], 2) == item["price"] for item in batch)
+
+
+def test_same_seed_same_payloads():
+    """A seed reproduces the batch, names included."""
+    first = ItemBatch(50, "SERVICE", seed=42).to_list()
+    second = ItemBatch(50, "SERVICE", seed=42).to_list()
+    other = ItemBatch(50, "SERVICE", seed=43).to_list()
+
+    assert first == second
+    assert first != other
+
+
+def test_chunks_cover_all_rows():
+    batch = ItemBatch(120, "DIGITAL", seed=1)
+    chunks = list(batch.iter_chunks(50))
+
+    assert [len(chunk) for chunk in chunks] == [50, 50, 20]
+    assert [item for chunk in chunks for item in chunk] == batch.to_list()
+
+
+@pytest.mark.parametrize("item_type", ["PHYSICAL", "DIGITAL", "SERVICE"])
+def test_iter_specs_matches_rows(item_type):
+    """iter_specs yields ItemSpecs equal to the dict rows, overrides included."""
+    batch = ItemBatch(30, item_type, seed=1, tags=["load"])
+    specs = list(batch.iter_specs())
+
+    assert all(isinstance(spec, ItemSpec) for spec in specs)
+    assert [spec.to_dict() for spec in specs] == batch.to_list()
+
+
+def test_iter_json_matches_rows():
+    batch = ItemBatch(10, "PHYSICAL", seed=1)
+
+    assert [json.loads(row) for row in batch.iter_json()] == batch.to_list()
+
+
+def test_invalid_item_type_raises():
+    with pytest.raises(ValueError):
+        ItemBatch(1, "BUNDLE")
@@ -0,0 +1,167 @@
+"""
+Unit tests for ItemBatcher: coalescing item creations into POST /items/batch
+requests (no API needed: the session is faked).
+"""
+
+import threading
+
+import pytest
+import requests
+
+from testing.factories.item_batcher import ItemBatcher
+from testing.factories.item_factory import ItemFactory
+from testing.factories.item_payloads import ItemPayloads
+from testing.factories.item_validator import ItemValidationError
+from testing.factories.specs import ItemSpec
+
+
+def created_all(request):
+    """Handler answering a batch request with every item created."""
+    items = request["json"]["items"]
+    return 200, {
+        "created": len(items),
+        "failed": 0,
+        "results": [{"index": i, "status": "created", "item_id": f"id{i}"} for i in range(len(items))]
+    }
+
+
+@pytest.fixture
+def make_factory(offline, fake_session):
+    factories = []
+
+    def make(handler=created_all):
+        factory = ItemFactory(seed=1)
+        factory.session = fake_session(handler=handler)
+        factories.append(factory)
+        return factory
+
+    yield make
+    for factory in factories:
+        factory.disable_batching()
+
+
+@pytest.fixture
+def items():
+    return [ItemPayloads(seed=1).create_digital_item() for _ in range(5)]
+
+
+def test_full_batch_is_sent_by_the_submitting_thread(make_factory, items):
+    """Reaching max_batch_size sends at once, without waiting out the linger window."""
+    factory = make_factory()
+    batcher = ItemBatcher(factory, linger=60, max_batch_size=3)
+
+    futures = [batcher.submit(item, "token") for item in items[:3]]
+
+    assert all(future.done() for future in futures)
+    assert [future.result()["_id"] for future in futures] == ["id0", "id1", "id2"]
+    assert factory.session.paths() == ["/items/batch"]
+    assert factory.session.requests[0]["json"]["items"] == items[:3]
+    batcher.close()
+
+
+def test_partial_batch_is_flushed_after_linger(make_factory, items):
+    factory = make_factory()
+    batcher = ItemBatcher(factory, linger=0.05, max_batch_size=50)
+
+    futures = [batcher.submit(item, "token") for item in items[:2]]
+
+    assert [future.result(timeout=5)["_id"] for future in futures] == ["id0", "id1"]
+    assert len(factory.session.requests) == 1
+    batcher.close()
+
+
+def test_batches_are_per_token(make_factory, items):
+    factory = make_factory()
+    batcher = ItemBatcher(factory, linger=60, max_batch_size=50)
+
+    batcher.submit(items[0], "token-a")
+    batcher.submit(items[1], "token-b")
+    batcher.close()
+
+    authorization = sorted(request["headers"]["Authorization"] for request in factory.session.requests)
+    assert authorization == ["Bearer token-a", "Bearer token-b"]
+
+
+def test_request_error_reaches_every_future(make_factory, items):
+    factory = make_factory(handler=lambda request: requests.ConnectionError("API down"))
+    batcher = ItemBatcher(factory, linger=60, max_batch_size=2)
+
+    futures = [batcher.submit(item, "token") for item in items[:2]]
+
+    for future in futures:
+        with pytest.raises(requests.ConnectionError):
+            future.result(timeout=5)
+    batcher.close()
+
+
+def test_rejected_item_fails_only_its_future(make_factory, items):
+    def second_rejected(request):
+        return 200, {"created": 1, "failed": 1, "results": [
+            {"index": 0, "status": "created", "item_id": "id0"},
+            {"index": 1, "status": "failed", "reason": "Duplicate item"}
+        ]}
+
+    factory = make_factory(handler=second_rejected)
+    batcher = ItemBatcher(factory, linger=60, max_batch_size=2)
+
+    first, second = [batcher.submit(item, "token") for item in items[:2]]
+
+    assert first.result()["_id"] == "id0"
+    with pytest.raises(ValueError, match="Duplicate item"):
+        second.result()
+    batcher.close()
+
+
+def test_concurrent_submitters_share_batches(make_factory, items):
+    factory = make_factory()
+    batcher = ItemBatcher(factory, linger=0.05, max_batch_size=10)
+    futures = []
+    lock = threading.Lock()
+
+    def submit():
+        for item in items:
+            future = batcher.submit(dict(item), "token")
+            with lock:
+                futures.append(future)
+
+    threads = [threading.Thread(target=submit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert all(future.result(timeout=5)["_id"] for future in futures)
+    sent = sum(len(request["json"]["items"]) for request in factory.session.requests)
+    assert sent == 20
+    assert len(factory.session.requests) < 20
+
+
+def test_closed_batcher_rejects_items(make_factory, items):
+    batcher = ItemBatcher(make_factory(), linger=60)
+    batcher.close()
+
+    with pytest.raises(RuntimeError):
+        batcher.submit(items[0], "token")
+
+
+def test_submit_item_spec_through_batching(make_factory, items):
+    """ItemSpecs are validated and queued as dicts."""
+    factory = make_factory()
+    factory.enable_batching(linger=60, max_batch_size=1)
+
+    future = factory.submit_item_via_api(ItemSpec.from_dict(items[0]), "token", validate=True)
+
+    assert future.result(timeout=5) == {**items[0], "_id": "id0"}
+
+
+def test_invalid_item_fails_its_future_without_a_request(make_factory, items):
+    factory = make_factory()
+    factory.enable_batching(linger=60)
+
+    future = factory.submit_item_via_api(dict(items[0], price=-1), "token", validate=True)
+
+    with pytest.raises(ItemValidationError):
+        future.result()
+    factory.disable_batching()
+    assert factory.session.requests == []
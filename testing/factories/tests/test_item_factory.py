@@ -0,0 +1,293 @@
+"""
+Unit tests for ItemFactory's seeding helpers, paged iteration and batched
+sending (no API needed: the session is faked).
+"""
+
+import threading
+
+import pytest
+import requests
+
+from testing.factories.config import Config
+from testing.factories.item_factory import ItemFactory
+from testing.factories.item_payloads import ItemPayloads
+
+USER_ID = "65a1b2c3d4e5f6a7b8c9d0e1"
+
+
+@pytest.fixture
+def make_factory(offline, fake_session, monkeypatch):
+    monkeypatch.setattr(Config, "SEED_POLL_INTERVAL", 0.001)
+    monkeypatch.setattr(Config, "SEED_POLL_MAX_INTERVAL", 0.002)
+
+    def make(*responses):
+        factory = ItemFactory(seed=1)
+        factory.session = fake_session(*responses)
+        return factory
+    return make
+
+
+def count(n):
+    return 200, {"status": "success", "count": n}
+
+
+def test_wait_for_item_count_polls_until_seeded_items_are_visible(make_factory):
+    factory = make_factory(
+        (201, {"status": "success", "data": {"message": "Successfully seeded 10 items", "count": 10}}),
+        count(0), count(4), count(10)
+    )
+
+    factory.seed_items(USER_ID, 10)
+    assert factory.wait_for_item_count("token", 10, timeout=5) == 10
+
+    polls = factory.session.requests[1:]
+    assert len(polls) == 3
+    assert all(poll["url"].endswith("/items/count") for poll in polls)
+    assert all(poll["params"] == {"status": "active"} for poll in polls)
+
+
+def test_wait_for_item_count_times_out(make_factory):
+    factory = make_factory(*[count(3)] * 1000)
+
+    with pytest.raises(TimeoutError, match="3/10"):
+        factory.wait_for_item_count("token", 10, timeout=0.05)
+
+
+def test_wait_until_seeded_uses_seed_status(make_factory):
+    status = {"seed_complete": False, "total_items": 5, "required_count": 11, "missing_items": []}
+    factory = make_factory((200, status), (200, dict(status, total_items=11, seed_complete=True)))
+
+    result = factory.wait_until_seeded(USER_ID, "token", timeout=5)
+
+    assert result["seed_complete"]
+    assert factory.session.requests[0]["url"].endswith(f"/items/seed-status/{USER_ID}")
+
+
+def test_seed_items_rejects_invalid_user_id(make_factory):
+    with pytest.raises(ValueError):
+        make_factory().seed_items("not-an-id")
+
+
+def pages_api(pages, failing_page=None):
+    """Handler serving GET /items pages of the given sizes (1-based page param)."""
+    def handler(request):
+        page = request["params"]["page"]
+        if page == failing_page:
+            return 500, {"message": "Internal error"}
+        start = sum(pages[:page - 1])
+        items = [{"_id": f"id{i}"} for i in range(start, start + pages[page - 1])]
+        return 200, {"items": items, "pagination": {"page": page, "has_next": page < len(pages)}}
+    return handler
+
+
+def prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith("items-prefetch")]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_items_walks_pages_until_has_next_is_false(make_factory, fake_session, prefetch):
+    factory = make_factory()
+    factory.session = fake_session(handler=pages_api([2, 2, 1]))
+
+    items = factory.iter_items("token", filters={"status": "active"}, page_size=2, prefetch=prefetch)
+    ids = [item["_id"] for item in items]
+
+    assert ids == ["id0", "id1", "id2", "id3", "id4"]
+    assert [request["params"]["page"] for request in factory.session.requests] == [1, 2, 3]
+    assert all(request["params"]["status"] == "active" for request in factory.session.requests)
+
+
+def test_iter_items_raises_prefetched_page_error_after_current_page(make_factory, fake_session):
+    factory = make_factory()
+    factory.session = fake_session(handler=pages_api([2, 2, 2], failing_page=2))
+    seen = []
+
+    with pytest.raises(requests.HTTPError):
+        for item in factory.iter_items("token", page_size=2):
+            seen.append(item["_id"])
+
+    assert seen == ["id0", "id1"]
+    assert not prefetch_threads()
+
+
+def test_iter_items_closed_early_shuts_down_prefetch(make_factory, fake_session):
+    factory = make_factory()
+    factory.session = fake_session(handler=pages_api([2, 2, 2]))
+
+    items = factory.iter_items("token", page_size=2)
+    assert next(items)["_id"] == "id0"
+    items.close()
+
+    assert not prefetch_threads()
+    assert [request["params"]["page"] for request in factory.session.requests] == [1, 2]
+
+
+def test_iter_items_rejects_invalid_page_size(make_factory):
+    with pytest.raises(ValueError):
+        next(make_factory().iter_items("token", page_size=101))
+
+
+class ItemsAPI:
+    """
+    In-memory /items/batch and /items/check-exists.
+
+    Items match on lower-cased name and category, as in the backend. When
+    fail_next_batch is set, the next batch request creates that many of its
+    items and then answers 503, like a request that failed half-applied.
+    """
+
+    def __init__(self, existing=()):
+        self.items = {self.key(item): f"old{i}" for i, item in enumerate(existing)}
+        self.fail_next_batch = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(item):
+        return item["name"].lower(), item["category"].lower()
+
+    def __call__(self, request):
+        with self.lock:
+            if request["path"] == "/items/check-exists":
+                return 200, {"results": [self.exists(item) for item in request["json"]["items"]]}
+            return self.batch(request["json"]["items"], request["json"]["skip_existing"])
+
+    def exists(self, item):
+        item_id = self.items.get(self.key(item))
+        return {"name": item["name"], "category": item["category"], "exists": item_id is not None, "item_id": item_id}
+
+    def batch(self, items, skip_existing):
+        applied = len(items) if self.fail_next_batch is None else self.fail_next_batch
+        results = []
+        for index, item in enumerate(items[:applied]):
+            if self.key(item) in self.items:
+                status = "skipped" if skip_existing else "failed"
+                results.append({"index": index, "name": item["name"], "status": status, "reason": "Duplicate item"})
+            else:
+                item_id = self.items[self.key(item)] = f"new{len(self.items)}"
+                results.append({"index": index, "name": item["name"], "status": "created", "item_id": item_id})
+
+        if self.fail_next_batch is not None:
+            self.fail_next_batch = None
+            return 503, {"message": "Service unavailable"}
+
+        return 200, {
+            "created": sum(entry["status"] == "created" for entry in results),
+            "skipped": sum(entry["status"] == "skipped" for entry in results),
+            "failed": sum(entry["status"] == "failed" for entry in results),
+            "results": results
+        }
+
+
+def batch_sizes(session):
+    return [len(request["json"]["items"]) for request in session.requests if request["path"] == "/items/batch"]
+
+
+@pytest.fixture
+def items_api(make_factory, fake_session):
+    def make(existing=()):
+        api = ItemsAPI(existing)
+        factory = make_factory()
+        factory.session = fake_session(handler=api)
+        return factory, api
+    return make
+
+
+def test_send_items_streams_chunks_of_50(items_api):
+    factory, api = items_api()
+    results = []
+
+    payloads = ItemPayloads(seed=1).iter_batch_items(120)
+    summary = factory.send_items(payloads, "token", workers=2, on_result=results.append)
+
+    assert summary == {"created": 120, "skipped": 0, "failed": 0, "errors": []}
+    assert sorted(batch_sizes(factory.session)) == [20, 50, 50]
+    assert len(results) == 3 and len(api.items) == 120
+
+
+def test_send_items_reports_duplicates_as_failed(items_api):
+    payloads = list(ItemPayloads(seed=1).iter_batch_items(10))
+    factory, _ = items_api(existing=payloads[:3])
+
+    summary = factory.send_items(payloads, "token")
+
+    assert (summary["created"], summary["failed"]) == (7, 3)
+    assert [error["name"] for error in summary["errors"]] == [item["name"] for item in payloads[:3]]
+
+
+def test_send_items_rejects_batches_over_50(items_api):
+    factory, _ = items_api()
+
+    with pytest.raises(ValueError):
+        factory.send_items([], "token", batch_size=51)
+
+
+def test_check_items_exist_accepts_at_most_100(items_api):
+    payloads = list(ItemPayloads(seed=1).iter_batch_items(101))
+    factory, _ = items_api(existing=payloads[:1])
+
+    results = factory.check_items_exist(payloads[:100], "token")
+
+    assert [result["exists"] for result in results[:2]] == [True, False]
+    assert len(results) == 100
+    with pytest.raises(ValueError):
+        factory.check_items_exist(payloads, "token")
+    assert len(factory.session.requests) == 1
+
+
+def test_half_applied_batch_sends_only_the_rest(items_api):
+    """A 503 after 30 of 50 items were created: check-exists finds them, the other 20 are sent again."""
+    payloads = list(ItemPayloads(seed=1).iter_batch_items(50))
+    factory, api = items_api()
+    api.fail_next_batch = 30
+
+    result = factory.create_items_batch(payloads, "token")
+
+    assert factory.session.paths() == ["/items/batch", "/items/check-exists", "/items/batch"]
+    assert factory.session.requests[2]["json"]["items"] == payloads[30:]
+    assert result["created"] == 50
+    assert [entry["index"] for entry in result["results"]] == list(range(50))
+    assert all(entry["status"] == "created" and entry["item_id"] for entry in result["results"])
+    assert len(api.items) == 50
+
+
+def test_unapplied_batch_is_resent_whole(items_api):
+    payloads = list(ItemPayloads(seed=1).iter_batch_items(5))
+    factory, api = items_api()
+    api.fail_next_batch = 0
+
+    result = factory.create_items_batch(payloads, "token")
+
+    assert factory.session.paths() == ["/items/batch", "/items/check-exists", "/items/batch"]
+    assert factory.session.requests[2]["json"]["items"] == payloads
+    assert result["created"] == 5
+
+
+def test_ensure_items_creates_only_missing_items(items_api):
+    payloads = list(ItemPayloads(seed=1).iter_batch_items(250))
+    existing = payloads[::2]
+    factory, api = items_api(existing=existing)
+
+    summary = factory.ensure_items(iter(payloads), "token", workers=2)
+
+    checked = [len(request["json"]["items"]) for request in factory.session.requests
+               if request["path"] == "/items/check-exists"]
+    sent = [item for request in factory.session.requests if request["path"] == "/items/batch"
+            for item in request["json"]["items"]]
+    assert checked == [100, 100, 50]
+    assert sorted(item["name"] for item in sent) == sorted(item["name"] for item in payloads[1::2])
+    assert all(request["json"]["skip_existing"] for request in factory.session.requests
+               if request["path"] == "/items/batch")
+    assert (summary["created"], summary["skipped"], summary["failed"]) == (125, 125, 0)
+    assert len(api.items) == 250
+
+
+def test_ensure_items_rerun_only_checks(items_api):
+    """Names from iter_batch_items are stable, so a second run finds everything."""
+    factory, _ = items_api()
+    factory.ensure_items(ItemPayloads(seed=1).iter_batch_items(120), "token")
+    factory.session.requests.clear()
+
+    summary = factory.ensure_items(ItemPayloads(seed=2).iter_batch_items(120), "token")
+
+    assert factory.session.paths() == ["/items/check-exists", "/items/check-exists"]
+    assert (summary["created"], summary["skipped"]) == (0, 120)
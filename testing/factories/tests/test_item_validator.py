@@ -0,0 +1,212 @@
+"""
+Unit tests for the client-side item validator.
+
+Cases mirror the backend's POST /items integration tests
+(flowhub-core/backend/tests/integration/flow2-item-creation.test.js):
+the expected status is the one the backend returns for the same payload.
+"""
+
+import pytest
+
+from testing.factories.item_payloads import ItemPayloads
+from testing.factories.item_validator import (
+    ItemValidationError,
+    check_item,
+    normalize_category_js,
+    validate_item,
+    validate_items
+)
+
+PHYSICAL = {
+    "name": "Test Physical Item",
+    "description": "A physical item for testing",
+    "item_type": "PHYSICAL",
+    "price": 99.99,
+    "category": "Electronics",
+    "weight": 1.5,
+    "dimensions": {"length": 10, "width": 10, "height": 10}
+}
+
+DIGITAL = {
+    "name": "Test Digital Item",
+    "description": "A digital item for testing",
+    "item_type": "DIGITAL",
+    "price": 19.99,
+    "category": "Software",
+    "download_url": "https://example.com/download",
+    "file_size": 1024
+}
+
+SERVICE = {
+    "name": "Test Service Item",
+    "description": "A service item for testing",
+    "item_type": "SERVICE",
+    "price": 150.0,
+    "category": "Services",
+    "duration_hours": 2
+}
+
+
+def with_fields(base, **changes):
+    """Copy of base with fields changed (None removes the field)."""
+    item = dict(base)
+    for key, value in changes.items():
+        if value is None:
+            item.pop(key, None)
+        else:
+            item[key] = value
+    return item
+
+
+def status_of(item) -> int:
+    """Status the backend would return: 201, or the validation error status."""
+    try:
+        check_item(item)
+    except ItemValidationError as e:
+        return e.status_code
+    return 201
+
+
+@pytest.mark.parametrize("item", [PHYSICAL, DIGITAL, SERVICE], ids=["physical", "digital", "service"])
+def test_valid_items_pass(item):
+    assert validate_item(item) == []
+
+
+@pytest.mark.parametrize("changes, field", [
+    ({"name": None}, "name"),
+    ({"name": "ab"}, "name"),
+    ({"name": "a" * 101}, "name"),
+    ({"name": "Invalid@Name!"}, "name"),
+    ({"description": None}, "description"),
+    ({"description": "Too short"}, "description"),
+    ({"description": "a" * 501}, "description"),
+    ({"item_type": None}, "item_type"),
+    ({"item_type": "INVALID"}, "item_type"),
+    ({"price": None}, "price"),
+    ({"price": 0.001}, "price"),
+    ({"price": 1000000}, "price"),
+    ({"price": 99.999}, "price"),
+    ({"category": None}, "category"),
+    ({"category": "a" * 51}, "category"),
+    ({"tags": [f"tag{i}" for i in range(11)]}, "tags"),
+    ({"tags": ["Tag", "tag"]}, "tags"),
+    ({"tags": ["a" * 31]}, "tags[0]"),
+    ({"tags": "tag"}, "tags")
+])
+def test_schema_errors_are_422(changes, field):
+    errors = validate_item(with_fields(DIGITAL, **changes))
+
+    assert status_of(with_fields(DIGITAL, **changes)) == 422
+    assert field in [error["field"] for error in errors]
+
+
+@pytest.mark.parametrize("base, changes, field", [
+    (PHYSICAL, {"weight": None}, "weight"),
+    (PHYSICAL, {"dimensions": None}, "dimensions"),
+    (PHYSICAL, {"dimensions": {"length": 10, "width": 10}}, "dimensions"),
+    (DIGITAL, {"download_url": None}, "download_url"),
+    (DIGITAL, {"download_url": "ftp://example.com/file"}, "download_url"),
+    (DIGITAL, {"file_size": None}, "file_size"),
+    (SERVICE, {"duration_hours": None}, "duration_hours"),
+    (SERVICE, {"duration_hours": "abc"}, "duration_hours"),
+    (DIGITAL, {"weight": 2.0}, "item_type"),
+    (SERVICE, {"download_url": "https://example.com/download"}, "item_type")
+])
+def test_type_specific_fields_are_422(base, changes, field):
+    item = with_fields(base, **changes)
+
+    assert status_of(item) == 422
+    assert field in [error["field"] for error in validate_item(item)]
+
+
+@pytest.mark.parametrize("base, changes, message", [
+    (DIGITAL, {"category": "Electronics", "price": 99.99}, "Electronics category must be Physical"),
+    (PHYSICAL, {"category": "Software"}, "Software category must be Digital"),
+    (DIGITAL, {"category": "Services", "price": 50}, "Services category must be Service"),
+    (PHYSICAL, {"price": 9.99}, "Electronics price"),
+    (PHYSICAL, {"price": 50000.01}, "Electronics price"),
+    (with_fields(PHYSICAL, category="Books"), {"price": 4.99}, "Books price"),
+    (SERVICE, {"price": 24.99}, "Services price"),
+    (PHYSICAL, {"weight": 0}, "Weight must be greater than 0"),
+    (PHYSICAL, {"dimensions": {"length": 0, "width": 10, "height": 10}}, "Length must be greater than 0"),
+    (DIGITAL, {"file_size": 0}, "File size must be greater than 0"),
+    (SERVICE, {"duration_hours": 0}, "Duration hours must be a positive integer")
+])
+def test_business_rule_errors_are_400(base, changes, message):
+    item = with_fields(base, **changes)
+
+    with pytest.raises(ItemValidationError) as excinfo:
+        check_item(item)
+
+    assert excinfo.value.status_code == 400
+    assert any(message in error["message"] for error in excinfo.value.errors)
+
+
+@pytest.mark.parametrize("base, changes", [
+    (DIGITAL, {"name": "abc"}),
+    (DIGITAL, {"name": "a" * 100}),
+    (DIGITAL, {"name": "Name with-dash_and 123"}),
+    (DIGITAL, {"description": "a" * 10}),
+    (DIGITAL, {"description": "a" * 500}),
+    (with_fields(DIGITAL, category="Music"), {"price": 0.01}),
+    (with_fields(DIGITAL, category="Music"), {"price": 999999.99}),
+    (with_fields(DIGITAL, category="Music"), {"category": "M"}),
+    (with_fields(DIGITAL, category="Music"), {"category": "a" * 50}),
+    (DIGITAL, {"tags": [f"tag{i}" for i in range(10)]}),
+    (DIGITAL, {"tags": ["a" * 30]}),
+    (PHYSICAL, {"weight": 0.01}),
+    (PHYSICAL, {"dimensions": {"length": 0.1, "width": 0.1, "height": 0.1}}),
+    (PHYSICAL, {"price": 10.0}),
+    (PHYSICAL, {"price": 50000.0}),
+    (DIGITAL, {"price": "19.99"}),
+    (SERVICE, {"duration_hours": "3"})
+])
+def test_boundary_values_are_accepted(base, changes):
+    item = with_fields(base, **changes)
+
+    assert validate_item(item) == []
+
+
+def test_category_normalized_like_backend():
+    """Only the first letter of each word is upper-cased, as in the backend."""
+    assert normalize_category_js("  electronics ") == "Electronics"
+    assert normalize_category_js("home GARDEN") == "Home Garden"
+    assert status_of(with_fields(DIGITAL, category="electronics")) == 400
+
+
+def test_validate_items_reports_invalid_indexes():
+    items = [DIGITAL, with_fields(DIGITAL, name="ab"), PHYSICAL, with_fields(SERVICE, duration_hours=0)]
+
+    invalid = validate_items(items, check_similar=False)
+
+    assert sorted(invalid) == [1, 3]
+
+
+def test_validate_items_limits_similar_items():
+    """More than MAX_SIMILAR_ITEMS items with the same name prefix and category are rejected."""
+    items = [with_fields(DIGITAL, name=f"Widget {i}") for i in range(5)]
+
+    assert sorted(validate_items(items)) == [3, 4]
+    assert sorted(validate_items(items, similar_limit=1)) == [1, 2, 3, 4]
+    assert validate_items(items, check_similar=False) == {}
+
+
+def test_similar_prefix_collapses_whitespace_and_case():
+    """Prefixes are compared lower-cased with whitespace collapsed, as in the backend."""
+    items = [with_fields(DIGITAL, name=name, category=category) for name, category in (
+        ("Wid get one", "Software"), ("WID  GET two", "software"), (" wid\tget three", "Software"), ("Wid gets", "Software")
+    )]
+
+    assert sorted(validate_items(items)) == [3]
+
+@pytest.mark.parametrize("item_type", ["PHYSICAL", "DIGITAL", "SERVICE"])
+def test_generated_names_pass_similar_check(item_type):
+    """Generated names lead with a name key, so many items per category are not "similar"."""
+    batch = list(ItemPayloads(seed=1).iter_batch_items(200, item_type))
+    singles = [ItemPayloads().create_item(item_type) for _ in range(50)]
+
+    assert validate_items(batch) == {}
+    assert validate_items(singles) == {}
+    assert [item["name"] for item in batch] == [
+        item["name"] for item in ItemPayloads(seed=2).iter_batch_items(200, item_type)
+    ]
@@ -0,0 +1,99 @@
+"""
+Unit tests for the pluggable JSON codecs.
+"""
+
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from testing.factories import json_codec
+from testing.factories.json_codec import CODECS, get_codec
+from testing.factories.specs import ItemSpec, UserSpec
+
+AVAILABLE = [name for name, (_, available) in CODECS.items() if available()]
+
+ITEM = {
+    "name": "Ünïcode item",
+    "description": "Codec test item",
+    "item_type": "SERVICE",
+    "price": 25.5,
+    "category": "Services",
+    "duration_hours": 3
+}
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pytest.fixture(params=AVAILABLE)
+def codec(request):
+    return get_codec(request.param)
+
+
+def test_encode_is_compact_json(codec):
+    encoded = codec.encode({"a": [1, 2.5, None, True], "b": "ü"})
+
+    assert isinstance(encoded, bytes)
+    assert b" " not in encoded
+    assert json.loads(encoded) == {"a": [1, 2.5, None, True], "b": "ü"}
+
+
+def test_specs_nested_in_body_are_encoded(codec):
+    body = {"items": [ItemSpec.from_dict(ITEM), ItemSpec.from_dict(ITEM)]}
+
+    assert json.loads(codec.encode(body)) == {"items": [ITEM, ITEM]}
+
+
+def test_encode_body(codec):
+    """Bodies: None stays None, bytes/str pass through, specs use to_json()."""
+    spec = ItemSpec.from_dict(ITEM)
+    user = UserSpec("a@example.com", "Passw0rd!")
+
+    assert codec.encode_body(None) is None
+    assert codec.encode_body(b'{"a":1}') == b'{"a":1}'
+    assert codec.encode_body('{"a":1}') == b'{"a":1}'
+    assert codec.encode_body(spec) == spec.to_json().encode("utf-8")
+    assert json.loads(codec.encode_body(user)) == user.to_dict()
+    assert json.loads(codec.encode_body(ITEM)) == ITEM
+
+
+def test_decode(codec):
+    data = json.dumps([ITEM, ITEM]).encode()
+
+    assert codec.decode(data) == [ITEM, ITEM]
+    assert codec.decode(data.decode()) == [ITEM, ITEM]
+    assert codec.decode(data, ItemSpec) == [ItemSpec.from_dict(ITEM)] * 2
+    assert codec.decode(b'{"x": 1, "y": 2}', Point) == Point(1, 2)
+
+
+def test_decode_invalid_json_raises_value_error(codec):
+    with pytest.raises(ValueError):
+        codec.decode(b'{"a": ')
+
+
+def test_encode_unserializable_raises(codec):
+    with pytest.raises(TypeError):
+        codec.encode({"a": object()})
+
+
+def test_get_codec(monkeypatch):
+    monkeypatch.setattr(json_codec.Config, "JSON_CODEC", "json")
+    assert get_codec().name == "json"
+    assert get_codec("AUTO").name == AVAILABLE[0]
+    assert get_codec("json") is get_codec("json")
+
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_get_codec_missing_backend_raises():
+    missing = [name for name in CODECS if name not in AVAILABLE]
+    if not missing:
+        pytest.skip("all JSON codecs are installed")
+
+    with pytest.raises(ImportError):
+        get_codec(missing[0])
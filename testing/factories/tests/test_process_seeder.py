@@ -0,0 +1,102 @@
+"""
+Unit tests for the multi-process seeder's sharding, result aggregation and
+worker initialization (no API needed).
+"""
+
+import pytest
+
+from testing.factories.cleanup_ledger import cleanup_ledger
+from testing.factories.config import Config
+from testing.factories.process_seeder import ProcessPoolSeeder, _init_worker
+from testing.factories.request_metrics import EndpointStats, request_metrics
+from testing.factories.seeding import derive_seed
+from testing.factories.unique_ids import unique_ids
+
+
+def test_shards_are_whole_batches_one_per_process():
+    seeder = ProcessPoolSeeder(processes=4, threads=1)
+
+    shards = seeder._shard({"DIGITAL": 1000}, None, 50)
+
+    assert [shard["count"] for shard in shards] == [250, 250, 250, 250]
+    assert all(shard["count"] % 50 == 0 for shard in shards)
+
+
+def test_small_entries_are_not_split_below_a_batch():
+    seeder = ProcessPoolSeeder(processes=8, threads=1)
+
+    shards = seeder._shard({"PHYSICAL": 120, "SERVICE": 30}, None, 50)
+
+    assert [(shard["item_type"], shard["count"]) for shard in shards] == [
+        ("PHYSICAL", 50), ("PHYSICAL", 50), ("PHYSICAL", 20), ("SERVICE", 30)
+    ]
+
+
+def test_list_spec_overrides_and_default_type():
+    seeder = ProcessPoolSeeder(processes=2, threads=1)
+
+    shards = seeder._shard([{"count": 100, "category": "Books"}], None, 50)
+
+    assert [shard["count"] for shard in shards] == [50, 50]
+    assert all(shard["item_type"] == "DIGITAL" for shard in shards)
+    assert all(shard["overrides"] == {"category": "Books"} for shard in shards)
+
+
+def test_shard_seeds_are_derived_and_reproducible():
+    seeder = ProcessPoolSeeder(processes=3, threads=1)
+
+    first = seeder._shard({"DIGITAL": 300, "SERVICE": 100}, 7, 50)
+    second = seeder._shard({"DIGITAL": 300, "SERVICE": 100}, 7, 50)
+    seeds = [shard["seed"] for shard in first]
+
+    assert seeds == [shard["seed"] for shard in second]
+    assert len(set(seeds)) == len(seeds)
+    assert seeds[0] == derive_seed(7, "process-seeder", 0, 0)
+    assert all(shard["seed"] is None for shard in seeder._shard({"DIGITAL": 300}, None, 50))
+
+
+def test_entry_without_count_raises():
+    with pytest.raises(ValueError):
+        ProcessPoolSeeder(processes=2)._shard([{"item_type": "DIGITAL"}], None, 50)
+
+
+def test_batch_size_limit():
+    with pytest.raises(ValueError):
+        ProcessPoolSeeder(processes=2).seed({"DIGITAL": 10}, "token", batch_size=51)
+
+
+def test_collect_aggregates_shards_and_metrics():
+    request_metrics.reset()
+    stats = EndpointStats()
+    stats.requests = 2
+    summary = {"created": 0, "skipped": 0, "failed": 0, "errors": [], "workers": {}}
+
+    for created, failed in ((50, 0), (40, 10)):
+        ProcessPoolSeeder._collect(
+            {
+                "created": created, "skipped": 0, "failed": failed,
+                "errors": [{"name": "x", "reason": "duplicate"}] * failed,
+                "pid": 1234, "elapsed": 1.5, "metrics": {"POST /items/batch": stats}
+            },
+            summary
+        )
+
+    assert (summary["created"], summary["failed"], len(summary["errors"])) == (90, 10, 10)
+    assert summary["workers"][1234] == {"shards": 2, "created": 90, "skipped": 0, "failed": 10, "elapsed": 3.0}
+    assert request_metrics.snapshot()["POST /items/batch"]["requests"] == 4
+    request_metrics.reset()
+
+
+def test_init_worker_joins_parent_run(monkeypatch):
+    monkeypatch.setattr(Config, "API_BASE_URL", Config.API_BASE_URL)
+    run_id, ledger_run_id = unique_ids.run_id, cleanup_ledger.run_id
+
+    try:
+        _init_worker("parent01", "http://seed-host/api/v1")
+
+        assert unique_ids.next_id().startswith("parent01_")
+        assert cleanup_ledger.run_id == "parent01"
+        assert Config.API_BASE_URL == "http://seed-host/api/v1"
+    finally:
+        unique_ids.join_run(run_id)
+        cleanup_ledger.join_run(ledger_run_id)
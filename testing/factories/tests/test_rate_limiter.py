@@ -0,0 +1,189 @@
+"""
+Unit tests for the adaptive (AIMD) rate limiter.
+"""
+
+import email.utils
+import importlib
+import time
+
+import pytest
+
+from testing.factories.rate_limiter import (
+    AdaptiveRateLimiter,
+    EndpointLimiter,
+    endpoint_class,
+    parse_retry_after
+)
+
+# The package re-exports the rate_limiter instance under the module's name
+rate_limiter_module = importlib.import_module("testing.factories.rate_limiter")
+
+
+class FakeClock:
+    """Stands in for the time module inside rate_limiter."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return time.time()
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", fake)
+    return fake
+
+
+def make_limiter(max_rate=None, **kwargs):
+    options = {"min_rate": 1.0, "increase": 2.0, "decrease": 0.5, "cooldown": 1.0}
+    options.update(kwargs)
+    return EndpointLimiter("items", max_rate, **options)
+
+
+@pytest.mark.parametrize("endpoint, expected", [
+    ("/auth/login", "auth"),
+    ("/auth/signup/request-otp", "otp"),
+    ("/auth/verify-otp?x=1", "otp"),
+    ("/internal/seed", "internal"),
+    ("/items/batch", "items"),
+    ("/bulk-jobs", "items")
+])
+def test_endpoint_class(endpoint, expected):
+    assert endpoint_class(endpoint) == expected
+
+
+def test_parse_retry_after():
+    now = time.time()
+
+    assert parse_retry_after({"Retry-After": "3"}) == 3.0
+    assert parse_retry_after({"Retry-After": "-1"}) == 0.0
+    assert parse_retry_after({"Retry-After": email.utils.formatdate(now + 30, usegmt=True)}) == pytest.approx(30, abs=2)
+    assert parse_retry_after({"RateLimit-Reset": "7"}) == 7.0
+    assert parse_retry_after({"X-RateLimit-Reset": str(int(now + 20))}) == pytest.approx(20, abs=2)
+    assert parse_retry_after({"Retry-After": "soon", "X-RateLimit-Reset": "5"}) == 5.0
+    assert parse_retry_after({}) is None
+
+
+def test_token_bucket_spaces_requests(clock):
+    """At 10 req/s, a burst queues up 0.1 s apart."""
+    limiter = make_limiter(max_rate=10)
+
+    waits = [limiter.reserve() for _ in range(4)]
+
+    assert waits == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+
+def test_multiplicative_decrease_once_per_cooldown(clock):
+    """A 429 halves the rate; 429s from requests already in flight do not halve it again."""
+    limiter = make_limiter(max_rate=40)
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.rate == 20
+    assert limiter.throttled == 2
+
+    clock.now += 1.5
+    limiter.on_throttle()
+    assert limiter.rate == 10
+
+
+def test_decrease_stops_at_min_rate(clock):
+    limiter = make_limiter(max_rate=4, min_rate=3)
+
+    limiter.on_throttle()
+
+    assert limiter.rate == 3
+
+
+def test_additive_increase_up_to_ceiling(clock):
+    """Each success adds increase/rate, i.e. about `increase` req/s per second of traffic."""
+    limiter = make_limiter(max_rate=20)
+    limiter.on_throttle()
+    assert limiter.rate == 10
+
+    for _ in range(10):
+        limiter.on_success()
+    assert 11.5 < limiter.rate < 12.5
+
+    for _ in range(1000):
+        limiter.on_success()
+    assert limiter.rate == 20
+
+
+def test_retry_after_pauses_class(clock):
+    limiter = make_limiter(max_rate=100)
+
+    limiter.on_throttle(retry_after=5)
+
+    assert limiter.reserve() == pytest.approx(5)
+    clock.now += 5
+    assert limiter.reserve() < 0.1
+
+
+def test_unlimited_class_starts_limiting_at_half_observed_rate(clock):
+    """Without a ceiling, a 429 sizes the bucket from the observed request rate."""
+    limiter = make_limiter()
+    for _ in range(50):
+        assert limiter.reserve() == 0.0
+        clock.now += 0.01  # 100 req/s
+
+    limiter.on_throttle()
+
+    assert limiter.rate == pytest.approx(50)
+    assert limiter.reserve() > 0
+
+
+def test_throttle_without_history_only_pauses(clock):
+    limiter = make_limiter()
+
+    limiter.on_throttle(retry_after=2)
+
+    assert limiter.rate is None
+    assert limiter.reserve() == pytest.approx(2)
+
+
+def test_limit_lifted_when_demand_drops(clock):
+    """Once the rate far exceeds the observed demand, the class is unlimited again."""
+    limiter = make_limiter()
+    for _ in range(20):
+        limiter.reserve()
+        clock.now += 0.1  # 10 req/s
+    limiter.on_throttle()
+    assert limiter.rate == pytest.approx(5)
+
+    for _ in range(200):
+        limiter.reserve()
+        limiter.on_success()
+        clock.now += 0.1
+
+    assert limiter.rate is None
+
+
+def test_adaptive_limiter_routes_responses(clock, monkeypatch):
+    monkeypatch.setattr(rate_limiter_module.Config, "RATE_LIMIT_INCREASE", 2.0)
+    monkeypatch.setattr(rate_limiter_module.Config, "RATE_LIMIT_DECREASE", 0.5)
+    limiter = AdaptiveRateLimiter(enabled=True, max_rates={"auth": 8, "otp": 0, "items": 0, "internal": 0})
+
+    assert limiter.on_response("/auth/login", 429, {"Retry-After": "2"}) == 2.0
+    assert limiter.on_response("/auth/login", 200, {}) is None
+
+    stats = limiter.stats()
+    assert stats["auth"]["throttled"] == 1
+    assert stats["auth"]["rate"] == pytest.approx(4 + 2 / 4)
+    assert stats["items"] == {"rate": None, "observed_rate": 0.0, "throttled": 0}
+
+
+def test_disabled_limiter_is_a_no_op(clock):
+    limiter = AdaptiveRateLimiter(enabled=False)
+
+    assert limiter.reserve("/items") == 0.0
+    assert limiter.on_response("/items", 429, {"Retry-After": "5"}) is None
+    assert all(stats["throttled"] == 0 for stats in limiter.stats().values())
@@ -0,0 +1,101 @@
+"""
+Unit tests for per-endpoint request metrics.
+"""
+
+import json
+import pickle
+
+import pytest
+
+from testing.factories.request_metrics import LatencyHistogram, RequestMetrics, endpoint_template
+
+
+@pytest.mark.parametrize("endpoint, template", [
+    ("/items", "/items"),
+    ("/items?page=2&limit=50", "/items"),
+    ("/items/65a1b2c3d4e5f6a7b8c9d0e1", "/items/:id"),
+    ("/internal/items/65a1b2c3d4e5f6a7b8c9d0e1/permanent", "/internal/items/:id/permanent"),
+    ("/bulk-jobs/123e4567-e89b-12d3-a456-426614174000", "/bulk-jobs/:id"),
+    ("/items/seed-status/42", "/items/seed-status/:id"),
+    ("/items/batch", "/items/batch")
+])
+def test_endpoint_template(endpoint, template):
+    assert endpoint_template(endpoint) == template
+
+
+def test_histogram_percentiles_within_bucket_width():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(float(ms))
+
+    summary = histogram.summary()
+    assert summary["count"] == 1000
+    assert summary["avg"] == pytest.approx(500.5)
+    assert summary["max"] == 1000
+    for p, exact in (("p50", 500), ("p95", 950), ("p99", 990)):
+        assert exact <= summary[p] <= exact * 1.05
+
+
+def test_empty_histogram():
+    assert LatencyHistogram().summary() == {"count": 0, "avg": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+
+def test_record_groups_by_method_and_template():
+    metrics = RequestMetrics(enabled=True)
+    metrics.record("GET", "/items/65a1b2c3d4e5f6a7b8c9d0e1", 0.010, status=200, bytes_received=100)
+    metrics.record("GET", "/items/65a1b2c3d4e5f6a7b8c9d0e2", 0.020, status=404, retries=1)
+    metrics.record("GET", "/items/65a1b2c3d4e5f6a7b8c9d0e3", 0.030, status=None)
+    metrics.record("POST", "/items", 0.005, status=201, bytes_sent=50)
+
+    snapshot = metrics.snapshot()
+    stats = snapshot["GET /items/:id"]
+
+    assert list(snapshot) == ["GET /items/:id", "POST /items"]
+    assert stats["requests"] == 3
+    assert stats["statuses"] == {200: 1, 404: 1}
+    assert (stats["errors"], stats["retries"], stats["bytes_received"]) == (1, 1, 100)
+    assert stats["latency_ms"]["max"] == pytest.approx(30)
+    assert snapshot["POST /items"]["bytes_sent"] == 50
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = RequestMetrics(enabled=False)
+    metrics.record("GET", "/items", 0.01, status=200)
+
+    assert metrics.snapshot() == {}
+
+
+def test_export_and_merge_across_processes():
+    """Exported stats survive pickling (worker -> parent) and merge into the totals."""
+    parent, worker = RequestMetrics(enabled=True), RequestMetrics(enabled=True)
+    parent.record("POST", "/items/batch", 0.1, status=201)
+    worker.record("POST", "/items/batch", 0.3, status=201)
+    worker.record("POST", "/items/batch", 0.2, status=429, retries=2)
+
+    exported = pickle.loads(pickle.dumps(worker.export()))
+    parent.merge(exported)
+
+    stats = parent.snapshot()["POST /items/batch"]
+    assert worker.snapshot() == {}
+    assert stats["requests"] == 3
+    assert stats["statuses"] == {201: 2, 429: 1}
+    assert stats["retries"] == 2
+    assert stats["latency_ms"]["count"] == 3
+    assert stats["latency_ms"]["max"] == pytest.approx(300)
+
+
+def test_format_table_and_dump(tmp_path):
+    metrics = RequestMetrics(enabled=True)
+    metrics.record("GET", "/items", 0.01, status=200)
+    metrics.record("POST", "/items", 0.5, status=201)
+
+    table = metrics.format_table().splitlines()
+    assert table[0].startswith("endpoint")
+    assert table[1].startswith("POST /items")
+
+    path = tmp_path / "metrics.json"
+    metrics.dump(str(path))
+    assert json.loads(path.read_text())["GET /items"]["statuses"] == {"200": 1}
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
@@ -0,0 +1,58 @@
+"""
+Unit tests for deterministic seeding of payload streams.
+"""
+
+from testing.factories.config import Config
+from testing.factories.item_payloads import ItemPayloads
+from testing.factories.seeding import derive_seed, resolve_seed
+
+
+def test_derive_seed_is_deterministic():
+    """The same parent seed and stream path always give the same 64-bit seed."""
+    seed = derive_seed(42, "gw0", "payloads", 3)
+
+    assert seed == derive_seed(42, "gw0", "payloads", 3)
+    assert 0 <= seed < 2 ** 64
+
+
+def test_derive_seed_streams_are_independent():
+    seeds = {
+        derive_seed(42, "gw0", "payloads", 3),
+        derive_seed(42, "gw1", "payloads", 3),
+        derive_seed(42, "gw0", "payloads", 4),
+        derive_seed(43, "gw0", "payloads", 3),
+        derive_seed(42, "gw0", "payloads")
+    }
+
+    assert len(seeds) == 5
+
+
+def test_resolve_seed(monkeypatch):
+    """Explicit seed wins; otherwise derive from Config.SEED and the worker, or stay unseeded."""
+    monkeypatch.setattr(Config, "SEED", None)
+    assert resolve_seed(7, "payloads") == 7
+    assert resolve_seed(None, "payloads") is None
+
+    monkeypatch.setattr(Config, "SEED", 42)
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+    assert resolve_seed(None, "payloads", 0) == derive_seed(42, "gw2", "payloads", 0)
+
+    monkeypatch.delenv("PYTEST_XDIST_WORKER")
+    assert resolve_seed(None, "payloads", 0) == derive_seed(42, "main", "payloads", 0)
+
+
+def test_seeded_payloads_are_reproducible():
+    """Two builders with the same seed produce the same items, names included."""
+    first, second = ItemPayloads(seed=5), ItemPayloads(seed=5)
+
+    for item_type in ("PHYSICAL", "DIGITAL", "SERVICE"):
+        assert first.create_item(item_type) == second.create_item(item_type)
+    assert first.create_item("DIGITAL") != ItemPayloads(seed=6).create_item("DIGITAL")
+
+
+def test_split_streams_are_deterministic_and_distinct():
+    parent = ItemPayloads(seed=5)
+    a, b = parent.split(0), parent.split(1)
+
+    assert a.seed == ItemPayloads(seed=5).split(0).seed
+    assert a.create_item("SERVICE") != b.create_item("SERVICE")
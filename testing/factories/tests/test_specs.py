@@ -0,0 +1,104 @@
+"""
+Unit tests for the slotted ItemSpec and UserSpec records.
+"""
+
+import json
+
+import pytest
+
+from testing.factories.item_payloads import ItemPayloads
+from testing.factories.specs import ItemSpec, UserSpec
+
+ITEMS = [
+    {
+        "name": "Desk Lamp",
+        "description": "A lamp for the desk",
+        "item_type": "PHYSICAL",
+        "price": 49.99,
+        "category": "Electronics",
+        "tags": ["home", "light"],
+        "weight": 1.25,
+        "dimensions": {"length": 10.0, "width": 20, "height": 30.5}
+    },
+    {
+        "name": "Ünïcode \"quoted\" name",
+        "description": "Digital item\nwith a newline",
+        "item_type": "DIGITAL",
+        "price": 5,
+        "category": "Software",
+        "download_url": "https://example.com/download",
+        "file_size": 1024,
+        "is_featured": True
+    },
+    # Negative test payloads: missing required fields, explicit None, partial dimensions
+    {"description": "No name", "price": None, "dimensions": {"length": 1}},
+    {}
+]
+
+
+@pytest.mark.parametrize("item", ITEMS)
+def test_item_round_trip(item):
+    """from_dict/to_dict preserve the payload, including unknown and None fields."""
+    assert ItemSpec.from_dict(item).to_dict() == item
+
+
+@pytest.mark.parametrize("item", ITEMS)
+def test_item_to_json_equals_json_dumps(item):
+    spec = ItemSpec.from_dict(item)
+
+    assert spec.to_json() == json.dumps(spec.to_dict(), separators=(",", ":"))
+
+
+@pytest.mark.parametrize("changes", [
+    {"price": float("nan")},
+    {"price": float("inf")},
+    {"weight": float("-inf")},
+    {"extra_field": {"score": float("nan")}}
+])
+def test_item_to_json_rejects_non_finite_floats(changes):
+    """NaN and infinity are not valid JSON; to_json raises like json.dumps(allow_nan=False)."""
+    spec = ItemSpec.from_dict({**ITEMS[0], **changes})
+
+    with pytest.raises(ValueError):
+        json.dumps(spec.to_dict(), allow_nan=False)
+    with pytest.raises(ValueError):
+        spec.to_json()
+
+
+@pytest.mark.parametrize("item_type", ["PHYSICAL", "DIGITAL", "SERVICE"])
+def test_generated_payloads_convert(item_type):
+    item = ItemPayloads(seed=1).create_item(item_type)
+    data = item.to_dict() if isinstance(item, ItemSpec) else item
+
+    spec = ItemSpec.from_dict(data)
+    assert spec.to_dict() == data
+    assert json.loads(spec.to_json()) == data
+
+
+def test_item_equality_and_slots():
+    first, second = ItemSpec.from_dict(ITEMS[0]), ItemSpec.from_dict(ITEMS[0])
+
+    assert first == second
+    assert first != ItemSpec.from_dict(ITEMS[1])
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(AttributeError):
+        first.unknown_field = 1
+
+
+def test_user_spec_conversions():
+    spec = UserSpec("a@example.com", "Passw0rd!", "ADMIN", "Ann", "Lee")
+
+    assert spec.to_dict() == {
+        "firstName": "Ann", "lastName": "Lee", "email": "a@example.com", "password": "Passw0rd!", "role": "ADMIN"
+    }
+    assert json.loads(spec.to_json()) == spec.to_dict()
+    assert spec.to_json() == json.dumps(spec.to_dict(), separators=(",", ":"))
+    assert UserSpec.from_dict(spec.to_dict()) == spec
+    assert UserSpec.from_dict(spec.create_kwargs()) == spec
+
+
+def test_generated_users_are_unique():
+    specs = [UserSpec.generate(role="VIEWER") for _ in range(100)]
+
+    assert len({spec.email for spec in specs}) == 100
+    assert all(spec.role == "VIEWER" for spec in specs)
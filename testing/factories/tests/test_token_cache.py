@@ -0,0 +1,157 @@
+"""
+Unit tests for the process-wide login token cache.
+"""
+
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from testing.factories.token_cache import TokenCache, decode_jwt_payload
+
+
+def make_token(exp: float, role: str = "EDITOR") -> str:
+    """Unsigned JWT with the given exp and role claims."""
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp, "role": role}).encode()).decode()
+    return f"header.{payload.rstrip('=')}.signature"
+
+
+class CountingLogin:
+    """login_fn stand-in that counts calls."""
+
+    def __init__(self, exp_in: float = 3600, role: str = "EDITOR"):
+        self.calls = 0
+        self.exp_in = exp_in
+        self.role = role
+
+    def __call__(self):
+        self.calls += 1
+        return {"token": make_token(time.time() + self.exp_in, self.role), "user": {"n": self.calls}}
+
+
+def test_decode_jwt_payload():
+    """Claims are decoded without verification; malformed tokens give {}."""
+    assert decode_jwt_payload(make_token(123, "ADMIN")) == {"exp": 123, "role": "ADMIN"}
+    assert decode_jwt_payload("not-a-jwt") == {}
+    assert decode_jwt_payload(None) == {}
+
+
+def test_reuses_token_until_refresh_margin():
+    """Repeated logins of one account hit the cache; email case is ignored."""
+    cache = TokenCache(refresh_margin=60, refresh_ahead=0)
+    login = CountingLogin()
+
+    first = cache.get_or_login("User@Example.com", "secret", login)
+    second = cache.get_or_login("user@example.com", "secret", login)
+
+    assert login.calls == 1
+    assert first == second
+
+
+def test_returns_copies():
+    """Callers cannot modify the cached result."""
+    cache = TokenCache(refresh_margin=60, refresh_ahead=0)
+    login = CountingLogin()
+
+    cache.get_or_login("a@example.com", "secret", login)["user"]["n"] = 99
+
+    assert cache.get_or_login("a@example.com", "secret", login)["user"]["n"] == 1
+
+
+def test_key_includes_password_and_remember_me():
+    """A wrong password or another rememberMe flag never gets a cached token."""
+    cache = TokenCache(refresh_margin=60, refresh_ahead=0)
+    login = CountingLogin()
+
+    cache.get_or_login("a@example.com", "secret", login)
+    cache.get_or_login("a@example.com", "wrong", login)
+    cache.get_or_login("a@example.com", "secret", login, remember_me=True)
+    cache.get_or_login("a@example.com", "secret", login, remember_me=True)
+
+    assert login.calls == 3
+    assert TokenCache._key("a@example.com", "secret") != TokenCache._key("a@example.com", "secret", True)
+
+
+def test_expired_token_is_not_served():
+    """Tokens inside the refresh margin trigger a new login."""
+    cache = TokenCache(refresh_margin=60, refresh_ahead=0)
+    login = CountingLogin(exp_in=30)
+
+    cache.get_or_login("a@example.com", "secret", login)
+    cache.get_or_login("a@example.com", "secret", login)
+
+    assert login.calls == 2
+
+
+def test_concurrent_logins_share_one_request():
+    """Threads logging in to the same account wait for a single login."""
+    cache = TokenCache(refresh_margin=60, refresh_ahead=0)
+    started = threading.Event()
+    calls = []
+
+    def slow_login():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return {"token": make_token(time.time() + 3600)}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_login("a@example.com", "secret", slow_login)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+
+
+def test_failed_login_is_not_cached():
+    """A login error propagates and the next call retries."""
+    cache = TokenCache(refresh_margin=60, refresh_ahead=0)
+
+    def failing_login():
+        raise RuntimeError("locked out")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_login("a@example.com", "secret", failing_login)
+
+    login = CountingLogin()
+    cache.get_or_login("a@example.com", "secret", login)
+    assert login.calls == 1
+
+
+def test_invalidate_by_email_and_role():
+    """invalidate() drops only matching entries."""
+    cache = TokenCache(refresh_margin=60, refresh_ahead=0)
+    admin, editor = CountingLogin(role="ADMIN"), CountingLogin(role="EDITOR")
+    cache.get_or_login("admin@example.com", "secret", admin)
+    cache.get_or_login("editor@example.com", "secret", editor)
+
+    cache.invalidate(role="ADMIN")
+    cache.get_or_login("admin@example.com", "secret", admin)
+    cache.get_or_login("editor@example.com", "secret", editor)
+    assert (admin.calls, editor.calls) == (2, 1)
+
+    cache.invalidate(email="EDITOR@example.com")
+    cache.get_or_login("editor@example.com", "secret", editor)
+    assert editor.calls == 2
+
+
+def test_invalidate_by_token():
+    """invalidate(token=...) drops the entry holding a logged-out token only."""
+    cache = TokenCache(refresh_margin=60, refresh_ahead=0)
+    first, second = CountingLogin(), CountingLogin()
+    token = cache.get_or_login("a@example.com", "secret", first)["token"]
+    cache.get_or_login("b@example.com", "secret", second)
+
+    cache.invalidate(token=token)
+    cache.get_or_login("a@example.com", "secret", first)
+    cache.get_or_login("b@example.com", "secret", second)
+
+    assert (first.calls, second.calls) == (2, 1)
@@ -0,0 +1,83 @@
+"""
+Unit tests for the Snowflake-style unique ID generator.
+"""
+
+import os
+import threading
+
+import pytest
+
+from testing.factories.helpers import generate_unique_email, generate_unique_name
+from testing.factories.unique_ids import UniqueIdGenerator, unique_ids
+
+
+def test_ids_are_namespaced_by_run_and_worker():
+    generator = UniqueIdGenerator(run_id="abcd1234", worker_id="gw3")
+    first, second = generator.next_id(), generator.next_id()
+
+    assert first.startswith(f"abcd1234_gw3{os.getpid():x}_")
+    assert first != second
+    assert first.rsplit("_", 1)[1] == "0" and second.rsplit("_", 1)[1] == "1"
+
+
+def test_ids_unique_across_threads():
+    generator = UniqueIdGenerator(run_id="run")
+    ids = []
+    lock = threading.Lock()
+
+    def worker():
+        local = [generator.next_id() for _ in range(5000)]
+        with lock:
+            ids.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(ids) == len(set(ids)) == 40000
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_ids_unique_across_fork():
+    """A forked child continues in the same run with its own sequence."""
+    parent_ids = [unique_ids.next_id() for _ in range(3)]
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        child_ids = [unique_ids.next_id() for _ in range(1000)]
+        os.write(write_fd, "\n".join(child_ids).encode())
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        child_ids = f.read().split("\n")
+    os.waitpid(pid, 0)
+    parent_ids += [unique_ids.next_id() for _ in range(1000)]
+
+    assert len(child_ids) == 1000
+    assert not set(child_ids) & set(parent_ids)
+    assert all(child_id.startswith(f"{unique_ids.run_id}_") for child_id in child_ids)
+
+
+def test_join_run_restarts_sequence_in_new_run():
+    generator = UniqueIdGenerator(run_id="old", worker_id="")
+    before = generator.next_id()
+
+    generator.join_run("new")
+    after = generator.next_id()
+
+    assert generator.run_id == "new"
+    assert after.startswith("new_") and after.endswith("_0")
+    assert before.startswith("old_")
+
+
+def test_names_and_emails_carry_unique_ids():
+    names = {generate_unique_name("Test") for _ in range(1000)}
+    emails = {generate_unique_email() for _ in range(1000)}
+
+    assert len(names) == len(emails) == 1000
+    assert all(unique_ids.run_id in name for name in names)
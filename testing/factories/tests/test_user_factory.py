@@ -0,0 +1,152 @@
+"""
+Unit tests for UserFactory login and concurrent provisioning (no API
+needed: the session is faked).
+"""
+
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from testing.factories.config import Config
+from testing.factories.token_cache import token_cache
+from testing.factories.user_factory import UserFactory
+
+EMAIL = "login@example.com"
+
+
+def make_token(role: str = "EDITOR") -> str:
+    """Unsigned JWT valid for an hour."""
+    claims = json.dumps({"exp": time.time() + 3600, "role": role}).encode()
+    return f"header.{base64.urlsafe_b64encode(claims).decode().rstrip('=')}.signature"
+
+
+@pytest.fixture
+def make_factory(offline, fake_session, monkeypatch):
+    monkeypatch.setattr(Config, "TOKEN_CACHE_ENABLED", True)
+
+    def make(*outcomes, handler=None):
+        factory = UserFactory(base_url="http://test/api/v1")
+        factory.session = fake_session(*outcomes, handler=handler)
+        return factory
+
+    yield make
+    token_cache.invalidate()
+
+
+def login_ok():
+    return 200, {"token": make_token(), "user": {"email": EMAIL}}
+
+
+def test_login_is_not_cached_by_default(make_factory):
+    """Tests of login itself get a fresh token from every call."""
+    factory = make_factory(login_ok(), login_ok())
+
+    factory.login(EMAIL, "secret")
+    factory.login(EMAIL, "secret")
+
+    assert len(factory.session.requests) == 2
+
+
+def test_login_with_cache_reuses_token(make_factory):
+    factory = make_factory(login_ok())
+
+    first = factory.login(EMAIL, "secret", use_cache=True)
+    second = factory.login(EMAIL, "secret", use_cache=True)
+
+    assert len(factory.session.requests) == 1
+    assert first == second
+
+
+def test_logout_drops_cached_token(make_factory):
+    factory = make_factory(login_ok(), (200, {"message": "Logged out successfully"}), login_ok())
+
+    token = factory.login(EMAIL, "secret", use_cache=True)["token"]
+    factory.logout(token)
+    factory.login(EMAIL, "secret", use_cache=True)
+
+    assert factory.session.paths() == ["/auth/login", "/auth/logout", "/auth/login"]
+    assert factory.session.requests[1]["headers"]["Authorization"] == f"Bearer {token}"
+
+
+class SignupAPI:
+    """Handler for the signup sequence; VIEWER signups are rejected."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self.respond(request["path"], request["json"] or {}, request["params"] or {})
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    @staticmethod
+    def respond(path, body, params):
+        if path == "/auth/signup/request-otp":
+            return 200, {"message": "OTP sent"}
+        if path == "/internal/otp":
+            return 200, {"data": {"otp": "123456", "email": params["email"]}}
+        if path == "/auth/signup/verify-otp":
+            return 200, {"message": "OTP verified"}
+        if body["role"] == "VIEWER":
+            return 400, {"message": "Signup rejected"}
+        return 201, {"user": {"_id": f"id-{body['email']}", "email": body["email"], "role": body["role"]}}
+
+
+def test_create_users_follows_role_mix(make_factory):
+    factory = make_factory(handler=SignupAPI())
+
+    result = factory.create_users(20, {"EDITOR": 0.75, "ADMIN": 0.25}, workers=4)
+
+    roles = [user["role"] for user in result["users"]]
+    assert roles.count("EDITOR") == 15 and roles.count("ADMIN") == 5
+    # Interleaved, so any prefix follows the mix too
+    assert roles[:4].count("ADMIN") == 1
+    assert result["failures"] == []
+
+
+def test_create_users_reports_failures_without_aborting(make_factory):
+    factory = make_factory(handler=SignupAPI())
+
+    result = factory.create_users(6, {"EDITOR": 2, "VIEWER": 1}, workers=3)
+
+    failed = [index for index, user in enumerate(result["users"]) if user is None]
+    assert len(failed) == 2
+    assert sorted(failure["index"] for failure in result["failures"]) == failed
+    assert all(failure["step"] == "signup" and failure["role"] == "VIEWER" for failure in result["failures"])
+    assert all("400" in failure["error"] for failure in result["failures"])
+    assert all(user["password"] for user in result["users"] if user is not None)
+
+
+def test_create_users_reports_step_latency_and_elapsed(make_factory):
+    api = SignupAPI(delay=0.01)
+    factory = make_factory(handler=api)
+
+    result = factory.create_users(8, "EDITOR", workers=4)
+
+    latency = result["latency"]
+    assert set(latency) == {"request_otp", "get_otp", "verify_otp", "signup"}
+    assert all(stats["count"] == 8 for stats in latency.values())
+    assert all(stats["p50"] >= 0.01 for stats in latency.values())
+    assert result["elapsed"] >= 4 * 0.01
+    assert api.max_in_flight > 1
+
+
+def test_create_users_rejects_invalid_role_mix(make_factory):
+    factory = make_factory()
+
+    with pytest.raises(ValueError):
+        factory.create_users(2, {"OWNER": 1})
+    with pytest.raises(ValueError):
+        factory.create_users(2, {"EDITOR": 0})
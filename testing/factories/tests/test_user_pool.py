@@ -0,0 +1,139 @@
+"""
+Unit tests for the pool of reusable test users (no API needed: the user and
+cleanup factories are faked).
+"""
+
+from concurrent.futures import Future
+
+import pytest
+
+from testing.factories.user_pool import UserPool
+
+
+class FakeUserFactory:
+    """Creates numbered users and counts logins."""
+
+    def __init__(self):
+        self.created = []
+        self.logins = []
+
+    def create_user(self, role="EDITOR"):
+        user_id = f"user{len(self.created)}"
+        self.created.append(user_id)
+        return {"_id": user_id, "email": f"{user_id}@example.com", "password": "secret", "role": role}
+
+    def login(self, email, password, use_cache=False):
+        self.logins.append((email, use_cache))
+        return {"token": f"token-{email}-{len(self.logins)}"}
+
+
+class FakeCleanupFactory:
+    """Records cleaned-up user IDs; fails when fail is set."""
+
+    def __init__(self):
+        self.cleaned = []
+        self.fail = False
+
+    def cleanup_user_data(self, user_id):
+        if self.fail:
+            raise RuntimeError("cleanup failed")
+        self.cleaned.append(user_id)
+
+
+class FakeCleanupQueue:
+    """Hands back futures the test resolves itself."""
+
+    def __init__(self):
+        self.futures = {}
+
+    def enqueue_user_data(self, user_id):
+        future = self.futures[user_id] = Future()
+        return future
+
+
+@pytest.fixture
+def pool():
+    return UserPool(FakeUserFactory(), FakeCleanupFactory(), size_per_role=2)
+
+
+def test_released_user_is_reused(pool):
+    with pool.lease("ADMIN") as first:
+        pass
+    with pool.lease("admin") as second:
+        pass
+
+    assert second["_id"] == first["_id"]
+    assert pool.user_factory.created == ["user0"]
+    assert pool.cleanup_factory.cleaned == ["user0", "user0"]
+
+
+def test_acquire_logs_in_again_through_the_token_cache(pool):
+    """A reused account gets its token refreshed, from the token cache where possible."""
+    user_data = pool.acquire("EDITOR")
+    first_token = user_data["token"]
+    pool.release(user_data)
+
+    assert pool.acquire("EDITOR")["token"] != first_token
+    assert [use_cache for _, use_cache in pool.user_factory.logins] == [True, True]
+
+
+def test_user_dropped_when_cleanup_fails(pool):
+    user_data = pool.acquire("VIEWER")
+    pool.cleanup_factory.fail = True
+
+    pool.release(user_data)
+
+    assert pool.stats()["VIEWER"] == 0
+    assert pool.acquire("VIEWER")["_id"] != user_data["_id"]
+
+
+def test_discarded_user_is_cleaned_but_not_reused(pool):
+    user_data = pool.acquire("EDITOR")
+
+    pool.discard(user_data)
+
+    assert pool.cleanup_factory.cleaned == [user_data["_id"]]
+    assert pool.stats()["EDITOR"] == 0
+
+
+def test_warm_tops_up_each_role(pool):
+    pool.release(pool.acquire("ADMIN"))
+
+    pool.warm(["ADMIN", "EDITOR"])
+
+    assert pool.stats() == {"ADMIN": 2, "EDITOR": 2, "VIEWER": 0}
+    assert len(pool.user_factory.created) == 4
+
+
+def test_invalid_role_raises(pool):
+    with pytest.raises(ValueError):
+        pool.acquire("OWNER")
+
+
+def test_cleanup_queue_returns_user_once_cleanup_succeeds():
+    queue = FakeCleanupQueue()
+    pool = UserPool(FakeUserFactory(), FakeCleanupFactory(), size_per_role=1, cleanup_queue=queue)
+    kept, failed, cancelled = (pool.acquire("EDITOR") for _ in range(3))
+
+    for user_data in (kept, failed, cancelled):
+        pool.release(user_data)
+    assert pool.stats()["EDITOR"] == 0
+
+    queue.futures[kept["_id"]].set_result({"status": "success"})
+    queue.futures[failed["_id"]].set_exception(RuntimeError("cleanup failed"))
+    queue.futures[cancelled["_id"]].cancel()
+
+    assert pool.stats()["EDITOR"] == 1
+    assert pool.acquire("EDITOR")["_id"] == kept["_id"]
+    assert pool.cleanup_factory.cleaned == []
+
+
+def test_discard_with_cleanup_queue_does_not_return_user():
+    queue = FakeCleanupQueue()
+    pool = UserPool(FakeUserFactory(), FakeCleanupFactory(), cleanup_queue=queue)
+    user_data = pool.acquire("ADMIN")
+
+    pool.discard(user_data)
+    queue.futures[user_data["_id"]].set_result({"status": "success"})
+
+    assert pool.stats()["ADMIN"] == 0
@@ -0,0 +1,250 @@
+"""
+Process-wide cache of login results.
+
+Tokens are reused until shortly before their JWT "exp" claim, refreshed in
+the background when they get close to it, and concurrent logins for the
+same account share one request. This keeps repeated UserFactory.login
+calls (with use_cache=True, as the fixtures and user pool do) from
+tripping the backend's login rate limiter and account lockout.
+"""
+
+import asyncio
+import base64
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Callable, Awaitable, Tuple
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# (email, password fingerprint, remember_me)
+CacheKey = Tuple[str, str, bool]
+
+
+def decode_jwt_payload(token: str) -> Dict[str, Any]:
+    """
+    Decode the payload of a JWT without verifying its signature.
+
+    Args:
+        token: JWT string ("header.payload.signature")
+
+    Returns:
+        Payload claims as dictionary, or empty dict if token is malformed
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload))
+    except (AttributeError, IndexError, ValueError):
+        return {}
+
+
+class TokenCache:
+    """Thread-safe cache of login results keyed by account (sync and async callers)."""
+
+    def __init__(
+        self,
+        refresh_margin: Optional[float] = None,
+        refresh_ahead: Optional[float] = None
+    ):
+        """
+        Initialize TokenCache.
+
+        Args:
+            refresh_margin: Seconds before expiry after which a cached token is
+                            no longer returned (default: Config.TOKEN_REFRESH_MARGIN)
+            refresh_ahead: Seconds before expiry after which a background refresh
+                           starts (default: Config.TOKEN_REFRESH_AHEAD)
+        """
+        self.refresh_margin = Config.TOKEN_REFRESH_MARGIN if refresh_margin is None else refresh_margin
+        self.refresh_ahead = Config.TOKEN_REFRESH_AHEAD if refresh_ahead is None else refresh_ahead
+
+        self._entries: Dict[CacheKey, Dict[str, Any]] = {}
+        self._inflight: Dict[CacheKey, Future] = {}
+        self._async_inflight: Dict[CacheKey, "asyncio.Future"] = {}
+        self._lock = threading.Lock()
+
+    def get_or_login(
+        self,
+        email: str,
+        password: str,
+        login_fn: Callable[[], Dict[str, Any]],
+        remember_me: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Return a cached login result, or log in once and cache it.
+
+        Args:
+            email: User's email
+            password: User's password
+            login_fn: Performs the actual login and returns {"token": ..., "user": ...}
+            remember_me: The rememberMe flag login_fn logs in with (tokens of
+                         both kinds are cached separately)
+
+        Returns:
+            Copy of the login result
+
+        Raises:
+            Whatever login_fn raises
+        """
+        key = self._key(email, password, remember_me)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.time()
+
+            if entry and now < entry["exp"] - self.refresh_margin:
+                if now >= entry["exp"] - self.refresh_ahead and key not in self._inflight:
+                    future = self._inflight[key] = Future()
+                    threading.Thread(
+                        target=self._login,
+                        args=(key, login_fn, future),
+                        name="token-refresh",
+                        daemon=True
+                    ).start()
+                return copy.deepcopy(entry["result"])
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if owner:
+            self._login(key, login_fn, future)
+
+        return copy.deepcopy(future.result())
+
+    async def get_or_login_async(
+        self,
+        email: str,
+        password: str,
+        login_fn: Callable[[], Awaitable[Dict[str, Any]]],
+        remember_me: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Async get_or_login for the async factories; the cache is shared with it.
+
+        Coroutines logging in the same account concurrently share one
+        login. There is no background refresh: once a token is within
+        refresh_margin of expiry, the next call logs in again.
+
+        Args:
+            email: User's email
+            password: User's password
+            login_fn: Coroutine function performing the actual login
+            remember_me: The rememberMe flag login_fn logs in with
+
+        Returns:
+            Copy of the login result
+
+        Raises:
+            Whatever login_fn raises
+        """
+        key = self._key(email, password, remember_me)
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.time() < entry["exp"] - self.refresh_margin:
+                return copy.deepcopy(entry["result"])
+
+            task = self._async_inflight.get(key)
+            if task is None or task.get_loop() is not loop:
+                task = self._async_inflight[key] = loop.create_task(self._login_async(key, login_fn))
+
+        # Shielded: a cancelled waiter does not cancel the login others wait for
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def invalidate(
+        self,
+        email: Optional[str] = None,
+        role: Optional[str] = None,
+        token: Optional[str] = None
+    ) -> None:
+        """
+        Drop cached tokens.
+
+        Args:
+            email: Only drop tokens for this email (default: all)
+            role: Only drop tokens whose role claim matches (default: all)
+            token: Only drop the entry holding this access token (default: all)
+        """
+        with self._lock:
+            for key in list(self._entries):
+                entry = self._entries[key]
+                if email is not None and key[0] != email.lower():
+                    continue
+                if role is not None and entry["role"] != role:
+                    continue
+                if token is not None and entry["result"].get("token") != token:
+                    continue
+                del self._entries[key]
+
+    def _login(self, key: CacheKey, login_fn: Callable[[], Dict[str, Any]], future: Future) -> None:
+        """Run login_fn, store the result and resolve waiters."""
+        try:
+            result = login_fn()
+        except Exception as e:
+            logger.warning(f"Login for {key[0]} failed: {e}")
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            self._store(key, result)
+            self._inflight.pop(key, None)
+
+        future.set_result(result)
+
+    async def _login_async(self, key: CacheKey, login_fn: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Await login_fn and store the result."""
+        try:
+            result = await login_fn()
+        except Exception as e:
+            logger.warning(f"Login for {key[0]} failed: {e}")
+            raise
+        else:
+            with self._lock:
+                self._store(key, result)
+            return result
+        finally:
+            with self._lock:
+                if self._async_inflight.get(key) is asyncio.current_task():
+                    del self._async_inflight[key]
+
+    def _store(self, key: CacheKey, result: Dict[str, Any]) -> None:
+        """Cache a login result (call with the lock held)."""
+        claims = decode_jwt_payload(result.get("token", ""))
+        # Tokens without a readable exp claim are never served from cache
+        self._entries[key] = {
+            "result": copy.deepcopy(result),
+            "exp": claims.get("exp", 0),
+            "role": claims.get("role")
+        }
+
+    def _after_fork(self) -> None:
+        """Replace the lock and drop refreshes whose threads did not survive the fork."""
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._async_inflight = {}
+
+    @staticmethod
+    def _key(email: str, password: str, remember_me: bool = False) -> CacheKey:
+        """Cache key: email, password fingerprint (a wrong password never hits) and rememberMe."""
+        return email.lower(), hashlib.sha256(password.encode("utf-8")).hexdigest(), remember_me
+
+
+# Shared by all UserFactory instances in the process
+token_cache = TokenCache()
+
+# Cached tokens stay valid in a forked child; locks and refresh threads do not
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=token_cache._after_fork)
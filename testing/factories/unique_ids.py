@@ -0,0 +1,85 @@
+"""
+Collision-free unique ID generator for test data names and emails.
+
+Snowflake-style IDs: run namespace, worker (xdist worker + PID), process
+start time and a per-process counter. The counter is an itertools.count,
+whose next() is atomic under the GIL, so IDs need no lock and stay unique
+across threads, xdist workers and forked children.
+
+IDs look like "<run>_<worker><pid>_<start ms>_<seq>" in lowercase hex, so
+everything a run created can be matched by its run namespace.
+"""
+
+import itertools
+import os
+import time
+import uuid
+from typing import Optional
+
+from .config import Config
+
+
+def default_run_id() -> str:
+    """
+    Run namespace shared by every process of a test run.
+
+    Uses Config.RUN_ID, else the pytest-xdist run UID (shared by all
+    workers), else a random ID.
+
+    Returns:
+        Run namespace string (8 hex chars unless set via Config.RUN_ID)
+    """
+    return (
+        Config.RUN_ID
+        or os.getenv("PYTEST_XDIST_TESTRUNUID", "")[:8]
+        or uuid.uuid4().hex[:8]
+    )
+
+
+class UniqueIdGenerator:
+    """Lock-free generator of IDs unique per run, worker and process."""
+
+    def __init__(self, run_id: Optional[str] = None, worker_id: Optional[str] = None):
+        """
+        Initialize UniqueIdGenerator.
+
+        Args:
+            run_id: Run namespace (default: default_run_id())
+            worker_id: Worker identifier (default: xdist worker name, if any)
+        """
+        self.run_id = run_id or default_run_id()
+        self.worker_id = worker_id if worker_id is not None else os.getenv("PYTEST_XDIST_WORKER", "")
+        self.join_run()
+
+    def next_id(self) -> str:
+        """Return the next unique ID."""
+        return f"{self._prefix}{next(self._counter):x}"
+
+    def join_run(self, run_id: Optional[str] = None) -> None:
+        """
+        Start a new sequence for the current process.
+
+        Run in a forked child, and in worker processes that must generate
+        IDs in their parent's run namespace.
+
+        Args:
+            run_id: Run namespace to generate IDs in (default: the current one)
+        """
+        if run_id:
+            self.run_id = run_id
+        start_ms = int(time.time() * 1000)
+        self._prefix = f"{self.run_id}_{self.worker_id}{os.getpid():x}_{start_ms:x}_"
+        self._counter = itertools.count()
+
+
+# Shared by all helpers in the process
+unique_ids = UniqueIdGenerator()
+
+# A forked child inherits the parent's counter; give it its own sequence
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=unique_ids.join_run)
+
+
+def next_unique_id() -> str:
+    """Return the next unique ID from the process-wide generator."""
+    return unique_ids.next_id()
@@ -5,18 +5,36 @@ Provides methods to create users with different roles, login, and manage OTPs.
 """
 
 import logging
-from typing import Optional, Dict, Any
+import time
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Union, Iterator, Callable
+
+import requests
 
 from .base_factory import BaseFactory
 from .config import Config
+from .token_cache import token_cache
+from .cleanup_ledger import cleanup_ledger
 from .helpers import (
     generate_unique_email,
     generate_valid_password,
-    validate_object_id
+    validate_object_id,
+    summarize_latencies
 )
 
 logger = logging.getLogger(__name__)
 
+# Signup state machine steps, in order
+SIGNUP_STEPS = ("request_otp", "get_otp", "verify_otp", "signup")
+
+
+@contextmanager
+def _timed_step(timings: Dict[str, float], step: str) -> Iterator[None]:
+    """Record duration of a signup step in timings (only if it succeeds)."""
+    start = time.perf_counter()
+    yield
+    timings[step] = time.perf_counter() - start
+
 
 class UserFactory(BaseFactory):
     """Factory for creating and managing test users."""
@@ -56,6 +74,18 @@ class UserFactory(BaseFactory):
             requests.HTTPError: If signup fails
             ValueError: If response is invalid
         """
+        return self._create_user(first_name, last_name, email, password, role, timings={})
+    
+    def _create_user(
+        self,
+        first_name: str,
+        last_name: str,
+        email: Optional[str],
+        password: Optional[str],
+        role: str,
+        timings: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Run the signup state machine, recording per-step latency in timings."""
         # Generate unique email if not provided
         if email is None:
             email = generate_unique_email()
@@ -71,34 +101,37 @@ class UserFactory(BaseFactory):
         logger.info(f"Creating user: {email} with role: {role}")
         
         # Step 1: Request OTP
-        otp_response = self.post(
-            "/auth/signup/request-otp",
-            json_data={"email": email}
-        )
-        
-        if otp_response.status_code != 200:
-            raise ValueError(f"Failed to request OTP: {otp_response.text}")
-        
-        otp_data = otp_response.json()
+        with _timed_step(timings, "request_otp"):
+            otp_response = self.post(
+                "/auth/signup/request-otp",
+                json_data={"email": email}
+            )
+            
+            if otp_response.status_code != 200:
+                raise ValueError(f"Failed to request OTP: {otp_response.text}")
+            
+            otp_data = otp_response.json()
         
         # Step 2: Get OTP from internal endpoint (for automation)
-        try:
-            otp = self._get_otp_from_internal(email)
-        except Exception as e:
-            logger.warning(f"Could not get OTP from internal endpoint: {e}")
-            # In development mode, OTP might be in response
-            otp = otp_data.get("otp")
-            if not otp:
-                raise ValueError("Could not retrieve OTP for signup")
+        with _timed_step(timings, "get_otp"):
+            try:
+                otp = self._get_otp_from_internal(email)
+            except Exception as e:
+                logger.warning(f"Could not get OTP from internal endpoint: {e}")
+                # In development mode, OTP might be in response
+                otp = otp_data.get("otp")
+                if not otp:
+                    raise ValueError("Could not retrieve OTP for signup")
         
         # Step 3: Verify OTP
-        verify_response = self.post(
-            "/auth/signup/verify-otp",
-            json_data={"email": email, "otp": otp}
-        )
-        
-        if verify_response.status_code != 200:
-            raise ValueError(f"Failed to verify OTP: {verify_response.text}")
+        with _timed_step(timings, "verify_otp"):
+            verify_response = self.post(
+                "/auth/signup/verify-otp",
+                json_data={"email": email, "otp": otp}
+            )
+            
+            if verify_response.status_code != 200:
+                raise ValueError(f"Failed to verify OTP: {verify_response.text}")
         
         # Step 4: Signup
         signup_data = {
@@ -110,20 +143,143 @@ class UserFactory(BaseFactory):
             "role": role
         }
         
-        signup_response = self.post("/auth/signup", json_data=signup_data)
-        
-        if signup_response.status_code != 201:
-            raise ValueError(f"Failed to create user: {signup_response.text}")
-        
-        signup_result = signup_response.json()
+        with _timed_step(timings, "signup"):
+            existing: Dict[str, Any] = {}
+            try:
+                signup_response = self.post(
+                    "/auth/signup",
+                    json_data=signup_data,
+                    safe_to_retry=self._not_yet_signed_up(email, password, existing)
+                )
+            except requests.RequestException:
+                if not existing:
+                    raise
+                # The failed attempt was applied; the account exists
+                logger.warning(f"Signup request failed after creating user {email}; using it")
+                signup_result = existing
+            else:
+                if signup_response.status_code != 201:
+                    raise ValueError(f"Failed to create user: {signup_response.text}")
+                
+                signup_result = signup_response.json()
         user_data = signup_result.get("user", {})
         
         # Add password to user data for later use
         user_data["password"] = password
         
+        if user_data.get("_id"):
+            cleanup_ledger.record("user", user_data["_id"])
+        
         logger.info(f"User created successfully: {user_data.get('_id')}")
         return user_data
     
+    def create_users(
+        self,
+        n: int,
+        role_mix: Union[str, Dict[str, float]] = "EDITOR",
+        workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Create many users concurrently.
+        
+        Runs the request-otp -> internal OTP -> verify-otp -> signup sequence
+        for up to `workers` emails at a time. A failed user is reported and
+        does not abort the rest of the batch.
+        
+        Args:
+            n: Number of users to create
+            role_mix: Single role, or mapping of role to weight,
+                      e.g. {"EDITOR": 0.8, "VIEWER": 0.15, "ADMIN": 0.05}
+            workers: Max concurrent signups (default: Config.USER_PROVISION_WORKERS)
+            
+        Returns:
+            Dictionary with results:
+            {
+                "users": [user dict or None, ...],  # in submission order
+                "failures": [{"index", "email", "role", "step", "error"}],
+                "latency": {step: {"count", "avg", "p50", "p95", "p99", "max"}},
+                "elapsed": seconds
+            }
+        """
+        roles = self._expand_role_mix(n, role_mix)
+        emails = [generate_unique_email() for _ in range(n)]
+        workers = workers or Config.USER_PROVISION_WORKERS
+        
+        def provision(index: int) -> Dict[str, Any]:
+            timings: Dict[str, float] = {}
+            try:
+                user = self._create_user(
+                    "Test", "User", emails[index], None, roles[index], timings
+                )
+                return {"user": user, "timings": timings}
+            except Exception as e:
+                step = next(name for name in SIGNUP_STEPS if name not in timings)
+                return {
+                    "user": None,
+                    "timings": timings,
+                    "failure": {
+                        "index": index,
+                        "email": emails[index],
+                        "role": roles[index],
+                        "step": step,
+                        "error": str(e)
+                    }
+                }
+        
+        logger.info(f"Creating {n} users with {workers} workers")
+        start = time.perf_counter()
+        
+        # Worker threads get their own sessions over the shared connection pool
+        outcomes = self.map_concurrent(provision, range(n), workers)
+        
+        elapsed = time.perf_counter() - start
+        
+        samples: Dict[str, List[float]] = {step: [] for step in SIGNUP_STEPS}
+        for outcome in outcomes:
+            for step, duration in outcome["timings"].items():
+                samples[step].append(duration)
+        
+        failures = [outcome["failure"] for outcome in outcomes if outcome["user"] is None]
+        
+        logger.info(
+            f"Created {n - len(failures)}/{n} users in {elapsed:.2f}s "
+            f"({len(failures)} failed)"
+        )
+        
+        return {
+            "users": [outcome["user"] for outcome in outcomes],
+            "failures": failures,
+            "latency": {step: summarize_latencies(values) for step, values in samples.items()},
+            "elapsed": elapsed
+        }
+    
+    @staticmethod
+    def _expand_role_mix(n: int, role_mix: Union[str, Dict[str, float]]) -> List[str]:
+        """Turn a role or role->weight mapping into a list of n roles."""
+        if isinstance(role_mix, str):
+            role_mix = {role_mix: 1.0}
+        
+        for role in role_mix:
+            if role not in ["ADMIN", "EDITOR", "VIEWER"]:
+                raise ValueError(f"Invalid role: {role}. Must be ADMIN, EDITOR, or VIEWER")
+        
+        total_weight = sum(role_mix.values())
+        if total_weight <= 0:
+            raise ValueError("role_mix weights must sum to a positive number")
+        
+        # Interleave roles so any prefix of the list follows the mix
+        roles = []
+        assigned = {role: 0 for role in role_mix}
+        for i in range(n):
+            role = max(
+                role_mix,
+                key=lambda r: role_mix[r] / total_weight * (i + 1) - assigned[r]
+            )
+            assigned[role] += 1
+            roles.append(role)
+        
+        return roles
+    
     def create_admin(
         self,
         first_name: str = "Admin",
@@ -209,15 +365,23 @@ class UserFactory(BaseFactory):
         self,
         email: str,
         password: str,
-        remember_me: bool = False
+        remember_me: bool = False,
+        use_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Login user and get access token.
         
+        With use_cache=True, results are cached process-wide until shortly
+        before the token's exp claim, and concurrent logins for the same
+        account share one request. The fixtures and user pool opt in; by
+        default every call hits /auth/login, so tests of login and logout
+        get fresh tokens.
+        
         Args:
             email: User's email
             password: User's password
             remember_me: Whether to remember user (default: False)
+            use_cache: Whether to use the token cache (default: False)
             
         Returns:
             Dictionary with token and user data:
@@ -230,6 +394,55 @@ class UserFactory(BaseFactory):
             requests.HTTPError: If login fails
             ValueError: If response is invalid
         """
+        if use_cache and Config.TOKEN_CACHE_ENABLED:
+            return token_cache.get_or_login(
+                email,
+                password,
+                lambda: self._login_request(email, password, remember_me),
+                remember_me=remember_me
+            )
+        
+        return self._login_request(email, password, remember_me)
+    
+    def logout(self, token: str) -> None:
+        """
+        Log out via /auth/logout and drop the token from the token cache.
+        
+        Args:
+            token: JWT access token
+            
+        Raises:
+            requests.HTTPError: If logout fails
+            ValueError: If response is invalid
+        """
+        token_cache.invalidate(token=token)
+        response = self.post("/auth/logout", headers=Config.get_auth_headers(token))
+        self._handle_response(response, expected_status=200)
+    
+    def _not_yet_signed_up(self, email: str, password: str, existing: Dict[str, Any]) -> Callable[[], bool]:
+        """
+        Build the safe_to_retry check for a signup request.
+        
+        The check passes when the credentials cannot log in yet; if they
+        can, the login response (with "user") is stored in existing.
+        """
+        def check() -> bool:
+            response = self._make_request(
+                "POST",
+                "/auth/login",
+                json_data={"email": email, "password": password},
+                raise_for_status=False,
+                safe_to_retry=True
+            )
+            if response.status_code == 200:
+                existing.update(response.json())
+                return False
+            return response.status_code == 401
+        
+        return check
+    
+    def _login_request(self, email: str, password: str, remember_me: bool) -> Dict[str, Any]:
+        """Call /auth/login and return token and user data."""
         logger.info(f"Logging in user: {email}")
         
         login_data = {
@@ -238,7 +451,7 @@ class UserFactory(BaseFactory):
             "rememberMe": remember_me
         }
         
-        response = self.post("/auth/login", json_data=login_data)
+        response = self.post("/auth/login", json_data=login_data, safe_to_retry=True)
         
         if response.status_code != 200:
             raise ValueError(f"Login failed: {response.text}")
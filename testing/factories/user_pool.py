@@ -0,0 +1,206 @@
+"""
+User pool for reusing test accounts across tests.
+
+Creating a user costs four requests (request-otp, internal OTP, verify-otp,
+signup) plus a login. The pool keeps logged-in accounts per role, wipes
+their data with CleanupFactory.cleanup_user_data on release (the user
+record is preserved) and hands them out again. With a CleanupQueue the
+wipe runs in the background and the account rejoins the pool once done.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Iterable, Iterator
+
+from .config import Config
+from .user_factory import UserFactory
+from .cleanup_factory import CleanupFactory
+from .cleanup_queue import CleanupQueue
+
+logger = logging.getLogger(__name__)
+
+ROLES = ("ADMIN", "EDITOR", "VIEWER")
+
+
+class UserPool:
+    """Pool of pre-created, logged-in test users per role."""
+
+    def __init__(
+        self,
+        user_factory: Optional[UserFactory] = None,
+        cleanup_factory: Optional[CleanupFactory] = None,
+        size_per_role: Optional[int] = None,
+        cleanup_queue: Optional[CleanupQueue] = None
+    ):
+        """
+        Initialize UserPool.
+
+        Args:
+            user_factory: UserFactory for signup/login (default: new instance)
+            cleanup_factory: CleanupFactory for release cleanup (default: new instance)
+            size_per_role: Accounts created per role by warm()
+                           (default: Config.USER_POOL_SIZE)
+            cleanup_queue: Optional CleanupQueue; when set, release() returns
+                           immediately and cleanup runs in the background
+        """
+        self._owns_user_factory = user_factory is None
+        self._owns_cleanup_factory = cleanup_factory is None
+        self.user_factory = user_factory or UserFactory()
+        self.cleanup_factory = cleanup_factory or CleanupFactory()
+        self.size_per_role = Config.USER_POOL_SIZE if size_per_role is None else size_per_role
+        self.cleanup_queue = cleanup_queue
+
+        self._available: Dict[str, List[Dict[str, Any]]] = {role: [] for role in ROLES}
+        self._lock = threading.Lock()
+
+    def warm(self, roles: Optional[Iterable[str]] = None) -> None:
+        """
+        Pre-create accounts until each role has size_per_role available.
+
+        Args:
+            roles: Roles to warm (default: ADMIN, EDITOR, VIEWER)
+        """
+        for role in roles or ROLES:
+            role = self._validate_role(role)
+            with self._lock:
+                missing = self.size_per_role - len(self._available[role])
+            for _ in range(max(missing, 0)):
+                user_data = self._create(role)
+                with self._lock:
+                    self._available[role].append(user_data)
+
+        logger.info(f"User pool warmed: {self.stats()}")
+
+    def acquire(self, role: str = "EDITOR") -> Dict[str, Any]:
+        """
+        Take a user from the pool, creating one if none is available.
+
+        Args:
+            role: User role - ADMIN, EDITOR, or VIEWER (default: "EDITOR")
+
+        Returns:
+            Dictionary with user data and token (same shape as test_user fixture):
+            {
+                "user": {...},
+                "token": "JWT token",
+                "email": "...",
+                "password": "...",
+                "_id": "..."
+            }
+        """
+        role = self._validate_role(role)
+
+        with self._lock:
+            user_data = self._available[role].pop() if self._available[role] else None
+
+        if user_data is None:
+            return self._create(role)
+
+        # Served from the token cache unless the token is close to expiry
+        self._login(user_data)
+
+        return user_data
+
+    def release(self, user_data: Dict[str, Any]) -> None:
+        """
+        Wipe the user's data and return the account to the pool.
+
+        If cleanup fails the account is dropped instead of being reused.
+
+        Args:
+            user_data: Dictionary returned by acquire()
+        """
+        if self.cleanup_queue is not None:
+            future = self.cleanup_queue.enqueue_user_data(user_data["_id"])
+            future.add_done_callback(
+                lambda f: self._return(user_data) if not f.cancelled() and f.exception() is None else None
+            )
+            return
+
+        try:
+            self.cleanup_factory.cleanup_user_data(user_data["_id"])
+        except Exception as e:
+            logger.warning(f"Dropping pooled user {user_data['_id']}, cleanup failed: {e}")
+            return
+
+        self._return(user_data)
+
+    def discard(self, user_data: Dict[str, Any]) -> None:
+        """
+        Clean up a user without returning it to the pool.
+
+        Use when a test changed the account itself (role, password, lockout).
+
+        Args:
+            user_data: Dictionary returned by acquire()
+        """
+        if self.cleanup_queue is not None:
+            self.cleanup_queue.enqueue_user_data(user_data["_id"])
+            return
+
+        try:
+            self.cleanup_factory.cleanup_user_data(user_data["_id"])
+        except Exception as e:
+            logger.warning(f"Failed to cleanup discarded user {user_data['_id']}: {e}")
+
+    @contextmanager
+    def lease(self, role: str = "EDITOR") -> Iterator[Dict[str, Any]]:
+        """
+        Context manager that acquires a user and releases it on exit.
+
+        Usage:
+            with pool.lease("ADMIN") as admin:
+                ...
+        """
+        user_data = self.acquire(role)
+        try:
+            yield user_data
+        finally:
+            self.release(user_data)
+
+    def stats(self) -> Dict[str, int]:
+        """Return number of available accounts per role."""
+        with self._lock:
+            return {role: len(users) for role, users in self._available.items()}
+
+    def close(self) -> None:
+        """Close factories created by the pool."""
+        if self._owns_user_factory:
+            self.user_factory.close()
+        if self._owns_cleanup_factory:
+            self.cleanup_factory.close()
+
+    def _return(self, user_data: Dict[str, Any]) -> None:
+        """Put a cleaned-up account back into the available list."""
+        role = user_data["user"].get("role", "EDITOR")
+        with self._lock:
+            self._available[role].append(user_data)
+
+    def _create(self, role: str) -> Dict[str, Any]:
+        """Create and log in a new user for the pool."""
+        user = self.user_factory.create_user(role=role)
+        user.setdefault("role", role)
+
+        user_data = {
+            "user": user,
+            "token": None,
+            "email": user["email"],
+            "password": user["password"],
+            "_id": user["_id"]
+        }
+        self._login(user_data)
+
+        return user_data
+
+    def _login(self, user_data: Dict[str, Any]) -> None:
+        """Refresh the token stored in user_data."""
+        login_result = self.user_factory.login(user_data["email"], user_data["password"], use_cache=True)
+        user_data["token"] = login_result["token"]
+
+    @staticmethod
+    def _validate_role(role: str) -> str:
+        role = role.upper()
+        if role not in ROLES:
+            raise ValueError(f"Invalid role: {role}. Must be ADMIN, EDITOR, or VIEWER")
+        return role